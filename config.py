@@ -8,10 +8,32 @@ DEFAULT_CELL_SIZE = 126
 # Zoom levels
 ZOOM_LEVELS = [5, 7, 11, 21, 51, DEFAULT_BOARD_SIZE]
 DEFAULT_ZOOM_INDEX = 0
+ZOOM_TRANSITION_MS = 250  # Duración de la animación entre niveles de zoom (0 = cambio instantáneo)
 
 # Rendering
 FIXED_WINDOW_SIZE = DEFAULT_VIEW_SIZE * DEFAULT_CELL_SIZE  # 630x630 pixels
 
+# Texture cache
+TEXTURE_CACHE_BUDGET_BYTES = 48 * 1024 * 1024  # Memoria máxima de texturas horneadas
+TEXTURE_CACHE_MAX_VARIANTS = 2  # Variantes de brillo por celda (p. ej. antorchas on/off)
+PALETTIZED_TILES = False  # Texturas de 8 bits iluminadas con set_palette (requiere numpy)
+MIPMAPPED_TILES = True  # Texturas horneadas a DEFAULT_CELL_SIZE y reducidas (smoothscale) para cada zoom
+GRADIENT_CACHE_BUDGET_BYTES = 4 * 1024 * 1024  # Degradados de conexiones y luz que entra en celdas
+STONE_ATLAS_BUDGET_BYTES = 4 * 1024 * 1024  # Piedras presombreadas de las paredes (por zoom y brillo)
+DECAL_CACHE_BUDGET_BYTES = 8 * 1024 * 1024  # Manchas de sangre por celda y fotogramas de charcos
+PARTICLE_CAPACITY = 1024  # Partículas vivas a la vez (arrays preasignados)
+PARTICLE_GLYPH_BUDGET_BYTES = 4 * 1024 * 1024  # Glifos de partículas por zoom y alfa
+FLIPBOOK_CACHE_BUDGET_BYTES = 2 * 1024 * 1024  # Fotogramas de antorchas, fuente y escaleras
+WARRIOR_SPRITE_BUDGET_BYTES = 2 * 1024 * 1024  # Poses del guerrero por tamaño (y caída ya girada)
+DEEP_ONE_SPRITE_BUDGET_BYTES = 4 * 1024 * 1024  # Fotogramas de los Profundos por zoom (y muertos girados)
+TEXT_CACHE_BUDGET_BYTES = 2 * 1024 * 1024  # Textos de subtítulos, diálogos, título y panel de debug
+DANGER_VIGNETTE = False  # Tinte de peligro en viñeta (más rojo en los bordes, requiere numpy)
+
+# Level of detail (tamaño de celda en píxeles; ver rendering/lod.py)
+LOD_FLAT_MAX_CELL_SIZE = 12  # Hasta aquí: bloques de color con muñones de salida
+LOD_SIMPLE_MAX_CELL_SIZE = 30  # Hasta aquí: líneas rectas y sin telarañas
+OVERVIEW_MAX_VARIANTS = 4  # Vistas del tablero completo guardadas (luz on/off x zooms planos)
+
 # Colors
 COLOR_BLACK = (0, 0, 0)
 COLOR_WHITE = (255, 255, 255)
@@ -25,6 +47,10 @@ BASE_BRIGHTNESS_LINES_ENTRANCE = 50
 BASE_BRIGHTNESS_LINES_EXIT = 0
 MAX_TORCH_BRIGHTNESS = 130
 TORCH_BRIGHTNESS_PER_UNIT = 31
+# Brillo de referencia con el que se hornean las texturas (albedo); la luz
+# real se aplica después como desplazamiento saturado sobre esos valores
+ALBEDO_FLOOR_BRIGHTNESS = 20
+ALBEDO_WALL_BRIGHTNESS = 95
 
 # Blood and effects
 BLOOD_DARKENING_FACTOR = 0.5  # 50% del gradiente
@@ -4,6 +4,7 @@ import math
 import sys
 import os
 import asyncio
+from array import array
 from enum import Enum
 from dataclasses import dataclass
 
@@ -11,8 +12,25 @@ from dataclasses import dataclass
 from services.lighting_system import LightingSystem
 from services.audio_manager import AudioManager
 from models.cell import Cell, CellType, Direction
+from config import (TEXTURE_CACHE_BUDGET_BYTES, TEXTURE_CACHE_MAX_VARIANTS, PALETTIZED_TILES,
+                    OVERVIEW_MAX_VARIANTS, GRADIENT_CACHE_BUDGET_BYTES, WARRIOR_SPRITE_BUDGET_BYTES,
+                    DEEP_ONE_SPRITE_BUDGET_BYTES, TEXT_CACHE_BUDGET_BYTES,
+                    DANGER_VIGNETTE, MIPMAPPED_TILES, ZOOM_TRANSITION_MS)
 from rendering.decorations import DecorationRenderer
 from rendering.effects import EffectsRenderer
+from rendering.texture_cache import TextureCache
+from rendering.cell_tiles import CellTileCache
+from rendering.gradients import GradientStripCache
+from rendering.viewport import ViewportLayer
+from rendering import compositor, lod
+from rendering.lod import FlatCellRenderer
+from rendering.overview import OverviewSurface
+from rendering.warrior import WarriorSprites, walk_offsets
+from rendering.deep_one import DeepOneSprites, breath_offset, roar_pose, walk_offset
+from rendering.text_cache import TextCache
+from rendering.screen_effects import ScreenEffects
+from rendering.geometry import DELTAS, DIRECTIONS, OPPOSITES, geometry_for
+from rendering.zoom_transition import ZoomTransition
 from game.input_handler import InputHandler
 
 # Constantes de configuración
@@ -161,7 +179,14 @@ class DungeonBoard:
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Dungeon 2D")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 24)
+        # Textos de la interfaz ya renderizados (y fuentes creadas una sola vez)
+        self.text_cache = TextCache(TEXT_CACHE_BUDGET_BYTES)
+        # Capas preasignadas de los efectos de pantalla (peligro, flash, oscurecidos)
+        self.screen_effects = ScreenEffects(self.width, self.height, vignette=DANGER_VIGNETTE)
+        # Animación entre niveles de zoom (escala una captura de la vista amplia)
+        self.zoom_transition = ZoomTransition(ZOOM_TRANSITION_MS)
+        self._zoom_anchor = (0.0, 0.0)
+        self.font = self.text_cache.font(24)
         
         # Obtener directorio del script para rutas relativas
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -171,15 +196,70 @@ class DungeonBoard:
         self.decorations = DecorationRenderer(self.screen, self.cell_size)
         self.effects = EffectsRenderer(self.screen, self.cell_size)
         self.audio = AudioManager()
+        # Los subtítulos se parten en líneas al encolarlos, no en cada frame
+        self.audio.subtitle_listener = self.subtitle_lines
+
+        # Rejillas precalculadas de iluminación (antorchas, sangre y brillo por
+        # celda): la parte estática de count_torches/has_blood_stains se calcula
+        # una sola vez; los modificadores dinámicos van por la época de iluminación.
+        self.build_lighting_grids()
 
         # Cache de texturas de suelo+paredes por celda: el patrón (piedras/ruido)
-        # es siempre el mismo (semilla = posición), así que solo hace falta
-        # volver a dibujarlo si cambian las salidas o el brillo real (antorchas/
-        # distancia), no en cada frame. Mismo dibujado vectorial de siempre,
-        # simplemente cacheado en vez de redibujado ~60 veces por segundo.
-        # Clave: (row, col, cell_size, floor_brightness, wall_brightness) ->
-        # (exits congelados, cell_type, Surface horneada)
-        self._cell_texture_cache = {}
+        # es siempre el mismo (semilla = posición), así que se hornea una sola
+        # vez sin iluminar (albedo) y el brillo real (antorchas/distancia) se
+        # aplica con una pasada de luz; cambiar de brillo ya no redibuja nada.
+        # LRU con presupuesto en bytes (config.py): cada celda conserva solo sus
+        # últimas variantes de brillo, así la memoria no crece con la partida.
+        self._cell_texture_cache = TextureCache(TEXTURE_CACHE_BUDGET_BYTES, TEXTURE_CACHE_MAX_VARIANTS)
+        # Con mipmaps las texturas se hornean a DEFAULT_CELL_SIZE y se reducen para cada zoom
+        self.cell_tiles = CellTileCache(self.effects, self.lighting, self._cell_texture_cache,
+                                        palettized=PALETTIZED_TILES,
+                                        base_size=DEFAULT_CELL_SIZE if MIPMAPPED_TILES else None)
+        # Degradados de las conexiones entre celdas: un blit por conexión
+        self.gradients = GradientStripCache(GRADIENT_CACHE_BUDGET_BYTES)
+        # Fotogramas del guerrero (jugador) por tamaño y pose: un blit por frame
+        self.warrior_sprites = WarriorSprites(WARRIOR_SPRITE_BUDGET_BYTES)
+        # Hoja de fotogramas de los Profundos por zoom (vivos, rugiendo, alerta y muertos)
+        self.deep_one_sprites = DeepOneSprites(DEEP_ONE_SPRITE_BUDGET_BYTES)
+
+        # Capa estática del viewport: suelo, paredes, líneas y decoración fija
+        # se reutilizan entre frames (scroll + tiras nuevas); encima se dibujan
+        # solo los elementos animados (antorchas, fuente, polvo, huellas)
+        self.viewport = ViewportLayer((self.width, self.height))
+        self._static_scratch = None
+        # Zooms lejanos (celdas diminutas): bloques de color en vez de celdas
+        # completas, sobre una vista del tablero entero que se mantiene por celdas
+        self.flat_cells = FlatCellRenderer()
+        self.overview = OverviewSurface(self.size, OVERVIEW_MAX_VARIANTS)
+        self._overview_sword_cell = None
+        self._synced_visited_cells = set()
+        # Celdas visitadas con algo animado (antorchas o la fuente)
+        self._animated_cells = set()
+        # Celdas sin visitar a las que llega luz de una vecina visitada del
+        # camino principal -> dirección por la que entra (light_spill_direction)
+        self._lit_frontier = {}
+        self._frontier_visited_cells = set()
+
+        # Pila de capas del frame: solo la interfaz se cachea (lista de blits
+        # que se reconstruye cuando cambia su contenido); el terreno se cachea
+        # en la capa del viewport y el resto se anima en cada frame. Cada capa
+        # informa de lo que ha cambiado para enviar a pantalla solo eso
+        self.compositor = compositor.Compositor()
+        self.compositor.set_layer(compositor.TERRAIN, draw=self.draw_terrain)
+        self.compositor.set_layer(compositor.DECALS, draw=lambda target: self.draw_decals(self._frame_origin),
+                                  animated=True)
+        self.compositor.set_layer(compositor.DECORATIONS,
+                                  draw=lambda target: self.draw_animated_cells(self._frame_origin),
+                                  animated=True)
+        self.compositor.set_layer(compositor.ENTITIES, draw=lambda target: self.draw_entities(*self._frame_offset),
+                                  animated=True)
+        self.compositor.set_layer(compositor.EFFECTS, draw=lambda target: self.draw_screen_effects(),
+                                  animated=True)
+        self.compositor.set_layer(compositor.UI, build=self.build_ui_blits, key=self.ui_state_key)
+        self._frame_origin = (0, 0)
+        self._frame_offset = (0.0, 0.0)
+        # Fuerza un flip completo (ventana expuesta, vuelta del título)
+        self._full_display_update = True
 
         self.was_active = False
                     
@@ -391,6 +471,8 @@ class DungeonBoard:
         
         # Monstruos (Profundos)
         self.deep_ones = []  # Lista de objetos DeepOne
+        self._monster_order = []  # Orden de dibujo (ver monster_draw_order)
+        self._monster_order_key = None
         self.deep_ones_spawned = False
         self.monster_footprints = {}  # Diccionario {(row, col): [lista_huellas]}
         self.has_encountered_monsters = False  # Flag para saber si ha chocado con monstruos
@@ -399,8 +481,8 @@ class DungeonBoard:
         self.sword_thought_triggered = False  # Flag para pensamiento de espada
         self.sword_music_started = False  # Flag para música de espada
         
-        # Barrier effects
-        self.active_barriers = []
+        # Barreras mágicas y demás efectos de partículas (en arrays)
+        self.particles = self.decorations.particles
         
         # Cargar imagen de losa (salida)
         try:
@@ -514,60 +596,16 @@ class DungeonBoard:
     
     def trigger_barrier_effect(self, row, col):
         """Activa el efecto visual de barrera en una celda."""
-        current_time = pygame.time.get_ticks()
-        # Check if barrier already active for this cell to avoid spam/overlap
-        for barrier in self.active_barriers:
-            if barrier['row'] == row and barrier['col'] == col:
-                barrier['start_time'] = current_time # Refresh
-                return
-        
-        self.active_barriers.append({
-            'row': row,
-            'col': col,
-            'start_time': current_time,
-            'duration': 800  # 800ms duration
-        })
+        # Si ya hay una barrera en la celda se reinicia (evita solaparlas)
+        self.particles.spawn('barrier', col, row, pygame.time.get_ticks(), life=800, alpha=180, restart=True)
 
-    def draw_barriers(self, offset_row_float, offset_col_float):
-        """Dibuja los efectos de barrera mágica activos."""
+    def draw_particles(self, offset_row_float, offset_col_float):
+        """Dibuja las partículas activas (barreras mágicas) con un solo blits."""
         current_time = pygame.time.get_ticks()
-        # Filter expired
-        self.active_barriers = [b for b in self.active_barriers if current_time - b['start_time'] < b['duration']]
-        
-        for barrier in self.active_barriers:
-            row, col = barrier['row'], barrier['col']
-            
-            # Calculate screen position
-            view_row = row - offset_row_float
-            view_col = col - offset_col_float
-            
-            # Draw if visible
-            if -1 <= view_row <= self.view_size and -1 <= view_col <= self.view_size:
-                x = int(view_col * self.cell_size)
-                y = int(view_row * self.cell_size)
-                
-                elapsed = current_time - barrier['start_time']
-                progress = elapsed / barrier['duration']
-                
-                # Alpha fades out
-                alpha = int(180 * (1.0 - progress))
-                
-                s = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-                
-                # Force field effect: concentric squares/circles or static
-                color = (100, 200, 255, alpha)
-                
-                # Border
-                pygame.draw.rect(s, color, (0, 0, self.cell_size, self.cell_size), 4)
-                
-                # Diagonal lines (X)
-                pygame.draw.line(s, color, (0, 0), (self.cell_size, self.cell_size), 3)
-                pygame.draw.line(s, color, (self.cell_size, 0), (0, self.cell_size), 3)
-                
-                # Inner glow
-                s.fill((100, 200, 255, int(alpha * 0.3)), special_flags=pygame.BLEND_RGBA_ADD)
-                
-                self.screen.blit(s, (x, y))
+        self.particles.update(current_time)
+        self.screen.blits(self.particles.blits(current_time, self.cell_size,
+                                               (offset_col_float, offset_row_float), self.view_size),
+                          doreturn=False)
 
     def take_damage(self):
         """Maneja el daño al jugador."""
@@ -1181,18 +1219,17 @@ class DungeonBoard:
             else:
                 # Si no se pudo cargar la imagen, mostrar texto
                 self.screen.fill((0, 0, 0))
-                title_font = pygame.font.Font(None, 72)
-                subtitle_font = pygame.font.Font(None, 36)
-                title_text = title_font.render("DUNGEON GAME", True, (255, 215, 0))
-                subtitle_text = subtitle_font.render("Press any key to start", True, (200, 200, 200))
+                title_text = self.text_cache.render("DUNGEON GAME", 72, (255, 215, 0))
+                subtitle_text = self.text_cache.render("Press any key to start", 36, (200, 200, 200))
                 self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, self.height // 2 - 50))
                 self.screen.blit(subtitle_text, (self.width // 2 - subtitle_text.get_width() // 2, self.height // 2 + 30))
             pygame.display.flip()
+            self._full_display_update = True
             return
         
-        # Rellenar fondo negro (para que coincida con celdas EMPTY/no visitadas)
-        self.screen.fill((0, 0, 0))
-        
+        # Modificadores dinámicos de la luz para este frame
+        self.update_lighting_epoch()
+
         # Primero: actualizar el viewport (mueve la cámara)
         offset_row_float, offset_col_float = self.get_view_offset()
         
@@ -1217,19 +1254,54 @@ class DungeonBoard:
         pixel_offset_y = int((offset_row_float - offset_row_int) * self.cell_size)
         pixel_offset_x = int((offset_col_float - offset_col_int) * self.cell_size)
         
-        # Dibujar una celda extra en cada dirección para scroll suave
-        for row in range(-1, self.view_size + 1):
-            for col in range(-1, self.view_size + 1):
-                board_row = offset_row_int + row
-                board_col = offset_col_int + col
-                if 0 <= board_row < self.size and 0 <= board_col < self.size:
-                    # Ajustar la posición de dibujo con el offset de píxeles
-                    view_row = row
-                    view_col = col
-                    self.draw_cell(board_row, board_col, view_row, view_col, pixel_offset_x, pixel_offset_y)
+        # Estado del frame que usan las capas
+        self._frame_offset = (offset_row_float, offset_col_float)
+        self._frame_origin = (offset_col_int * self.cell_size + pixel_offset_x,
+                              offset_row_int * self.cell_size + pixel_offset_y)
+
+        # Cambio de zoom animado: la captura escalada sustituye al mundo y
+        # encima van la interfaz y los efectos
+        if self.zoom_transition.active:
+            current_time = pygame.time.get_ticks()
+            if self.zoom_transition.pending:
+                # Al alejarse la vista amplia es la nueva: se dibuja una vez
+                self.compositor.compose(self.screen, compositor.SCENE_LAYERS)
+                self.zoom_transition.capture(self.screen, self.player_anchor(), self._zoom_anchor, current_time)
+            self._full_display_update = True
+            if self.zoom_transition.draw(self.screen, current_time):
+                self.compositor.compose(self.screen, compositor.OVERLAY_LAYERS)
+                pygame.display.flip()
+                return
+
+        dirty = self.compositor.compose(self.screen)
+
+        # Con la cámara quieta solo se envía a pantalla lo que ha cambiado;
+        # si se ha desplazado (o no se sabe) se envía el frame entero
+        if dirty is None or self._full_display_update:
+            self._full_display_update = False
+            pygame.display.flip()
+        elif dirty:
+            bounds = self.screen.get_rect()
+            pygame.display.update([rect.clip(bounds) for rect in dirty])
+    
+    def draw_terrain(self, target):
+        """Capa de terreno: la capa estática del viewport al día con la cámara.
+
+        Se desplaza con la cámara y solo se redibujan las tiras nuevas y las
+        celdas que han cambiado (que son lo que devuelve)."""
+        self._sync_visited_cells()
+        signature = (self.cell_size, self.lighting.epoch, self.show_path,
+                     self.lighting.lines_darkening_enabled)
+        dirty = self.viewport.update(self._frame_origin, signature, self.cell_size, self.draw_static_region)
+        target.blit(self.viewport.surface, (0, 0))
+        return dirty
+
+    def draw_entities(self, offset_row_float, offset_col_float):
+        """Capa de entidades: barreras, jugador, monstruos, murciélago y losa."""
+        dirty = self.entity_dirty_rects(offset_row_float, offset_col_float)
 
         # Dibujar barreras mágicas
-        self.draw_barriers(offset_row_float, offset_col_float)
+        self.draw_particles(offset_row_float, offset_col_float)
         
         if self.showing_game_over:
             # Si el jugador está muerto, dibujarlo antes que los monstruos (para que lo tapen)
@@ -1243,103 +1315,166 @@ class DungeonBoard:
         # Dibujar murciélago volando si la animación está activa
         self.draw_flying_bat(offset_row_float, offset_col_float)
 
-        # Cuarto: dibujar la losa de salida por encima del jugador
+        # Dibujar la losa de salida por encima del jugador
         self.draw_exit_slab_overlay(offset_row_float, offset_col_float)
+        return dirty
+
+    def entity_dirty_rects(self, offset_row_float, offset_col_float):
+        """Zonas de pantalla donde se dibujan las entidades este frame.
+
+        Cada entidad ocupa su celda (y la de origen si se está moviendo) más
+        media celda de margen para sprites rotados, sangre y armas."""
+        size = self.cell_size
+        cells = [self.current_position]
+        if self.intro_anim_active:
+            # El guerrero cae desde la celda de arriba
+            cells.append((self.current_position[0] - 1, self.current_position[1]))
+        if self.player_animating:
+            cells.append(self.player_anim_from_pos)
+        if self.player_falling_active:
+            # Se aleja hasta 1.4 celdas del borde mientras cae
+            from_row, from_col = self.player_falling_from_pos
+            cells.extend((from_row + dr, from_col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+        for monster in self.deep_ones:
+            cells.append((monster.row, monster.col))
+            if monster.animating:
+                cells.append((monster.from_row, monster.from_col))
+        cells.extend((int(y), int(x)) for x, y in self.particles.positions())
+        if self.bat_flying_active:
+            cells.append((self.bat_flying_row, self.bat_flying_col))
+
+        margin = size // 2 + compositor.ANIMATED_OVERFLOW
+        span = size + 2 * margin
+        rects = []
+        for row, col in set(cells):
+            x = int((col - offset_col_float) * size) - margin
+            y = int((row - offset_row_float) * size) - margin
+            if x < self.width and y < self.height and x + span > 0 and y + span > 0:
+                rects.append(pygame.Rect(x, y, span, span))
+        return rects
+
+    def draw_screen_effects(self):
+        """Capa de efectos de pantalla: game over, peligro y flash.
+
+        Los tres cubren la pantalla entera: si se dibuja alguno devuelve None."""
+        drawn = False
+        # Pantalla de Game Over (la escala de grises parte de lo ya dibujado)
+        if self.showing_game_over:
+            self.draw_game_over()
+            drawn = True
         
+        # Dibujar overlay de peligro (salud baja o monstruos cerca)
+        if self.draw_danger_overlay():
+            drawn = True
+        
+        # Dibujar flash si está activo
+        if self.flash_active:
+            self.draw_screen_flash()
+            drawn = True
+        return None if drawn else []
+
+    def ui_state_key(self):
+        """Todo lo que decide el contenido de la capa de interfaz."""
+        image = self.audio.image_surface if self.audio.showing_image else None
+        return (
+            tuple(self.debug_info_lines()) if self.debug_mode else None,
+            self.audio.subtitle_text if self.audio.showing_subtitles else None,
+            image,
+            self.asking_exit_confirmation,
+            self.asking_main_menu_confirmation,
+        )
+
+    def build_ui_blits(self):
+        """Capa de interfaz como lista de blits (debug, subtítulos, imagen y diálogos)."""
+        blits = []
         # Debug: mostrar información de navegación solo si está activado
         if self.debug_mode:
-            self.draw_debug_info()
+            blits.extend(self.build_debug_info_blits())
         
-        # Dibujar subtítulos si están activos
-        self.draw_subtitles()
+        # Subtítulos si están activos
+        blits.extend(self.build_subtitle_blits())
         
-        # Dibujar imagen del pensamiento activo (si hay una)
+        # Imagen del pensamiento activo (si hay una), centrada en la pantalla
         if self.audio.showing_image and self.audio.image_surface:
-            # Centrar la imagen en la pantalla
             image_x = (self.width - self.audio.image_surface.get_width()) // 2
             image_y = (self.height - self.audio.image_surface.get_height()) // 2
-            self.screen.blit(self.audio.image_surface, (image_x, image_y))
+            blits.append((self.audio.image_surface, (image_x, image_y)))
         
-        # Mostrar diálogo de confirmación de salida si está activo (siempre encima de todo)
+        # Diálogos de confirmación (siempre encima de todo)
         if self.asking_exit_confirmation:
-            self.draw_exit_confirmation()
-        
-        # Mostrar diálogo de confirmación de menú principal si está activo
+            blits.extend(self.build_confirmation_blits("¿Salir del juego?", 48, 400))
         if self.asking_main_menu_confirmation:
-            self.draw_main_menu_confirmation()
-        
-        # Mostrar pantalla de Game Over si está activa (encima de todo)
-        if self.showing_game_over:
-            self.draw_game_over()
-        
-        # Dibujar overlay de peligro (salud baja o monstruos cerca)
-        self.draw_danger_overlay()
-        
-        # Dibujar flash si está activo
-        if self.flash_active:
-            self.draw_screen_flash()
-        
-        pygame.display.flip()
-    
+            blits.extend(self.build_confirmation_blits("¿Volver al menú principal?", 40, 450))
+        return blits
+
+    def monster_draw_order(self):
+        """Monstruos en orden de dibujo: muertos primero para que los vivos queden encima.
+
+        El orden solo se rehace cuando cambia la lista o muere alguno."""
+        key = (id(self.deep_ones), len(self.deep_ones), sum(1 for m in self.deep_ones if m.dead))
+        if key != self._monster_order_key:
+            self._monster_order_key = key
+            self._monster_order = sorted(self.deep_ones, key=lambda m: 0 if m.dead else 1)
+        return self._monster_order
+
     def draw_monsters(self, offset_row_float, offset_col_float):
         """Dibuja los monstruos (Profundos) visibles en la pantalla."""
-        # Ordenar: muertos primero, vivos después para que los vivos se dibujen encima
-        sorted_monsters = sorted(self.deep_ones, key=lambda m: 0 if m.dead else 1)
-        
-        for monster in sorted_monsters:
-            # Si está muerto, usar posición fija (no interpolar)
+        current_time = pygame.time.get_ticks()
+        sprite_size = int(self.cell_size * 0.45)  # Tamaño del guerrero
+        breath = breath_offset(sprite_size, current_time)
+        # Margen ampliado para animación; un monstruo se mueve como mucho una celda
+        low, high = -1.5, self.view_size + 0.5
+
+        for monster in self.monster_draw_order():
+            # Descartar cuanto antes los que quedan lejos de la vista
             if monster.dead:
-                m_row, m_col = float(monster.row), float(monster.col)
-                monster.animating = False # Asegurar que no anime si está muerto
-            else:
-                m_row, m_col = float(monster.row), float(monster.col)
-            
+                # Si está muerto, usar posición fija (no interpolar)
+                monster.animating = False
+            elif not (low - 1 <= monster.row - offset_row_float <= high + 1
+                      and low - 1 <= monster.col - offset_col_float <= high + 1):
+                continue
+
             m_row, m_col = float(monster.row), float(monster.col)
-            
+            walk = 0
+
             # Interpolar posición si está animando
             if monster.animating:
-                t_now = pygame.time.get_ticks()
-                elapsed = t_now - monster.anim_start_time
+                elapsed = current_time - monster.anim_start_time
                 t = min(1.0, elapsed / monster.anim_duration) if monster.anim_duration > 0 else 1.0
-                
+
                 m_row = monster.from_row + (monster.row - monster.from_row) * t
                 m_col = monster.from_col + (monster.col - monster.from_col) * t
-                
+
                 if t >= 1.0:
                     monster.animating = False
-            
+                else:
+                    walk = walk_offset(sprite_size, elapsed)
+
             # Calcular posición relativa a la vista
             view_row = m_row - offset_row_float
             view_col = m_col - offset_col_float
-            
-            # Dibujar solo si está dentro o cerca de la vista (margen ampliado para animación)
-            if -1.5 <= view_row <= self.view_size + 0.5 and -1.5 <= view_col <= self.view_size + 0.5:
-                x = int(view_col * self.cell_size)
-                y = int(view_row * self.cell_size)
-                
-                center_x = x + self.cell_size // 2
-                center_y = y + self.cell_size // 2
-                sprite_size = int(self.cell_size * 0.45)  # Tamaño del guerrero
-                
-                if monster.dead:
-                    # Dibujar charco de sangre
-                    seed = int(monster.row * 1000 + monster.col)
-                    self.draw_blood_pool(center_x, center_y, monster.death_time, seed)
-                    
-                    # Dibujar monstruo rotado 90 grados (tendido)
-                    temp_size = int(self.cell_size)
-                    temp_surf = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
-                    
-                    # Dibujar en superficie temporal centrada
-                    self.draw_deep_one_sprite(temp_size//2, temp_size//2, sprite_size, monster, target_surface=temp_surf)
-                    
-                    # Rotar y dibujar
-                    rotated_surf = pygame.transform.rotate(temp_surf, 90)
-                    rect = rotated_surf.get_rect(center=(center_x, center_y))
-                    self.screen.blit(rotated_surf, rect)
-                    continue
-                
-                self.draw_deep_one_sprite(center_x, center_y, sprite_size, monster)
+
+            # Dibujar solo si está dentro o cerca de la vista
+            if not (low <= view_row <= high and low <= view_col <= high):
+                continue
+            x = int(view_col * self.cell_size)
+            y = int(view_row * self.cell_size)
+
+            center_x = x + self.cell_size // 2
+            center_y = y + self.cell_size // 2
+
+            if monster.dead:
+                # Dibujar charco de sangre
+                seed = int(monster.row * 1000 + monster.col)
+                self.draw_blood_pool(center_x, center_y, monster.death_time, seed)
+
+                # Monstruo tendido (girado 90 grados, ya girado en la hoja de fotogramas)
+                rotated_surf = self.deep_one_sprites.dead(sprite_size, int(self.cell_size), breath)
+                rect = rotated_surf.get_rect(center=(center_x, center_y))
+                self.screen.blit(rotated_surf, rect)
+                continue
+
+            self.draw_deep_one_sprite(center_x, center_y, sprite_size, monster, walk=walk)
 
     def draw_exit_slab_overlay(self, offset_row_float, offset_col_float):
         """Dibuja la losa de salida si es visible, para que quede encima del jugador."""
@@ -1374,9 +1509,9 @@ class DungeonBoard:
                 pygame.draw.line(self.screen, (20, 20, 20), (losa_x + 6, ry), (losa_x + losa_w - 6, ry), 1)
 
     def draw_danger_overlay(self):
-        """Dibuja un tinte rojo si hay peligro o poca salud."""
+        """Dibuja un tinte rojo si hay peligro o poca salud. Devuelve si lo ha dibujado."""
         if self.showing_game_over:
-            return
+            return False
 
         danger_alpha = 0
         current_time = pygame.time.get_ticks()
@@ -1405,166 +1540,33 @@ class DungeonBoard:
                 danger_alpha = min(200, danger_alpha + proximity_alpha)
 
         if danger_alpha > 0:
-            overlay = pygame.Surface((self.width, self.height))
-            overlay.set_alpha(danger_alpha)
-            overlay.fill((255, 0, 0))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.screen_effects.danger(danger_alpha), (0, 0))
+            return True
+        return False
 
-    def draw_deep_one_sprite(self, cx: int, cy: int, size: int, monster=None, target_surface=None):
-        """Dibuja un sprite de un Profundo (zombie marino) más detallado."""
+    def draw_deep_one_sprite(self, cx: int, cy: int, size: int, monster=None, target_surface=None, walk=None):
+        """Dibuja un sprite de un Profundo (zombie marino) desde su hoja de fotogramas."""
         surface = target_surface if target_surface else self.screen
-        s = max(8, int(size))
-        
-        # Colores
-        skin_col = (40, 140, 100)      # Verde azulado pantanoso
-        skin_dark = (30, 110, 80)      # Sombra/bordes
-        belly_col = (60, 160, 120)     # Un poco más claro
-        eye_col = (255, 230, 50)       # Amarillo brillante
-        pupil_col = (0, 0, 0)
-        mouth_col = (20, 60, 40)       # Boca oscura
-        
-        # Animación de respiración/flotación
         t = pygame.time.get_ticks()
-        breath = math.sin(t * 0.003) * (s * 0.03)
-        
-        # Cuerpo (jorobado/ovalado)
-        body_w = int(s * 0.55)
-        body_h = int(s * 0.65)
-        body_y = cy - body_h // 4 + int(breath)
-        
-        # Estado de animación
-        is_roaring = monster and monster.state == "ROARING"
-        roar_t = (pygame.time.get_ticks() - monster.state_start_time) if is_roaring else 0
-        
-        # Espinas dorsales (detrás del cuerpo)
-        spine_w = int(s * 0.08)
-        spine_h = int(s * 0.15)
-        for i in range(3):
-            sy = body_y - body_h//2 + i * (spine_h + 2)
-            # Izquierda
-            pygame.draw.polygon(surface, skin_dark, [
-                (cx - body_w//2 + 5, sy + spine_h),
-                (cx - body_w//2 - spine_w, sy + spine_h//2),
-                (cx - body_w//2 + 5, sy)
-            ])
-            # Derecha
-            pygame.draw.polygon(surface, skin_dark, [
-                (cx + body_w//2 - 5, sy + spine_h),
-                (cx + body_w//2 + spine_w, sy + spine_h//2),
-                (cx + body_w//2 - 5, sy)
-            ])
-
-        # Piernas (humanoides)
-        leg_w = int(s * 0.16)
-        leg_h = int(s * 0.45)
-        leg_y = body_y + body_h // 3
-        
+        # Animación de respiración/flotación (mueve el sprite entero)
+        cy += breath_offset(size, t)
+
         # Animación de caminar
-        walk_offset = 0
-        if monster and monster.animating:
-            anim_t = pygame.time.get_ticks() - monster.anim_start_time
-            walk_offset = int(math.sin(anim_t * 0.02) * (s * 0.1))
-        
-        # Pierna izquierda
-        pygame.draw.ellipse(surface, skin_col, (cx - body_w//4 - leg_w//2, leg_y + walk_offset, leg_w, leg_h))
-        # Pierna derecha
-        pygame.draw.ellipse(surface, skin_col, (cx + body_w//4 - leg_w//2, leg_y - walk_offset, leg_w, leg_h))
-
-        # Brazos largos y colgantes
-        arm_w = int(s * 0.14)
-        arm_h = int(s * 0.55)
-        
-        if is_roaring:
-            # Brazos levantados/agitándose
-            arm_offset_y = -int(math.sin(roar_t * 0.02) * (s * 0.15)) - (s * 0.25)
-            pygame.draw.ellipse(surface, skin_col, (cx - body_w//2 - arm_w, body_y + arm_offset_y, arm_w, arm_h))
-            pygame.draw.ellipse(surface, skin_col, (cx + body_w//2, body_y + arm_offset_y, arm_w, arm_h))
-        else:
-            pygame.draw.ellipse(surface, skin_col, (cx - body_w//2 - arm_w//2, body_y, arm_w, arm_h))
-            pygame.draw.ellipse(surface, skin_col, (cx + body_w//2 - arm_w//2, body_y, arm_w, arm_h))
-        
-        # Cuerpo principal
-        pygame.draw.ellipse(surface, skin_col, (cx - body_w//2, body_y - body_h//2, body_w, body_h))
-        
-        # Vientre
-        belly_rect = (cx - body_w//3, body_y - body_h//3, body_w//1.5, body_h//1.5)
-        pygame.draw.ellipse(surface, belly_col, belly_rect)
-        
-        # Escamas (pequeños arcos)
-        for i in range(3):
-            sy = body_y - body_h//4 + i * (s * 0.1)
-            pygame.draw.arc(surface, skin_dark, (cx - s*0.1, sy, s*0.2, s*0.1), 0, 3.14, 1)
-        
-        # Cabeza (grande y de pez)
-        head_w = int(s * 0.5)
-        head_h = int(s * 0.55)
-        head_y = body_y - body_h//2 - head_h//3
-        
-        # Cresta de la cabeza
-        pygame.draw.polygon(surface, skin_dark, [
-            (cx, head_y - head_h//2 - int(s*0.1)),
-            (cx - int(s*0.1), head_y - head_h//2 + int(s*0.1)),
-            (cx + int(s*0.1), head_y - head_h//2 + int(s*0.1))
-        ])
-        
-        pygame.draw.ellipse(surface, skin_col, (cx - head_w//2, head_y - head_h//2, head_w, head_h))
-        
-        # Boca ancha de pez
-        mouth_y = head_y + int(head_h * 0.25)
-        mouth_w = int(head_w * 0.6)
-        if is_roaring:
-            # Boca abierta
-            pygame.draw.ellipse(surface, mouth_col, (cx - mouth_w//2, mouth_y, mouth_w, int(head_h * 0.25)))
-        else:
-            # Boca cerrada (línea curva)
-            pygame.draw.arc(surface, mouth_col, (cx - mouth_w//2, mouth_y - 5, mouth_w, 10), 3.14, 2*3.14, 2)
-
-        # Ojos (grandes, laterales y saltones)
-        eye_r = int(s * 0.13)
-        eye_y_pos = head_y - int(head_h * 0.1)
-        
-        # Pupilas moviéndose si ruge/mira
-        pupil_offset = int(math.sin(roar_t * 0.015) * (eye_r * 0.5)) if is_roaring else 0
-        
-        # Ojo izquierdo
-        pygame.draw.circle(surface, eye_col, (cx - int(head_w*0.35), eye_y_pos), eye_r)
-        pygame.draw.circle(surface, pupil_col, (cx - int(head_w*0.35) + pupil_offset, eye_y_pos), max(1, int(eye_r*0.3)))
-        
-        # Ojo derecho
-        pygame.draw.circle(surface, eye_col, (cx + int(head_w*0.35), eye_y_pos), eye_r)
-        pygame.draw.circle(surface, pupil_col, (cx + int(head_w*0.35) + pupil_offset, eye_y_pos), max(1, int(eye_r*0.3)))
-        
-        # Branquias/Aletas laterales
-        fin_w = int(s * 0.18)
-        fin_h = int(s * 0.25)
-        pygame.draw.polygon(surface, skin_col, [
-            (cx - head_w//2 + 5, head_y),
-            (cx - head_w//2 - fin_w, head_y - fin_h//2),
-            (cx - head_w//2 - fin_w, head_y + fin_h//2)
-        ])
-        pygame.draw.polygon(surface, skin_col, [
-            (cx + head_w//2 - 5, head_y),
-            (cx + head_w//2 + fin_w, head_y - fin_h//2),
-            (cx + head_w//2 + fin_w, head_y + fin_h//2)
-        ])
-        
-        # Indicador de alerta (!)
+        if walk is None:
+            walk = 0
+            if monster and monster.animating:
+                walk = walk_offset(size, t - monster.anim_start_time)
+        roar = None
+        if monster and monster.state == "ROARING":
+            roar = roar_pose(size, t - monster.state_start_time)
+        sprite, (dx, dy) = self.deep_one_sprites.body(size, walk, roar)
+        surface.blit(sprite, (cx + dx, cy + dy))
+
+        # Indicador de alerta (!) con animación de flotación suave
         if monster and monster.alerted and not monster.dead:
-            # Animación de flotación suave
-            alert_anim_offset = int(math.sin(pygame.time.get_ticks() * 0.01) * 2)
-            
-            alert_x = cx
-            alert_y = head_y - head_h // 2 - int(s * 0.3) + alert_anim_offset
-            alert_color = (255, 0, 0) # Rojo brillante
-            
-            # Punto
-            dot_size = max(2, int(s * 0.08))
-            pygame.draw.circle(surface, alert_color, (alert_x, alert_y), dot_size)
-            # Línea
-            line_w = max(2, int(s * 0.06))
-            line_h = int(s * 0.25)
-            pygame.draw.rect(surface, alert_color, (alert_x - line_w//2, alert_y - dot_size - 2 - line_h, line_w, line_h))
-    
+            alert, (dx, dy) = self.deep_one_sprites.alert(size)
+            surface.blit(alert, (cx + dx, cy + dy + int(math.sin(t * 0.01) * 2)))
+
     def draw_player(self, offset_row_float, offset_col_float):
         """Dibuja un monigote en la posición actual del jugador (con interpolación si está animando)."""
         # Parpadeo si es invulnerable
@@ -1625,16 +1627,10 @@ class DungeonBoard:
                 seed = int(p_row * 1000 + p_col)
                 self.draw_blood_pool(center_x, center_y, self.game_over_thought_finished_time, seed)
 
-            # Crear superficie temporal para rotar
-            temp_size = int(self.cell_size)
-            temp_surf = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
-            
-            # Dibujar guerrero centrado en la superficie temporal
-            self.draw_warrior_sprite(temp_size//2, temp_size//2, sprite_size, target_surface=temp_surf)
-            
-            # Rotar 90 grados
-            rotated_surf = pygame.transform.rotate(temp_surf, 90)
-            
+            # Guerrero girado 90 grados (en un lienzo de una celda, ya girado en la cache)
+            rotated_surf = self.warrior_sprites.rotated(sprite_size, int(self.cell_size), 90, self.player_palette,
+                                                        self.warrior_pose(sprite_size))
+
             # Dibujar en pantalla centrado
             rect = rotated_surf.get_rect(center=(center_x, center_y))
             self.screen.blit(rotated_surf, rect)
@@ -1670,19 +1666,19 @@ class DungeonBoard:
         center_x = x + self.cell_size // 2
         center_y = y + self.cell_size // 2
 
-        # Encoger y desvanecer conforme se precipita al vacío
-        scale = max(0.05, 1.0 - t)
+        # Encoger y desvanecer conforme se precipita al vacío (el giro y el
+        # tamaño van por fotogramas, ya girados en la cache)
+        frame_t = self.warrior_sprites.fall_frame(t)
+        scale = max(0.05, 1.0 - frame_t)
         sprite_size = max(2, int(self.cell_size * 0.6 * scale))
 
-        temp_size = max(4, int(self.cell_size))
-        temp_surf = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
-        self.draw_warrior_sprite(temp_size // 2, temp_size // 2, sprite_size, target_surface=temp_surf)
-
         # Rotación descontrolada para dar sensación de caída
-        angle = t * 220
-        rotated_surf = pygame.transform.rotate(temp_surf, angle)
-        alpha = max(0, int(255 * (1.0 - t)))
-        rotated_surf.set_alpha(alpha)
+        angle = frame_t * 220
+        rotated_surf = self.warrior_sprites.rotated(sprite_size, max(4, int(self.cell_size)), angle,
+                                                    self.player_palette, self.warrior_pose(sprite_size))
+        # El fotograma es de la cache (compartido): el desvanecido va en una copia
+        rotated_surf = rotated_surf.copy()
+        rotated_surf.set_alpha(max(0, int(255 * (1.0 - t))))
 
         rect = rotated_surf.get_rect(center=(center_x, center_y))
         self.screen.blit(rotated_surf, rect)
@@ -1767,8 +1763,8 @@ class DungeonBoard:
         body_h = max(2, int(half * 0.35))
         pygame.draw.ellipse(self.screen, color, (cx - body_w // 2, cy - body_h // 2, body_w, body_h))
 
-    def draw_debug_info(self):
-        """Muestra información de debug para ayudar a encontrar la salida."""
+    def debug_info_lines(self):
+        """Líneas de texto del panel de debug."""
         current_row, current_col = self.current_position
         exit_row, exit_col = self.exit_position
         
@@ -1796,138 +1792,88 @@ class DungeonBoard:
             f"Dirección: {direction_text}",
             f"En camino: {'SÍ' if on_path else 'NO'}"
         ]
+        cache_stats = self._cell_texture_cache.stats()
+        texts.append(f"Texturas: {cache_stats['entries']} ({cache_stats['bytes'] // (1024 * 1024)} MB)")
+        texts.append(f"Cache h/f/e: {cache_stats['hits']}/{cache_stats['misses']}/{cache_stats['evictions']}")
+        return texts
+
+    def build_debug_info_blits(self):
+        """Panel de debug como lista de blits."""
+        texts = self.debug_info_lines()
         
-        # Dibujar fondo semi-transparente
+        # Fondo semi-transparente
         info_height = len(texts) * 25 + 20
-        info_surface = pygame.Surface((250, info_height))
-        info_surface.set_alpha(200)
-        info_surface.fill((0, 0, 0))
-        self.screen.blit(info_surface, (10, 10))
+        info_surface = self.screen_effects.tint('debug', (0, 0, 0), 200, (250, info_height))
+        blits = [(info_surface, (10, 10))]
         
-        # Dibujar textos
+        # Textos
         y_offset = 20
         for text in texts:
             color = (0, 255, 0) if "En camino: SÍ" in text else (255, 255, 255)
-            text_surface = self.font.render(text, True, color)
-            self.screen.blit(text_surface, (20, y_offset))
+            text_surface = self.text_cache.render(text, 24, color)
+            blits.append((text_surface, (20, y_offset)))
             y_offset += 25
-    
-    def draw_subtitles(self):
-        """Dibuja los subtítulos en la parte inferior de la pantalla."""
+        return blits
+
+    def build_subtitle_blits(self):
+        """Subtítulos (fondo y líneas centradas) como lista de blits."""
         if not self.audio.showing_subtitles:
-            return
+            return []
         
         # Los threads manejan automáticamente la expiración de subtítulos
         # Solo dibujamos lo que el AudioManager nos indica
         
-        # Dividir el texto en líneas que quepan en el ancho del juego
-        font = pygame.font.Font(None, 32)
-        max_width = self.width - 40  # Margen de 20px a cada lado
-        words = self.audio.subtitle_text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = font.render(test_line, True, (255, 255, 255))
-            
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Líneas que caben en el ancho del juego (ya partidas al encolar el subtítulo)
+        lines = self.subtitle_lines(self.audio.subtitle_text)
         
         # Calcular altura necesaria para todas las líneas
         line_height = 36
         subtitle_height = max(80, len(lines) * line_height + 20)
         
         # Crear fondo semi-transparente para los subtítulos
-        subtitle_bg = pygame.Surface((self.width, subtitle_height))
-        subtitle_bg.set_alpha(160)
-        subtitle_bg.fill((0, 0, 0))
-        self.screen.blit(subtitle_bg, (0, self.height - subtitle_height))
+        subtitle_bg = self.screen_effects.tint('subtitles', (0, 0, 0), 160, (self.width, subtitle_height))
+        blits = [(subtitle_bg, (0, self.height - subtitle_height))]
         
         # Renderizar cada línea centrada
         start_y = self.height - subtitle_height + 10
         for i, line in enumerate(lines):
-            text_surface = font.render(line, True, (255, 255, 255))
+            text_surface = self.text_cache.render(line, 32, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(self.width // 2, start_y + i * line_height + line_height // 2))
-            self.screen.blit(text_surface, text_rect)
-    
+            blits.append((text_surface, text_rect.topleft))
+        return blits
 
-    
-    
-    def draw_exit_confirmation(self):
-        """Dibuja el diálogo de confirmación de salida."""
-        # Fondo oscuro semi-transparente
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Caja de diálogo
-        dialog_width = 400
-        dialog_height = 150
-        dialog_x = (self.width - dialog_width) // 2
-        dialog_y = (self.height - dialog_height) // 2
-        
-        # Fondo de la caja
-        pygame.draw.rect(self.screen, (40, 40, 40), (dialog_x, dialog_y, dialog_width, dialog_height))
-        # Borde
-        pygame.draw.rect(self.screen, (200, 200, 200), (dialog_x, dialog_y, dialog_width, dialog_height), 3)
-        
-        # Texto
-        title_font = pygame.font.Font(None, 48)
-        subtitle_font = pygame.font.Font(None, 32)
-        
-        title_text = title_font.render("¿Salir del juego?", True, (255, 255, 255))
-        subtitle_text = subtitle_font.render("S = Sí  /  N = No", True, (200, 200, 200))
-        
-        title_x = dialog_x + (dialog_width - title_text.get_width()) // 2
-        title_y = dialog_y + 30
-        subtitle_x = dialog_x + (dialog_width - subtitle_text.get_width()) // 2
-        subtitle_y = dialog_y + 90
-        
-        self.screen.blit(title_text, (title_x, title_y))
-        self.screen.blit(subtitle_text, (subtitle_x, subtitle_y))
+    def subtitle_lines(self, text):
+        """Líneas de un subtítulo que caben en el ancho del juego (margen de 20px a cada lado)."""
+        return self.text_cache.wrap(text, 32, self.width - 40)
 
-    def draw_main_menu_confirmation(self):
-        """Dibuja el diálogo de confirmación para volver al menú principal."""
+    def build_confirmation_blits(self, title, title_size, dialog_width):
+        """Diálogo de confirmación S/N sobre la pantalla oscurecida, como lista de blits."""
         # Fondo oscuro semi-transparente
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        overlay = self.screen_effects.tint('dim', (0, 0, 0), 180)
         
         # Caja de diálogo
-        dialog_width = 450
         dialog_height = 150
         dialog_x = (self.width - dialog_width) // 2
         dialog_y = (self.height - dialog_height) // 2
-        
-        # Fondo de la caja
-        pygame.draw.rect(self.screen, (40, 40, 40), (dialog_x, dialog_y, dialog_width, dialog_height))
-        # Borde
-        pygame.draw.rect(self.screen, (200, 200, 200), (dialog_x, dialog_y, dialog_width, dialog_height), 3)
+        # Fondo gris oscuro con borde claro (una superficie por ancho de diálogo)
+        dialog = self.screen_effects.panel(('dialog', dialog_width), (dialog_width, dialog_height),
+                                           (40, 40, 40), (200, 200, 200), 3)
         
         # Texto
-        title_font = pygame.font.Font(None, 40)
-        subtitle_font = pygame.font.Font(None, 32)
-        
-        title_text = title_font.render("¿Volver al menú principal?", True, (255, 255, 255))
-        subtitle_text = subtitle_font.render("S = Sí  /  N = No", True, (200, 200, 200))
+        title_text = self.text_cache.render(title, title_size, (255, 255, 255))
+        subtitle_text = self.text_cache.render("S = Sí  /  N = No", 32, (200, 200, 200))
         
         title_x = dialog_x + (dialog_width - title_text.get_width()) // 2
         title_y = dialog_y + 30
         subtitle_x = dialog_x + (dialog_width - subtitle_text.get_width()) // 2
         subtitle_y = dialog_y + 90
         
-        self.screen.blit(title_text, (title_x, title_y))
-        self.screen.blit(subtitle_text, (subtitle_x, subtitle_y))
+        return [
+            (overlay, (0, 0)),
+            (dialog, (dialog_x, dialog_y)),
+            (title_text, (title_x, title_y)),
+            (subtitle_text, (subtitle_x, subtitle_y)),
+        ]
 
     def draw_game_over(self):
         """Dibuja la pantalla de Game Over."""
@@ -1944,9 +1890,7 @@ class DungeonBoard:
                     self.screen.blit(gray_surface, (0, 0))
                 else:
                     # Fallback para versiones antiguas: overlay gris
-                    overlay = pygame.Surface((self.width, self.height))
-                    overlay.fill((50, 50, 50))
-                    overlay.set_alpha(int(200 * progress))
+                    overlay = self.screen_effects.tint('gray', (50, 50, 50), int(200 * progress))
                     self.screen.blit(overlay, (0, 0), special_flags=pygame.BLEND_MULT)
             except Exception:
                 pass
@@ -1960,14 +1904,12 @@ class DungeonBoard:
         cycle_time = (current_time - self.game_over_start_time) % 4000
         
         if cycle_time < 2000:
-            font = pygame.font.Font(None, 64)
-            text_surface = font.render("GAME OVER", True, (200, 0, 0))
+            text_surface = self.text_cache.render("GAME OVER", 64, (200, 0, 0))
             
             # Fondo semi-transparente para el texto
             bg_rect = text_surface.get_rect(center=(self.width // 2, self.height - 100))
-            bg_surface = pygame.Surface((bg_rect.width + 40, bg_rect.height + 20))
-            bg_surface.set_alpha(180)
-            bg_surface.fill((0, 0, 0))
+            bg_surface = self.screen_effects.tint('game_over', (0, 0, 0), 180,
+                                                  (bg_rect.width + 40, bg_rect.height + 20))
             
             self.screen.blit(bg_surface, (bg_rect.x - 20, bg_rect.y - 10))
             self.screen.blit(text_surface, bg_rect)
@@ -1980,9 +1922,7 @@ class DungeonBoard:
             if fade_elapsed > 0:
                 alpha = min(255, int(255 * (fade_elapsed / fade_duration)))
                 if alpha > 0:
-                    fade_surface = pygame.Surface((self.width, self.height))
-                    fade_surface.fill((0, 0, 0))
-                    fade_surface.set_alpha(alpha)
+                    fade_surface = self.screen_effects.tint('fade', (0, 0, 0), alpha)
                     self.screen.blit(fade_surface, (0, 0))
             
             # Botón de reiniciar (aparece después del fade black)
@@ -2000,19 +1940,11 @@ class DungeonBoard:
                 
                 self.restart_button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
                 
-                # Superficie para el botón con transparencia
-                btn_surface = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-                
-                # Color del botón (gris oscuro/rojo muy oscuro)
-                pygame.draw.rect(btn_surface, (50, 0, 0, restart_alpha), (0, 0, button_width, button_height))
-                pygame.draw.rect(btn_surface, (150, 0, 0, restart_alpha), (0, 0, button_width, button_height), 2)
-                
-                # Texto
-                font = pygame.font.Font(None, 36)
-                text = font.render("REINICIAR (R)", True, (255, 255, 255))
-                text.set_alpha(restart_alpha)
-                text_rect = text.get_rect(center=(button_width//2, button_height//2))
-                btn_surface.blit(text, text_rect)
+                # Botón rojo muy oscuro con el texto (de la cache, compartido: se
+                # copia tal cual y el desvanecido se aplica al botón entero)
+                text = self.text_cache.render("REINICIAR (R)", 36, (255, 255, 255))
+                btn_surface = self.screen_effects.panel('restart', (button_width, button_height),
+                                                        (50, 0, 0), (150, 0, 0), 2, text, restart_alpha)
                 
                 self.screen.blit(btn_surface, (button_x, button_y))
 
@@ -2029,241 +1961,136 @@ class DungeonBoard:
         progress = elapsed / self.flash_duration
         alpha = int(180 * (1.0 - progress))
         
-        flash_surface = pygame.Surface((self.width, self.height))
-        flash_surface.set_alpha(alpha)
-        flash_surface.fill(self.flash_color)
-        self.screen.blit(flash_surface, (0, 0))
+        self.screen.blit(self.screen_effects.tint('flash', self.flash_color, alpha), (0, 0))
 
     def draw_blood_pool(self, cx, cy, start_time=None, seed_val=None):
         """Dibuja un charco de sangre que se expande lentamente."""
         if start_time is None:
             start_time = self.game_over_thought_finished_time
-            
-        elapsed = pygame.time.get_ticks() - start_time
-        
-        # Expansión lenta durante 8 segundos
-        duration = 8000
-        progress = min(1.0, elapsed / duration)
-        
-        if progress <= 0:
-            return
 
-        # Radio máximo (casi el tamaño de la celda)
-        max_radius = int(self.cell_size * 0.65)
-        current_radius = int(max_radius * progress)
-        
-        if current_radius < 1:
-            return
-            
         # Usar semilla proporcionada o posición en pantalla (fallback)
         if seed_val is None:
             seed_val = int(cx * cy)
-        seed = seed_val
-        rnd = random.Random(seed)
-        
-        # Animación de pulsación/ondulación para simular líquido
-        t = pygame.time.get_ticks()
-        
-        # Dibujar múltiples círculos superpuestos para formar un charco irregular
-        num_blobs = 15
-        for i in range(num_blobs):
-            angle = rnd.uniform(0, 2 * math.pi)
-            # Distribución más densa en el centro
-            dist = current_radius * (rnd.random() ** 0.5)
-            
-            blob_x = cx + int(dist * math.cos(angle))
-            blob_y = cy + int(dist * math.sin(angle))
-            
-            # Variación individual por blob para que no pulsen todos igual
-            # Esto crea un efecto de "hervor" o movimiento líquido
-            blob_pulse = math.sin(t * 0.005 + i * 13.0) * 0.15 + 1.0
-            
-            # Tamaño de cada gota/mancha
-            blob_size = int(current_radius * rnd.uniform(0.2, 0.5) * blob_pulse)
-            if blob_size < 1: continue
-            
-            # Variación de color rojo oscuro
-            r = rnd.randint(60, 100)
-            color = (r, 0, 0)
-            
-            pygame.draw.circle(self.screen, color, (blob_x, blob_y), blob_size)
-
-    def draw_warrior_sprite(self, cx: int, cy: int, size: int, target_surface=None):
-        """Dibuja un sprite de guerrero sencillo (procedimental) centrado en (cx, cy).
-
-        El sprite es vectorial (formas) y escala con `size`.
-        """
-        surface = target_surface if target_surface else self.screen
-        
-        # Sizing
-        s = max(8, int(size))
-        head_r = max(4, s // 6)
-        body_h = max(8, s // 2)
-        body_w = max(6, s // 3)
-
-        # Colores desde la paleta configurable
-        armor_col = self.player_palette.get("armor", (90, 90, 90))
-        trim_col = self.player_palette.get("trim", (140, 140, 140))
-        skin_col = self.player_palette.get("skin", (200, 170, 140))
-        shield_col = self.player_palette.get("shield", (70, 70, 70))
-        shield_trim = self.player_palette.get("shield_trim", (140, 120, 80))
-        sword_handle_col = self.player_palette.get("sword_handle", (180, 140, 80))
-        sword_blade_col = self.player_palette.get("sword_blade", (200, 200, 200))
-
-        # Animación de introducción
-        intro_offset_y = 0
-        head_turn_offset = 0
-        
-        if self.intro_anim_active:
-            t_now = pygame.time.get_ticks()
-            elapsed = t_now - self.intro_anim_start_time
-            
-            # Debug en web
-            if self.is_web and elapsed % 1000 < 50:  # Log cada segundo aproximadamente
-                print(f"[DEBUG WEB] Intro anim - elapsed: {elapsed}ms")
-            
-            # Stage 0: Caída (0-800ms)
-            if elapsed < 800:
-                fall_progress = elapsed / 800.0
-                intro_offset_y = int(-self.cell_size * (1.0 - fall_progress))
-            # Stage 1: Mirar izquierda (800-2800ms) - 2 segundos
-            elif elapsed < 2800:
-                head_turn_offset = -head_r // 2
-            # Stage 2: Mirar derecha (2800-4800ms) - 2 segundos
-            elif elapsed < 4800:
-                head_turn_offset = head_r // 2
-            # Stage 3: Sacar armas (4800-5300ms)
-            elif elapsed < 5300:
-                self.intro_show_weapons = True
-            # Stage 4: Completo
-            else:
-                self.intro_anim_active = False
-                self.intro_show_weapons = True
-                if self.is_web:
-                    print("[DEBUG WEB] Intro anim completada")
-        
-        cy += intro_offset_y
-        
-        # Sombras / base
-        shadow_w = int(body_w * 1.2)
-        pygame.draw.ellipse(surface, (10, 10, 10), (cx - shadow_w//2, cy + body_h//2, shadow_w, max(4, s//6)))
 
+        # Fotograma cacheado (crecimiento durante 8 segundos y ondulación del líquido)
+        ticks = pygame.time.get_ticks()
+        pool = self.decorations.decals.blood_pool(seed_val, self.cell_size, ticks - start_time, ticks)
+        if pool is None:
+            return
+        frame, (dx, dy) = pool
+        self.screen.blit(frame, (cx + dx, cy + dy))
+
+    def update_intro_animation(self):
+        """Avanza la animación de introducción.
+
+        Devuelve (desplazamiento vertical en celdas, giro de cabeza -1/0/1)."""
+        if not self.intro_anim_active:
+            return 0.0, 0
+        elapsed = pygame.time.get_ticks() - self.intro_anim_start_time
+
+        # Debug en web
+        if self.is_web and elapsed % 1000 < 50:  # Log cada segundo aproximadamente
+            print(f"[DEBUG WEB] Intro anim - elapsed: {elapsed}ms")
+
+        # Stage 0: Caída (0-800ms)
+        if elapsed < 800:
+            return -(1.0 - elapsed / 800.0), 0
+        # Stage 1: Mirar izquierda (800-2800ms) - 2 segundos
+        if elapsed < 2800:
+            return 0.0, -1
+        # Stage 2: Mirar derecha (2800-4800ms) - 2 segundos
+        if elapsed < 4800:
+            return 0.0, 1
+        # Stage 3: Sacar armas (4800-5300ms)
+        self.intro_show_weapons = True
+        # Stage 4: Completo
+        if elapsed >= 5300:
+            self.intro_anim_active = False
+            if self.is_web:
+                print("[DEBUG WEB] Intro anim completada")
+        return 0.0, 0
+
+    def warrior_pose(self, size: int, head_turn: int = 0):
+        """Pose actual del guerrero (fase del paso, giro de cabeza, armas) para un tamaño."""
         # Animación simple basada en tiempo (oscilación seno) — solo cuando se está moviendo
         t = pygame.time.get_ticks()
-        walking = t < self.player_walk_until
-        if walking:
+        if t < self.player_walk_until:
             phase = math.sin(t * self.player_anim_speed * 2 * math.pi) * self.player_anim_amp
         else:
             phase = 0.0
+        return (walk_offsets(phase, size), head_turn, self.intro_show_weapons, self.has_sword_power)
+
+    def draw_warrior_sprite(self, cx: int, cy: int, size: int, target_surface=None):
+        """Dibuja el sprite de guerrero (procedimental) centrado en (cx, cy).
+
+        Cada pose se dibuja una vez por tamaño (ver WarriorSprites): un blit.
+        """
+        surface = target_surface if target_surface else self.screen
+        intro_fall, head_turn = self.update_intro_animation()
+        cy += int(self.cell_size * intro_fall)
+        sprite, (dx, dy) = self.warrior_sprites.frame(size, self.player_palette, self.warrior_pose(size, head_turn))
+        surface.blit(sprite, (cx + dx, cy + dy))
 
-        # Piernas (oscilan)
-        leg_h = max(6, s // 6)
-        left_leg_offset = int(phase * leg_h * 0.5)
-        right_leg_offset = int(-phase * leg_h * 0.5)
-        lx = cx - body_w//4
-        rx = cx + body_w//4
-        leg_y0 = cy + body_h//2
-        pygame.draw.line(surface, (60, 60, 60), (lx, leg_y0), (lx, leg_y0 + leg_h + left_leg_offset), 3)
-        pygame.draw.line(surface, (60, 60, 60), (rx, leg_y0), (rx, leg_y0 + leg_h + right_leg_offset), 3)
-
-        # Cuerpo (armadura)
-        body_rect = pygame.Rect(cx - body_w//2, cy - body_h//4, body_w, body_h)
-        pygame.draw.rect(surface, armor_col, body_rect)
-        pygame.draw.rect(surface, trim_col, body_rect, 2)
-
-        # Brazos/guanteletes (se mueven ligeramente)
-        arm_w = max(4, s // 10)
-        arm_y = cy - body_h//8 + int(-phase * (body_h//8))
-        pygame.draw.rect(surface, armor_col, (cx - body_w//2 - arm_w, arm_y, arm_w, body_h//3))
-        pygame.draw.rect(surface, armor_col, (cx + body_w//2, arm_y, arm_w, body_h//3))
-        pygame.draw.rect(surface, trim_col, (cx - body_w//2 - arm_w, arm_y, arm_w, body_h//3), 1)
-        pygame.draw.rect(surface, trim_col, (cx + body_w//2, arm_y, arm_w, body_h//3), 1)
-
-        # Escudo y espada solo se muestran después de la intro
-        if self.intro_show_weapons:
-            # Brillo de la espada si tiene poder
-            if self.has_sword_power:
-                sword_glow_radius = max(15, s // 2)
-                sword_glow_x = cx + body_w//2 + arm_w + 2 + int(phase * 2)
-                sword_glow_y = cy - body_h//2 + int(-phase * 2)
-                
-                glow_surf = pygame.Surface((sword_glow_radius*2, sword_glow_radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (200, 240, 255, 100), (sword_glow_radius, sword_glow_radius), sword_glow_radius)
-                surface.blit(glow_surf, (sword_glow_x - sword_glow_radius, sword_glow_y - sword_glow_radius))
-
-            # Escudo (izquierda) - se desplaza ligeramente con la fase
-            shield_r = max(8, s // 6)
-            shield_x = cx - body_w//2 - arm_w - shield_r//2 + int(-phase * 3)
-            shield_y = cy + int(phase * 2)
-            pygame.draw.circle(surface, shield_col, (shield_x, shield_y), shield_r)
-            pygame.draw.circle(surface, shield_trim, (shield_x, shield_y), shield_r, 2)
-
-            # Espada (derecha) - mango y hoja simple, se balancea con la fase
-            sword_h = max(12, s // 3)
-            sword_w = max(3, s // 30)
-            sword_x = cx + body_w//2 + arm_w + 2 + int(phase * 2)
-            sword_y1 = cy - body_h//8 + int(-phase * 2)
-            sword_y2 = sword_y1 - sword_h + int(phase * 4)
-            
-            # Espada brillante si tiene poder
-            blade_col = (220, 250, 255) if self.has_sword_power else sword_blade_col
-            
-            pygame.draw.line(surface, sword_handle_col, (sword_x, sword_y1), (sword_x, sword_y1 + 6), sword_w + 2)
-            pygame.draw.line(surface, blade_col, (sword_x, sword_y1), (sword_x, sword_y2), sword_w)
-
-        # Cabeza y casco
-        head_x = cx + head_turn_offset
-        head_y = cy - body_h//2 + head_r
-        # Cara
-        pygame.draw.circle(surface, skin_col, (head_x, head_y), head_r)
-        # Casco
-        helmet_h = max(6, head_r + 2)
-        helmet_rect = pygame.Rect(head_x - head_r - 2, head_y - helmet_h, head_r*2 + 4, helmet_h)
-        pygame.draw.rect(surface, trim_col, helmet_rect)
-        pygame.draw.rect(surface, (160, 160, 160), helmet_rect, 1)
-        # Visor (línea)
-        pygame.draw.line(surface, (30, 30, 30), (head_x - head_r//1, head_y - 1), (head_x + head_r//1, head_y - 1), 2)
-        # Ojos
-        eye_y = head_y - 1
-        pygame.draw.circle(surface, (10, 10, 10), (head_x - head_r//2, eye_y), max(1, head_r//4))
-        pygame.draw.circle(surface, (10, 10, 10), (head_x + head_r//2, eye_y), max(1, head_r//4))
-    
     def draw_barranco_cell(self, x: int, y: int, board_row: int, board_col: int) -> None:
         """Dibuja una celda de barranco: un abismo negro, casi sin detalle, donde
-        solo se distingue ligeramente el borde del acantilado del lado accesible."""
+        solo se distingue ligeramente el borde del acantilado del lado accesible.
+
+        Todas las celdas del barranco son iguales: la imagen se guarda por zoom."""
+        edge_dir = self.get_barranco_accessible_edge_direction()
+        key = ('barranco', self.cell_size, edge_dir, self.show_path)
+        tile = self._cell_texture_cache.get(key)
+        if tile is None:
+            tile = pygame.Surface((self.cell_size, self.cell_size))
+            self.paint_barranco_cell(tile, edge_dir)
+            self._cell_texture_cache.put(key, tile, TextureCache.surface_bytes(tile))
+        self.screen.blit(tile, (x, y))
+
+    def paint_barranco_cell(self, surface: pygame.Surface, edge_dir: Direction) -> None:
+        """Pinta una celda de barranco en surface (de una celda de tamaño)."""
         size = self.cell_size
         base_color = (4, 4, 5)
-        pygame.draw.rect(self.screen, base_color, (x, y, size, size))
+        surface.fill(base_color)
 
         # Borde del acantilado, apenas visible, solo hacia el lado accesible del mapa
-        edge_dir = self.get_barranco_accessible_edge_direction()
         edge_thickness = max(2, int(size * 0.05))
         edge_color = (26, 22, 20)
 
         if edge_dir == Direction.N:
-            rect = (x, y, size, edge_thickness)
+            rect = (0, 0, size, edge_thickness)
         elif edge_dir == Direction.S:
-            rect = (x, y + size - edge_thickness, size, edge_thickness)
+            rect = (0, size - edge_thickness, size, edge_thickness)
         elif edge_dir == Direction.O:
-            rect = (x, y, edge_thickness, size)
+            rect = (0, 0, edge_thickness, size)
         else:  # Direction.E
-            rect = (x + size - edge_thickness, y, edge_thickness, size)
-        pygame.draw.rect(self.screen, edge_color, rect)
+            rect = (size - edge_thickness, 0, edge_thickness, size)
+        pygame.draw.rect(surface, edge_color, rect)
 
         # F4 (show_path): resaltar el barranco en rojo para que sea visible en el debug
         if self.show_path:
             overlay = pygame.Surface((size, size))
             overlay.set_alpha(120)
             overlay.fill((255, 0, 0))
-            self.screen.blit(overlay, (x, y))
+            surface.blit(overlay, (0, 0))
 
     def draw_bridge_cell(self, x: int, y: int, board_row: int, board_col: int) -> None:
         """Dibuja un puente volante que cruza el barranco en este punto: tablones de
         madera y cuerdas, anclados de borde a borde de la celda (hacia las celdas
-        accesibles a cada lado), con el vacío del barranco visible a los lados."""
+        accesibles a cada lado), con el vacío del barranco visible a los lados.
+
+        Los dos puentes son iguales: la imagen se guarda por zoom."""
+        key = ('bridge', self.cell_size, self.barranco_axis)
+        tile = self._cell_texture_cache.get(key)
+        if tile is None:
+            tile = pygame.Surface((self.cell_size, self.cell_size))
+            self.paint_bridge_cell(tile)
+            self._cell_texture_cache.put(key, tile, TextureCache.surface_bytes(tile))
+        self.screen.blit(tile, (x, y))
+
+    def paint_bridge_cell(self, surface: pygame.Surface) -> None:
+        """Pinta un puente en surface (de una celda de tamaño)."""
         size = self.cell_size
         base_color = (4, 4, 5)
-        pygame.draw.rect(self.screen, base_color, (x, y, size, size))
+        surface.fill(base_color)
 
         wood_color = (94, 64, 36)
         wood_dark = (60, 40, 22)
@@ -2273,106 +2100,302 @@ class DungeonBoard:
         if self.barranco_axis == 'row':
             # El barranco es una fila: el puente cruza en vertical (N-S)
             deck_w = int(size * 0.42)
-            deck_x = x + (size - deck_w) // 2
-            pygame.draw.rect(self.screen, wood_color, (deck_x, y, deck_w, size))
+            deck_x = (size - deck_w) // 2
+            pygame.draw.rect(surface, wood_color, (deck_x, 0, deck_w, size))
             for py in range(0, size, plank_gap):
-                pygame.draw.line(self.screen, wood_dark, (deck_x, y + py), (deck_x + deck_w, y + py), 3)
-            pygame.draw.line(self.screen, rope_color, (deck_x, y), (deck_x, y + size), 4)
-            pygame.draw.line(self.screen, rope_color, (deck_x + deck_w, y), (deck_x + deck_w, y + size), 4)
+                pygame.draw.line(surface, wood_dark, (deck_x, py), (deck_x + deck_w, py), 3)
+            pygame.draw.line(surface, rope_color, (deck_x, 0), (deck_x, size), 4)
+            pygame.draw.line(surface, rope_color, (deck_x + deck_w, 0), (deck_x + deck_w, size), 4)
         else:
             # El barranco es una columna: el puente cruza en horizontal (E-O)
             deck_h = int(size * 0.42)
-            deck_y = y + (size - deck_h) // 2
-            pygame.draw.rect(self.screen, wood_color, (x, deck_y, size, deck_h))
+            deck_y = (size - deck_h) // 2
+            pygame.draw.rect(surface, wood_color, (0, deck_y, size, deck_h))
             for px in range(0, size, plank_gap):
-                pygame.draw.line(self.screen, wood_dark, (x + px, deck_y), (x + px, deck_y + deck_h), 3)
-            pygame.draw.line(self.screen, rope_color, (x, deck_y), (x + size, deck_y), 4)
-            pygame.draw.line(self.screen, rope_color, (x, deck_y + deck_h), (x + size, deck_y + deck_h), 4)
+                pygame.draw.line(surface, wood_dark, (px, deck_y), (px, deck_y + deck_h), 3)
+            pygame.draw.line(surface, rope_color, (0, deck_y), (size, deck_y), 4)
+            pygame.draw.line(surface, rope_color, (0, deck_y + deck_h), (size, deck_y + deck_h), 4)
 
     def get_cell_texture(self, board_row: int, board_col: int, cell, floor_color, wall_brightness: float,
-                         draw_full_floor: bool = True, background_color=None):
-        """Devuelve la imagen de suelo+paredes de una celda, generándola y
-        cacheándola la primera vez que se necesita con este brillo/zoom.
+                         draw_full_floor: bool = True, background_color=None, barranco_dirs=()):
+        """Devuelve la imagen de suelo+paredes de una celda con su brillo real.
 
         El patrón de piedras/ruido es siempre el mismo para una celda (su
-        semilla es la posición), así que hornearlo una vez y reutilizarlo
-        evita repetir cientos de dibujados vectoriales cada frame sin
-        cambiar en nada el resultado (misma función, mismos parámetros).
-        Solo se regenera si cambian las salidas, el tipo de celda o el
-        brillo real (antorchas encendiéndose/apagándose, espada, distancia).
+        semilla es la posición): se hornea una vez sin iluminar y cada brillo
+        distinto es solo una pasada de luz (ver CellTileCache). Solo se
+        vuelve a hornear si cambian las salidas o el tipo de celda.
 
         Args:
             draw_full_floor: si es False, el fondo es un color plano
                 (background_color) en vez de la textura de suelo con ruido
                 (usado por la celda SALIDA, que tiene su propio fondo gris).
             background_color: color plano de fondo cuando draw_full_floor=False.
+            barranco_dirs: lados que dan al barranco (acantilado horneado en la textura).
         """
-        wb = int(wall_brightness)
-        bg = background_color if background_color is not None else floor_color
-        key = (board_row, board_col, self.cell_size, floor_color[0], wb, draw_full_floor, bg)
-        cached = self._cell_texture_cache.get(key)
-        exits_snapshot = frozenset(cell.exits)
-        if cached is not None and cached[0] == exits_snapshot and cached[1] == cell.cell_type:
-            return cached[2]
-
-        size = self.cell_size
-        inset = int(size * 0.15)
-        inset_size = size - 2 * inset
-
-        surf = pygame.Surface((size, size))
-        if draw_full_floor:
-            self.effects.draw_rough_floor(0, 0, size, size, floor_color, board_row, board_col, target_surface=surf)
-        else:
-            surf.fill(bg)
-        self.effects.draw_stone_in_walls(
-            board_row, board_col, 0, 0, cell, 1.0, self.count_torches,
-            barranco_dirs=None, target_surface=surf, wall_brightness_override=wb,
-        )
-        if inset_size > 0:
-            self.effects.draw_rough_floor(inset, inset, inset_size, inset_size, floor_color, board_row, board_col, target_surface=surf)
-
-        self._cell_texture_cache[key] = (exits_snapshot, cell.cell_type, surf)
-        return surf
+        background_brightness = background_color[0] if background_color is not None else None
+        return self.cell_tiles.get_tile(board_row, board_col, cell, floor_color[0], int(wall_brightness),
+                                        draw_full_floor, background_brightness, barranco_dirs)
 
     def draw_floor_and_walls(self, board_row, board_col, x, y, cell, floor_color, brightness_factor,
                              draw_full_floor: bool = True, background_color=None) -> None:
-        """Dibuja el suelo y las paredes de una celda.
-
-        Las celdas junto al barranco siguen el camino vectorial de siempre en
-        vivo (son pocas y necesitan integrarse con el acantilado). El resto
-        usa la textura cacheada (ver get_cell_texture): un solo blit en vez de
-        redibujar piedras y ruido a mano en cada frame.
+        """Dibuja el suelo y las paredes de una celda desde su textura cacheada
+        (ver get_cell_texture): un solo blit en vez de redibujar piedras y ruido
+        a mano. Las celdas junto al barranco llevan el acantilado en la textura.
         """
-        size = self.cell_size
         barranco_dirs = self.barranco_facing_directions(board_row, board_col)
+        self.draw_cached_floor_and_walls(board_row, board_col, x, y, cell, floor_color, brightness_factor,
+                                         draw_full_floor, background_color, barranco_dirs)
 
-        if barranco_dirs:
-            inset = int(size * 0.15)
-            if draw_full_floor:
-                self.effects.draw_rough_floor(x, y, size, size, floor_color, board_row, board_col)
-            elif background_color is not None:
-                pygame.draw.rect(self.screen, background_color, (x, y, size, size))
-            self.effects.draw_stone_in_walls(board_row, board_col, x, y, cell, brightness_factor, self.count_torches, barranco_dirs)
-            self.effects.draw_rough_floor(x + inset, y + inset, size - 2 * inset, size - 2 * inset, floor_color, board_row, board_col)
-            # El acantilado se pinta el último para que quede sólido y no lo tape
-            # el suelo interior (que se solapa un poco con el grosor del muro)
-            for cliff_dir in barranco_dirs:
-                self.effects.draw_cliff_side(x, y, cliff_dir, board_row, board_col)
-            self.effects.draw_barranco_door_corners(board_row, board_col, x, y, cell, barranco_dirs)
-            return
-
+    def draw_cached_floor_and_walls(self, board_row, board_col, x, y, cell, floor_color, brightness_factor,
+                                    draw_full_floor: bool = True, background_color=None,
+                                    barranco_dirs=()) -> None:
+        """Suelo y paredes desde la textura cacheada de la celda (un solo blit)."""
         torch_count = self.count_torches(board_row, board_col, cell)
         wall_brightness = (20 + min(120, torch_count * 30)) * brightness_factor
 
         tile = self.get_cell_texture(board_row, board_col, cell, floor_color, wall_brightness,
-                                     draw_full_floor=draw_full_floor, background_color=background_color)
+                                     draw_full_floor=draw_full_floor, background_color=background_color,
+                                     barranco_dirs=barranco_dirs)
         self.screen.blit(tile, (x, y))
 
-    def draw_cell(self, board_row, board_col, view_row, view_col, pixel_offset_x=0, pixel_offset_y=0):
-        """Dibuja una celda del tablero en las coordenadas de la vista."""
+    def draw_static_region(self, rect):
+        """Redibuja en la capa estática el rectángulo rect (coordenadas de la capa).
+
+        Las celdas se dibujan enteras, sin recorte, en una superficie auxiliar
+        alineada a la rejilla, con un anillo de vecinas para que lo que estas
+        dibujan sobre el borde quede igual que al dibujar la vista completa, y
+        se copia el rectángulo a la capa. Recortar cambiaría el trazado de las
+        líneas, y pygame trunca hacia cero las coordenadas negativas: así una
+        celda queda igual sea cual sea la tira en la que se dibuje."""
+        if lod.detail_level(self.cell_size) == lod.FLAT:
+            self.draw_flat_region(rect)
+            return
+
+        origin_x, origin_y = self.viewport.origin
+        size = self.cell_size
+        ring = self.viewport.ring(size)
+        first_row = (origin_y + rect.top) // size - ring
+        last_row = (origin_y + rect.bottom - 1) // size + ring
+        first_col = (origin_x + rect.left) // size - ring
+        last_col = (origin_x + rect.right - 1) // size + ring
+
+        width = (last_col - first_col + 1) * size
+        height = (last_row - first_row + 1) * size
+        scratch = self._static_scratch
+        if scratch is None or scratch.get_width() < width or scratch.get_height() < height:
+            scratch = self._static_scratch = pygame.Surface((width, height))
+
+        screen = self.screen
+        self.screen = self.effects.screen = self.decorations.screen = scratch
+        try:
+            # Fondo negro (igual que las celdas EMPTY/no visitadas)
+            scratch.fill((0, 0, 0), (0, 0, width, height))
+            for board_row in range(max(0, first_row), min(self.size - 1, last_row) + 1):
+                y = (board_row - first_row) * size
+                for board_col in range(max(0, first_col), min(self.size - 1, last_col) + 1):
+                    self.draw_cell_static(board_row, board_col, (board_col - first_col) * size, y)
+        finally:
+            self.screen = self.effects.screen = self.decorations.screen = screen
+
+        # Esquina de la superficie auxiliar en coordenadas de la capa
+        base_x = first_col * size - origin_x
+        base_y = first_row * size - origin_y
+        self.viewport.surface.blit(scratch, rect.topleft, rect.move(-base_x, -base_y))
+
+    def draw_flat_region(self, rect):
+        """Redibuja rect en la capa estática desde la vista del tablero completo."""
+        # La luz de la espada solo cambia la celda del jugador: se redibuja esa
+        # celda en vez de tener una vista por posición
+        sword_cell = self.lighting.sword_light_position
+        if sword_cell != self._overview_sword_cell:
+            for position in (self._overview_sword_cell, sword_cell):
+                if position is not None:
+                    self.overview.mark_dirty(*position)
+            self._overview_sword_cell = sword_cell
+
+        signature = (self.cell_size, self.lighting.torches_lit, self.show_path)
+        overview = self.overview.update(signature, self.cell_size, self.draw_overview_region)
+        # Fuera del tablero, negro
+        layer = self.viewport.surface
+        layer.fill((0, 0, 0), rect)
+        layer.blit(overview, rect.topleft, rect.move(self.viewport.origin))
+
+    def draw_overview_region(self, surface, rect):
+        """Redibuja rect (píxeles del tablero) en una vista del tablero completo.
+
+        Solo pueden verse las celdas visitadas, las del camino con F4 y sus
+        vecinas (luz que entra por una salida, barranco revelado)."""
+        size = self.cell_size
+        first_row, last_row = rect.top // size, (rect.bottom - 1) // size
+        first_col, last_col = rect.left // size, (rect.right - 1) // size
+        area = (last_row - first_row + 1) * (last_col - first_col + 1)
+        if area <= len(self.visited_cells):
+            # Pocas celdas (una celda sucia y su entorno): recorrerlas todas
+            candidates = [(row, col) for row in range(first_row, last_row + 1)
+                          for col in range(first_col, last_col + 1)]
+        else:
+            candidates = set(self.visited_cells)
+            for row, col in self.visited_cells:
+                candidates.update(((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)))
+            if self.show_path:
+                candidates.update(self.main_path)
+
+        cells = []
+        for row, col in candidates:
+            if first_row <= row <= last_row and first_col <= col <= last_col and \
+                    0 <= row < self.size and 0 <= col < self.size:
+                colors = self.flat_cell_colors(row, col)
+                if colors is not None:
+                    cells.append((row, col) + colors)
+        self.flat_cells.draw(surface, rect, (0, 0), size, cells)
+
+    def flat_cell_colors(self, board_row, board_col):
+        """Cómo se ve una celda plana: (máscara de salidas, ancha, color del
+        bloque, color del camino), o None si se ve negra.
+
+        Sigue a draw_cell_static: bloque del color de las paredes y camino del
+        color del suelo, con el tinte azul de F4 encima."""
+        cell = self.board[board_row][board_col]
+        barranco_color = (4, 4, 5)
+        if self.is_barranco_cell(board_row, board_col):
+            if not self.is_barranco_revealed(board_row, board_col):
+                return None
+            return (0, False, barranco_color, barranco_color)
+        if self.is_bridge_cell(board_row, board_col):
+            if not self.is_barranco_revealed(board_row, board_col):
+                return None
+            # El puente cruza el barranco de lado a lado
+            deck = (Direction.N, Direction.S) if self.barranco_axis == 'row' else (Direction.E, Direction.O)
+            return (lod.exit_mask(deck), False, barranco_color, (94, 64, 36))
+
+        on_path = self.show_path and (board_row, board_col) in self.main_path
+        if (board_row, board_col) not in self.visited_cells and not on_path:
+            if self.light_spill_direction(board_row, board_col) is None:
+                return None
+            # Media del degradado de luz que entra por la salida
+            value = self.light_spill_brightness(board_row, board_col, cell) // 2
+            return (0, False, (value, value, value), (value, value, value))
+
+        if cell.cell_type == CellType.EMPTY:
+            if not on_path:
+                return None
+            block = path = (0, 0, 0)
+        else:
+            brightness = self.get_cell_brightness(board_row, board_col)
+            torch_count = self.count_torches(board_row, board_col, cell)
+            wall = int((20 + min(120, torch_count * 30)) * brightness / 255.0)
+            block = (wall, wall, wall)
+            path = (brightness, brightness, brightness)
+            if self.barranco_facing_directions(board_row, board_col):
+                # El acantilado sustituye a las paredes que dan al barranco
+                block = self.effects.CLIFF_BASE_COLOR
+        if on_path:
+            # Mismo tinte que el overlay azul (alpha 80) de draw_cell_static
+            block = tuple(c + (t - c) * 80 // 255 for c, t in zip(block, (0, 100, 255)))
+            path = tuple(c + (t - c) * 80 // 255 for c, t in zip(path, (0, 100, 255)))
+        wide = cell.cell_type in (CellType.HABITACION, CellType.INICIO)
+        return (lod.exit_mask(cell.exits), wide, block, path)
+
+    def _visible_cell_bounds(self, origin):
+        """Filas y columnas (primera, última) visibles con la capa en origin."""
+        origin_x, origin_y = origin
+        size = self.cell_size
+        return (origin_y // size, (origin_y + self.height - 1) // size,
+                origin_x // size, (origin_x + self.width - 1) // size)
+
+    def draw_decals(self, origin):
+        """Capa de calcos: huellas húmedas de las celdas visibles.
+
+        Devuelve las zonas dibujadas."""
+        first_row, last_row, first_col, last_col = self._visible_cell_bounds(origin)
+        size = self.cell_size
+        rects = []
+        for position in sorted(self.monster_footprints):
+            board_row, board_col = position
+            if not (first_row <= board_row <= last_row and first_col <= board_col <= last_col):
+                continue
+            # Las huellas solo se ven en celdas dibujadas por completo
+            if position in self.visited_cells or (self.show_path and position in self.main_path):
+                if not self.is_barranco_cell(*position) and not self.is_bridge_cell(*position):
+                    x = board_col * size - origin[0]
+                    y = board_row * size - origin[1]
+                    self.draw_cell_decals(board_row, board_col, x, y)
+                    rects.append(self._animated_cell_rect(x, y))
+        return rects
+
+    def draw_animated_cells(self, origin):
+        """Capa de decoración animada: antorchas, fuente y polvo visibles.
+
+        Devuelve las zonas dibujadas."""
+        first_row, last_row, first_col, last_col = self._visible_cell_bounds(origin)
+        size = self.cell_size
+        rects = []
+        for board_row, board_col in sorted(self._animated_cells):
+            if first_row <= board_row <= last_row and first_col <= board_col <= last_col:
+                x = board_col * size - origin[0]
+                y = board_row * size - origin[1]
+                self.draw_cell_decorations(board_row, board_col, x, y)
+                rects.append(self._animated_cell_rect(x, y))
+        return rects
+
+    def _animated_cell_rect(self, x, y):
+        """Rectángulo de una celda animada con lo que se sale de ella."""
+        overflow = compositor.ANIMATED_OVERFLOW
+        return pygame.Rect(x - overflow, y - overflow, self.cell_size + 2 * overflow,
+                           self.cell_size + 2 * overflow)
+
+    def mark_cell_dirty(self, row, col):
+        """Una celda ha cambiado (visitada, colocada): redibujarla en la capa
+        estática y en la vista del tablero completo."""
+        self.viewport.mark_dirty(row, col)
+        self.overview.mark_dirty(row, col)
+
+    def _sync_visited_cells(self):
+        """Marca como sucias en la capa estática las celdas recién visitadas."""
+        if len(self.visited_cells) == len(self._synced_visited_cells):
+            return
+        if len(self.visited_cells) < len(self._synced_visited_cells):
+            self._synced_visited_cells = set()
+            self._animated_cells = set()
+            self.viewport.invalidate()
+            self.overview.invalidate()
+
+        for position in self.visited_cells - self._synced_visited_cells:
+            self.mark_cell_dirty(*position)
+            row, col = position
+            if self._torch_grid[row * self.size + col] or self.board[row][col].cell_type == CellType.INICIO:
+                self._animated_cells.add(position)
+        self._synced_visited_cells = set(self.visited_cells)
+
+    def draw_cell_decals(self, board_row, board_col, x, y):
+        """Dibuja las huellas de monstruos de una celda."""
+        if (board_row, board_col) in self.monster_footprints:
+            self.decorations.draw_wet_footprints(x, y, self.monster_footprints[(board_row, board_col)])
+
+    def draw_cell_decorations(self, board_row, board_col, x, y):
+        """Dibuja la fuente, el polvo y las antorchas de una celda."""
+        cell = self.board[board_row][board_col]
+
+        # Fuente y polvo de la celda de inicio (iluminación de 4 antorchas)
+        if cell.cell_type == CellType.INICIO:
+            brightness_factor = (4 * 31) / 255.0
+            self.decorations.draw_fountain(x, y, brightness_factor)
+            self.decorations.draw_dust_particles(x, y, board_row, board_col, brightness_factor)
+
+        # Dibujar antorchas al final (encima de todo)
+        # SOLO en celdas visitadas (no en celdas reveladas pero no visitadas)
+        if (board_row, board_col) in self.visited_cells:
+            if cell.cell_type in [CellType.INICIO, CellType.PASILLO, CellType.HABITACION, CellType.SALIDA]:
+                num_torches = self.count_torches(board_row, board_col, cell, include_sword=False)
+                barranco_dirs = self.barranco_facing_directions(board_row, board_col)
+                self.decorations.draw_torches(board_row, board_col, x, y, cell, num_torches, barranco_dirs)
+
+    def draw_cell_static(self, board_row, board_col, x, y):
+        """Dibuja la parte estática de una celda en (x, y).
+
+        Retorna True si la celda se ha dibujado por completo (visitada o
+        revelada por F4) y lleva encima su parte animada."""
         cell = self.board[board_row][board_col]
-        x = view_col * self.cell_size - pixel_offset_x
-        y = view_row * self.cell_size - pixel_offset_y
 
         # El barranco (y los puentes que lo cruzan) no se ven hasta estar en una
         # celda adyacente, igual que el resto del mapa sin explorar
@@ -2381,96 +2404,37 @@ class DungeonBoard:
                 self.draw_barranco_cell(x, y, board_row, board_col)
             else:
                 pygame.draw.rect(self.screen, (0, 0, 0), (x, y, self.cell_size, self.cell_size))
-            return
+            return False
 
         if self.is_bridge_cell(board_row, board_col):
             if self.is_barranco_revealed(board_row, board_col):
                 self.draw_bridge_cell(x, y, board_row, board_col)
             else:
                 pygame.draw.rect(self.screen, (0, 0, 0), (x, y, self.cell_size, self.cell_size))
-            return
+            return False
 
         # Inicializar variables de color y brillo
         floor_color = (0, 0, 0)
         brightness_factor = 0.0
+        detail = lod.detail_level(self.cell_size)
         
         # Verificar si esta celda debe ser revelada por show_path
-        should_reveal_for_path = False
-        should_light = False
-        if self.show_path and (board_row, board_col) in self.main_path:
-            should_reveal_for_path = True
-        else:
-            # Verificar si es adyacente a alguna celda del camino
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                adj_row, adj_col = board_row + dr, board_col + dc
-                if (adj_row, adj_col) in self.main_path and (adj_row, adj_col) in self.visited_cells:
-                    # Verificar si hay una salida desde la celda del camino hacia esta celda
-                    adj_cell = self.board[adj_row][adj_col]
-                    # Determinar la dirección desde la celda adyacente hacia esta celda
-                    if dr == -1:  # vecino arriba mira hacia abajo (S)
-                        if Direction.S in adj_cell.exits:
-                            should_light = True
-                            break
-                    elif dr == 1:  # vecino abajo mira hacia arriba (N)
-                        if Direction.N in adj_cell.exits:
-                            should_light = True
-                            break
-                    elif dc == -1:  # vecino izquierda mira hacia derecha (E)
-                        if Direction.E in adj_cell.exits:
-                            should_light = True
-                            break
-                    elif dc == 1:  # vecino derecha mira hacia izquierda (O)
-                        if Direction.O in adj_cell.exits:
-                            should_light = True
-                            break
-        
+        should_reveal_for_path = self.show_path and (board_row, board_col) in self.main_path
+
         # Si la celda no ha sido visitada, dibujar niebla negra
         # EXCEPCIÓN: Si show_path está activo y debe revelarse, mostrarla
-        if (board_row, board_col) not in self.visited_cells:
-            if should_reveal_for_path:
-                pass  # Continuar con el renderizado normal pero con overlay
-            elif should_light:
-                # Calcular número de antorchas para iluminación
-                torch_count = self.count_torches(board_row, board_col, cell)
-                base_brightness = 10
-                torch_brightness = min(130, torch_count * 31)
-                brightness = max(0, base_brightness + torch_brightness) // 2
-                color = (brightness, brightness, brightness)
-                # Detectar dirección de la luz
-                for dr, dc, direction in [(-1, 0, Direction.N), (1, 0, Direction.S), (0, 1, Direction.E), (0, -1, Direction.O)]:
-                    adj_row, adj_col = board_row + dr, board_col + dc
-                    if (adj_row, adj_col) in self.main_path and (adj_row, adj_col) in self.visited_cells:
-                        adj_cell = self.board[adj_row][adj_col]
-                        if (direction == Direction.N and Direction.S in adj_cell.exits) or \
-                           (direction == Direction.S and Direction.N in adj_cell.exits) or \
-                           (direction == Direction.E and Direction.O in adj_cell.exits) or \
-                           (direction == Direction.O and Direction.E in adj_cell.exits):
-                            # Crear gradiente en la dirección correspondiente
-                            overlay = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-                            for i in range(self.cell_size):
-                                # Interpolación lineal del color
-                                t = i / self.cell_size
-                                grad_color = (
-                                    int(color[0] * (1-t)),
-                                    int(color[1] * (1-t)),
-                                    int(color[2] * (1-t)),
-                                    255
-                                )
-                                if direction == Direction.N:
-                                    pygame.draw.line(overlay, grad_color, (0, i), (self.cell_size, i))
-                                elif direction == Direction.S:
-                                    pygame.draw.line(overlay, grad_color, (0, self.cell_size-1-i), (self.cell_size, self.cell_size-1-i))
-                                elif direction == Direction.E:
-                                    pygame.draw.line(overlay, grad_color, (self.cell_size-1-i, 0), (self.cell_size-1-i, self.cell_size))
-                                elif direction == Direction.O:
-                                    pygame.draw.line(overlay, grad_color, (i, 0), (i, self.cell_size))
-                            self.screen.blit(overlay, (x, y))
-                            break
-                return
-            else:
+        # (se continúa con el renderizado normal pero con overlay)
+        if (board_row, board_col) not in self.visited_cells and not should_reveal_for_path:
+            direction = self.light_spill_direction(board_row, board_col)
+            if direction is None:
                 pygame.draw.rect(self.screen, (0, 0, 0), (x, y, self.cell_size, self.cell_size))
-                return
-        
+                return False
+
+            # Luz que entra por la salida de la vecina visitada (degradado cacheado)
+            brightness = self.light_spill_brightness(board_row, board_col, cell)
+            self.screen.blit(self.gradients.light_spill(direction, brightness, self.cell_size), (x, y))
+            return False
+
         # Color / textura based on type
         torch_by_dir = getattr(cell, 'adjacent_torch_counts_by_dir', {})
         
@@ -2482,35 +2446,13 @@ class DungeonBoard:
             brightness_factor = brightness / 255.0
             self.draw_floor_and_walls(board_row, board_col, x, y, cell, floor_color, brightness_factor)
         elif cell.cell_type == CellType.PASILLO:
-            torch_count = self.count_torches(board_row, board_col, cell)
-            # Calcular oscurecimiento basado en distancia desde la entrada
-            start_row, start_col = self.start_position
-            exit_row, exit_col = self.exit_position
-            distance_from_start = abs(start_row - board_row) + abs(start_col - board_col)
-            total_distance = abs(exit_row - start_row) + abs(exit_col - start_col)
-            if total_distance > 0:
-                progress = distance_from_start / total_distance
-            else:
-                progress = 0.5
-            base_brightness = int(20 * (1.0 - progress))
-            torch_brightness = min(130, torch_count * 31)
-            brightness = max(0, base_brightness + torch_brightness)
+            # Oscurecimiento por distancia desde la entrada + antorchas
+            brightness = self.get_cell_brightness(board_row, board_col)
             floor_color = (brightness, brightness, brightness)
             brightness_factor = brightness / 255.0
             self.draw_floor_and_walls(board_row, board_col, x, y, cell, floor_color, brightness_factor)
         elif cell.cell_type == CellType.HABITACION:
-            torch_count = self.count_torches(board_row, board_col, cell)
-            start_row, start_col = self.start_position
-            exit_row, exit_col = self.exit_position
-            distance_from_start = abs(start_row - board_row) + abs(start_col - board_col)
-            total_distance = abs(exit_row - start_row) + abs(exit_col - start_col)
-            if total_distance > 0:
-                progress = distance_from_start / total_distance
-            else:
-                progress = 0.5
-            base_brightness = int(20 * (1.0 - progress))
-            torch_brightness = min(130, torch_count * 31)
-            brightness = max(0, base_brightness + torch_brightness)
+            brightness = self.get_cell_brightness(board_row, board_col)
             floor_color = (brightness, brightness, brightness)
             brightness_factor = brightness / 255.0
             self.draw_floor_and_walls(board_row, board_col, x, y, cell, floor_color, brightness_factor)
@@ -2535,10 +2477,7 @@ class DungeonBoard:
                     ))
             # Las líneas se dibujan más adelante (después de las piedras, antes de la sangre)
         elif cell.cell_type == CellType.SALIDA:
-            torch_count = self.count_torches(board_row, board_col, cell)
-            base_brightness = 40
-            torch_brightness = min(130, torch_count * 31)
-            brightness = max(0, base_brightness + torch_brightness)
+            brightness = self.get_cell_brightness(board_row, board_col)
             room_color = (brightness, brightness, brightness)
             brightness_factor = brightness / 255.0
             
@@ -2573,82 +2512,33 @@ class DungeonBoard:
         # Marcar celdas del camino principal si show_path está activo
         if self.show_path and (board_row, board_col) in self.main_path:
             # Overlay azul semitransparente sobre la celda
-            overlay = pygame.Surface((self.cell_size, self.cell_size))
-            overlay.set_alpha(80)
-            overlay.fill((0, 100, 255))
+            overlay = self.screen_effects.tint('path', (0, 100, 255), 80, (self.cell_size, self.cell_size))
             self.screen.blit(overlay, (x, y))
         
         # Para pasillos, habitaciones, inicio y salida: dibujar camino desde el centro hacia las salidas
         if cell.cell_type in [CellType.PASILLO, CellType.HABITACION, CellType.INICIO, CellType.SALIDA]:
             # Para habitaciones e inicio, la zona central es mucho más ancha
-            if cell.cell_type in [CellType.HABITACION, CellType.INICIO]:
-                center_x_L = x + 0.15*self.cell_size
-                center_x_R = x + 0.85*self.cell_size
-                center_y_D = y + 0.15*self.cell_size
-                center_y_U = y + 0.85*self.cell_size
-                mid_x_L = x + 0.15*self.cell_size
-                mid_x_R = x + 0.85*self.cell_size
-                mid_y_D = y + 0.15*self.cell_size
-                mid_y_U = y + 0.85*self.cell_size
-            else:  # PASILLO
-                center_x_L = x + 0.8*self.cell_size // 2
-                center_x_R = x + 1.2*self.cell_size // 2
-                center_y_D = y + 0.8*self.cell_size // 2
-                center_y_U = y + 1.2*self.cell_size // 2
-                mid_x_L = x + 0.8*self.cell_size // 2
-                mid_x_R = x + 1.2*self.cell_size // 2
-                mid_y_D = y + 0.8*self.cell_size // 2
-                mid_y_U = y + 1.2*self.cell_size // 2
-            
-            # Helper para color de líneas
-            def get_line_color(direction=None):
-                if self.lighting.lines_darkening_enabled:
-                    # MODO F5: Contraste alto
-                    return (150, 150, 150)
-                else:
-                    # MODO NORMAL: Un par de puntos más oscuro que el suelo
-                    line_brightness = max(0, floor_color[0] - 20)
-                    return (line_brightness, line_brightness, line_brightness)
+            wide = cell.cell_type in [CellType.HABITACION, CellType.INICIO]
             
-            # North
-            if Direction.N in cell.exits:
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (mid_x_L, center_y_D), (mid_x_L, y + 0.1*self.cell_size), 3, board_row, board_col, 1)
-                self.effects.draw_broken_line(inner_color, (mid_x_R, center_y_D), (mid_x_R, y + 0.1*self.cell_size), 3, board_row, board_col, 2)
+            # Zoom medio: líneas rectas en vez de quebradas
+            if detail == lod.FULL:
+                draw_line = self.effects.draw_broken_line
             else:
-                # Cerrar el norte si no hay salida (siempre gris oscuro)
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (mid_x_L, center_y_D), (mid_x_R, center_y_D), 3, board_row,  board_col, 3)
-            
-            # South
-            if Direction.S in cell.exits:
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (mid_x_L, center_y_U), (mid_x_L, y + 0.9*self.cell_size), 3, board_row, board_col, 4)
-                self.effects.draw_broken_line(inner_color, (mid_x_R, center_y_U), (mid_x_R, y + 0.9*self.cell_size), 3, board_row, board_col, 5)
-            else:
-                # Cerrar el sur si no hay salida (siempre gris oscuro)
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (mid_x_L, center_y_U), (mid_x_R, center_y_U), 3, board_row, board_col, 6)
-            
-            # East
-            if Direction.E in cell.exits:
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (center_x_R, mid_y_D), (x + 0.9*self.cell_size, mid_y_D), 3, board_row, board_col, 7)
-                self.effects.draw_broken_line(inner_color, (center_x_R, mid_y_U), (x + 0.9*self.cell_size, mid_y_U), 3, board_row, board_col, 8)
+                draw_line = self.effects.draw_straight_line
+
+            # Color de líneas
+            if self.lighting.lines_darkening_enabled:
+                # MODO F5: Contraste alto
+                inner_color = (150, 150, 150)
             else:
-                # Cerrar el este si no hay salida (siempre gris oscuro)
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (center_x_R, mid_y_D), (center_x_R, mid_y_U), 3, board_row, board_col, 9)
+                # MODO NORMAL: Un par de puntos más oscuro que el suelo
+                line_brightness = max(0, floor_color[0] - 20)
+                inner_color = (line_brightness, line_brightness, line_brightness)
             
-            # West
-            if Direction.O in cell.exits:
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (center_x_L, mid_y_D), (x + 0.1*self.cell_size, mid_y_D), 3, board_row, board_col, 10)
-                self.effects.draw_broken_line(inner_color, (center_x_L, mid_y_U), (x + 0.1*self.cell_size, mid_y_U), 3, board_row, board_col, 11)
-            else:
-                # Cerrar el oeste si no hay salida (siempre gris oscuro)
-                inner_color = get_line_color()
-                self.effects.draw_broken_line(inner_color, (center_x_L, mid_y_D), (center_x_L, mid_y_U), 3, board_row, board_col, 12)
+            # Dos líneas por salida y una que cierra cada lado sin salida (receta por máscara)
+            geometry = geometry_for(self.cell_size)
+            for (ax, ay), (bx, by), line_id in geometry.inner_lines(wide, lod.exit_mask(cell.exits)):
+                draw_line(inner_color, (x + ax, y + ay), (x + bx, y + by), 3, board_row, board_col, line_id)
         
         # Draw exits
         if cell.cell_type != CellType.EMPTY:
@@ -2659,311 +2549,120 @@ class DungeonBoard:
             self.decorations.draw_blood_stains(board_row, board_col, x, y, brightness_factor, self.exit_position)
         elif cell.cell_type == CellType.SALIDA:
             self.decorations.draw_blood_stains(board_row, board_col, x, y, brightness_factor, self.exit_position)
-            
-        # Dibujar huellas de monstruos
-        if (board_row, board_col) in self.monster_footprints:
-            self.decorations.draw_wet_footprints(x, y, self.monster_footprints[(board_row, board_col)])
-        
-        # Dibujar fuente y escaleras después de la sangre
-        if cell.cell_type == CellType.INICIO:
-            self.decorations.draw_fountain(x, y, brightness_factor)
-            self.decorations.draw_dust_particles(x, y, board_row, board_col, brightness_factor)
-        elif cell.cell_type == CellType.SALIDA:
+
+        # Escaleras después de la sangre (la fuente, animada, va en draw_cell_decorations)
+        if cell.cell_type == CellType.SALIDA:
             self.decorations.draw_spiral_stairs(x, y)
         
-        # Dibujar telarañas en habitaciones
-        if cell.cell_type == CellType.HABITACION:
+        # Dibujar telarañas en habitaciones (no se distinguen en zooms medios)
+        if cell.cell_type == CellType.HABITACION and detail == lod.FULL:
             self.decorations.draw_cobwebs(x, y, board_row, board_col, brightness_factor)
-            
-        # Dibujar antorchas al final (encima de todo)
-        # SOLO en celdas visitadas (no en celdas reveladas pero no visitadas)
-        if (board_row, board_col) in self.visited_cells:
-            if cell.cell_type in [CellType.INICIO, CellType.PASILLO, CellType.HABITACION, CellType.SALIDA]:
-                num_torches = self.count_torches(board_row, board_col, cell, include_sword=False)
-                barranco_dirs = self.barranco_facing_directions(board_row, board_col)
-                self.decorations.draw_torches(board_row, board_col, x, y, cell, num_torches, barranco_dirs)
+        return True
     
-    def draw_exits(self, row,  col, x, y, exits, cell_type):
-
-        # --- Variables y funciones auxiliares internas ---
-        delta = {
-            Direction.N: (-1, 0),
-            Direction.S: (1, 0),
-            Direction.E: (0, 1),
-            Direction.O: (0, -1),
-        }
-
-        def neighbor_coords(dir_: Direction):
-            dr, dc = delta[dir_]
-            return row + dr, col + dc
+    def light_spill_direction(self, board_row, board_col):
+        """Dirección desde la que entra luz a una celda sin visitar: la de una
+        vecina visitada del camino principal con salida hacia ella (o None).
+
+        Se consulta en la frontera iluminada, que se pone al día al visitar celdas."""
+        self._sync_lit_frontier()
+        return self._lit_frontier.get((board_row, board_col))
+
+    def _sync_lit_frontier(self):
+        """Pone al día la frontera iluminada con las celdas visitadas desde la
+        última vez: solo cambian las vecinas de las visitadas del camino principal."""
+        if len(self.visited_cells) == len(self._frontier_visited_cells):
+            return
+        if len(self.visited_cells) < len(self._frontier_visited_cells):
+            self._lit_frontier = {}
+            self._frontier_visited_cells = set()
 
-        def get_floor_color_for_cell(board_row, board_col):
-            cell = self.board[board_row][board_col]
-            if cell.cell_type == CellType.EMPTY:
-                return (0, 0, 0)
-            elif cell.cell_type == CellType.INICIO:
-                # Coincidir con la iluminación de draw_cell (4 antorchas)
-                brightness = 4 * 31
-                return (brightness, brightness, brightness)
-            elif cell.cell_type in [CellType.PASILLO, CellType.HABITACION]:
-                torch_count = self.count_torches(board_row, board_col, cell)
-                start_row, start_col = self.start_position
-                exit_row, exit_col = self.exit_position
-                distance_from_start = abs(start_row - board_row) + abs(start_col - board_col)
-                total_distance = abs(exit_row - start_row) + abs(exit_col - start_col)
-                if total_distance > 0:
-                    progress = distance_from_start / total_distance
+        for row, col in self.visited_cells - self._frontier_visited_cells:
+            if (row, col) not in self.main_path:
+                continue
+            for neighbor in [(row - 1, col), (row + 1, col), (row, col + 1), (row, col - 1)]:
+                direction = self._scan_light_spill(*neighbor)
+                if direction is None:
+                    self._lit_frontier.pop(neighbor, None)
                 else:
-                    progress = 0.5
-                base_brightness = int(20 * (1.0 - progress))
-                torch_brightness = min(130, torch_count * 31)
-                brightness = max(0, base_brightness + torch_brightness)
-                return (brightness, brightness, brightness)
-            elif cell.cell_type == CellType.SALIDA:
-                torch_count = self.count_torches(board_row, board_col, cell)
-                base_brightness = 40
-                torch_brightness = min(130, torch_count * 31)
-                brightness = max(0, base_brightness + torch_brightness)
-                return (brightness, brightness, brightness)
-            else:
-                return (0, 0, 0)
+                    self._lit_frontier[neighbor] = direction
+        self._frontier_visited_cells = set(self.visited_cells)
+
+    def _scan_light_spill(self, board_row, board_col):
+        """Recorre las vecinas de una celda buscando la que la ilumina."""
+        for dr, dc, direction in [(-1, 0, Direction.N), (1, 0, Direction.S), (0, 1, Direction.E), (0, -1, Direction.O)]:
+            adj_row, adj_col = board_row + dr, board_col + dc
+            if (adj_row, adj_col) in self.main_path and (adj_row, adj_col) in self.visited_cells:
+                if self.get_opposite_direction(direction) in self.board[adj_row][adj_col].exits:
+                    return direction
+        return None
+
+    def light_spill_brightness(self, board_row, board_col, cell):
+        """Brillo con el que empieza el degradado de luz de una celda sin visitar."""
+        torch_count = self.count_torches(board_row, board_col, cell)
+        base_brightness = 10
+        torch_brightness = min(130, torch_count * 31)
+        return max(0, base_brightness + torch_brightness) // 2
 
-        def draw_floor_connection(direction):
-            nr, nc = neighbor_coords(direction)
+    def draw_exits(self, row,  col, x, y, exits, cell_type):
+        """Dibuja las conexiones de suelo con las vecinas y, en modo F5, las líneas de las salidas."""
+        geometry = geometry_for(self.cell_size)
+        board = self.board
+
+        # --- Conexiones de suelo: degradado del borde (brillo medio) al centro ---
+        brightness = None
+        for direction in DIRECTIONS:
+            if direction not in exits:
+                continue
+            dr, dc = DELTAS[direction]
+            nr, nc = row + dr, col + dc
             if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                if neighbor.cell_type != CellType.EMPTY and self.get_opposite_direction(direction) in neighbor.exits:
-                    color1 = get_floor_color_for_cell(row, col)
-                    color2 = get_floor_color_for_cell(nr, nc)
-                    
-                    # Usar brillo para gradiente (asumiendo escala de grises)
-                    b1 = color1[0]
-                    b2 = color2[0]
-                    avg_b = (b1 + b2) // 2
-                    
-                    rect_thickness = int(self.cell_size * 0.22)
-                    
-                    if direction == Direction.N:
-                        rx = x + int(self.cell_size * 0.28)
-                        ry = y
-                        rw = int(self.cell_size * 0.44)
-                        rh = rect_thickness
-                        # Gradiente: Borde (avg) -> Centro (b1)
-                        self.draw_gradient_rect(rx, ry, rw, rh, avg_b, b1, vertical=True)
-                    elif direction == Direction.S:
-                        rx = x + int(self.cell_size * 0.28)
-                        ry = y + self.cell_size - rect_thickness
-                        rw = int(self.cell_size * 0.44)
-                        rh = rect_thickness
-                        # Gradiente: Centro (b1) -> Borde (avg)
-                        self.draw_gradient_rect(rx, ry, rw, rh, b1, avg_b, vertical=True)
-                    elif direction == Direction.E:
-                        rx = x + self.cell_size - rect_thickness
-                        ry = y + int(self.cell_size * 0.28)
-                        rw = rect_thickness
-                        rh = int(self.cell_size * 0.44)
-                        # Gradiente: Centro (b1) -> Borde (avg)
-                        self.draw_gradient_rect(rx, ry, rw, rh, b1, avg_b, vertical=False)
-                    elif direction == Direction.O:
-                        rx = x
-                        ry = y + int(self.cell_size * 0.28)
-                        rw = rect_thickness
-                        rh = int(self.cell_size * 0.44)
-                        # Gradiente: Borde (avg) -> Centro (b1)
-                        self.draw_gradient_rect(rx, ry, rw, rh, avg_b, b1, vertical=False)
-
-        # --- Dibujo de conexiones y círculos de borde ---
-        for direction in [Direction.N, Direction.S, Direction.E, Direction.O]:
-            if direction in exits:
-                draw_floor_connection(direction)
-
-        # --- Dibujo de líneas y agujeros de salida (resto de la función original) ---
-        exit_size = 5
-        mid_x_L = x + 0.8*self.cell_size // 2
-        mid_x_R = x + 1.2*self.cell_size // 2
-        mid_y_D = y + 0.8*self.cell_size // 2
-        mid_y_U = y + 1.2*self.cell_size // 2
+                neighbor = board[nr][nc]
+                if neighbor.cell_type != CellType.EMPTY and OPPOSITES[direction] in neighbor.exits:
+                    # Coincidir con la iluminación de draw_cell_static
+                    if brightness is None:
+                        brightness = self.get_cell_brightness(row, col)
+                    avg_b = (brightness + self.get_cell_brightness(nr, nc)) // 2
+                    rx, ry, rw, rh, vertical, edge_first = geometry.floor_connections[direction]
+                    start, end = (avg_b, brightness) if edge_first else (brightness, avg_b)
+                    self.draw_gradient_rect(x + rx, y + ry, rw, rh, start, end, vertical=vertical)
+
+        # --- Líneas y tachones de las salidas (solo en modo F5) ---
+        if not self.lighting.lines_darkening_enabled:
+            return
         exit_color = (150, 150, 150)
         exit_thickness = 8
+        for direction in DIRECTIONS:
+            dr, dc = DELTAS[direction]
+            nr, nc = row + dr, col + dc
+            inside = 0 <= nr < self.size and 0 <= nc < self.size
+            neighbor = board[nr][nc] if inside else None
+            neighbor_empty = inside and neighbor.cell_type == CellType.EMPTY
+            connected = inside and not neighbor_empty and OPPOSITES[direction] in neighbor.exits
 
-        def is_at_edge(dir_: Direction) -> bool:
-            """Retorna True si la salida está hacia el borde del tablero."""
-            nr, nc = neighbor_coords(dir_)
-            return not (0 <= nr < self.size and 0 <= nc < self.size)
-
-        def should_draw_cross(dir_: Direction) -> bool:
-            """Retorna True si se debe dibujar una cruz en esta salida."""
-            nr, nc = neighbor_coords(dir_)
-            if not (0 <= nr < self.size and 0 <= nc < self.size):
-                return False
-            neighbor = self.board[nr][nc]
-            if neighbor.cell_type == CellType.EMPTY:
-                return False
-            opposite = self.get_opposite_direction(dir_)
-            # Dibujar cruz si la vecina tiene la salida complementaria pero yo no tengo la salida hacia ella
-            return opposite in neighbor.exits and dir_ not in exits
-
-        # North
-        if Direction.N in exits:
-            nr, nc = neighbor_coords(Direction.N)
-            connected = False
-            neighbor_empty = False
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                opposite = self.get_opposite_direction(Direction.N)
-                neighbor_empty = (neighbor.cell_type == CellType.EMPTY)
-                if neighbor.cell_type != CellType.EMPTY and opposite in neighbor.exits:
-                    connected = True
-
-            # Dibuja la línea negra gruesa
-            if self.lighting.lines_darkening_enabled:
-                self.effects.draw_broken_line(exit_color, (mid_x_L, y), (mid_x_L, y + 0.1*self.cell_size), exit_thickness, row, col, 20)
-                self.effects.draw_broken_line(exit_color, (mid_x_R, y), (mid_x_R, y + 0.1*self.cell_size), exit_thickness, row, col, 21)
-            # Si está al borde o la vecina no tiene la salida complementaria, tachar la salida en negro
-            if is_at_edge(Direction.N) or (not connected and not neighbor_empty):
-                if self.lighting.lines_darkening_enabled:
-                    self.effects.draw_broken_line(exit_color, (mid_x_L, y + 0.05*self.cell_size), (mid_x_R, y + 0.05*self.cell_size), exit_thickness, row, col, 22)
-
-        # North (complementaria): si la vecina tiene N pero yo no, dibujar cruz en la vecina
-        if Direction.N not in exits:
-            nr, nc = neighbor_coords(Direction.N)
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                if neighbor.cell_type != CellType.EMPTY:
-                    opposite = self.get_opposite_direction(Direction.N)
-                    if opposite in neighbor.exits:
-                        # Dibujar cruz en la abertura N de la vecina (que es S desde la perspectiva de la vecina)
-                        # La vecina está al norte, así que su abertura S está al sur de su celda
-                        neighbor_y = nr * self.cell_size
-                        neighbor_mid_x_L = nc * self.cell_size + 0.8*self.cell_size // 2
-                        neighbor_mid_x_R = nc * self.cell_size + 1.2*self.cell_size // 2
-                        if self.lighting.lines_darkening_enabled:
-                            pygame.draw.line(self.screen, exit_color, (neighbor_mid_x_L, neighbor_y + self.cell_size - 0.05*self.cell_size), (neighbor_mid_x_R, neighbor_y + self.cell_size - 0.05*self.cell_size), 2)
-
-        # South
-        if Direction.S in exits:
-            nr, nc = neighbor_coords(Direction.S)
-            connected = False
-            neighbor_empty = False
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                opposite = self.get_opposite_direction(Direction.S)
-                neighbor_empty = (neighbor.cell_type == CellType.EMPTY)
-                if neighbor.cell_type != CellType.EMPTY and opposite in neighbor.exits:
-                    connected = True
-
-            # Dibuja la línea negra gruesa
-            if self.lighting.lines_darkening_enabled:
-                self.effects.draw_broken_line(exit_color, (mid_x_L, y + self.cell_size), (mid_x_L, y + 0.8*self.cell_size), exit_thickness, row, col, 30)
-                self.effects.draw_broken_line(exit_color, (mid_x_R, y + self.cell_size), (mid_x_R, y + 0.8*self.cell_size), exit_thickness, row, col, 31)
-            # Si está al borde o la vecina no tiene la salida complementaria, tachar
-            if is_at_edge(Direction.S) or (not connected and not neighbor_empty):
-                if self.lighting.lines_darkening_enabled:
-                    self.effects.draw_broken_line(exit_color, (mid_x_L, y + self.cell_size - 0.05*self.cell_size), (mid_x_R, y + self.cell_size - 0.05*self.cell_size), exit_thickness, row, col, 32)
-
-        # South (complementaria)
-        if Direction.S not in exits:
-            nr, nc = neighbor_coords(Direction.S)
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                if neighbor.cell_type != CellType.EMPTY:
-                    opposite = self.get_opposite_direction(Direction.S)
-                    if opposite in neighbor.exits:
-                        neighbor_y = nr * self.cell_size
-                        neighbor_mid_x_L = nc * self.cell_size + 0.8*self.cell_size // 2
-                        neighbor_mid_x_R = nc * self.cell_size + 1.2*self.cell_size // 2
-                        if self.lighting.lines_darkening_enabled:
-                            pygame.draw.line(self.screen, exit_color, (neighbor_mid_x_L, neighbor_y + 0.05*self.cell_size), (neighbor_mid_x_R, neighbor_y + 0.05*self.cell_size), 2)
-
-        # East
-        if Direction.E in exits:
-            nr, nc = neighbor_coords(Direction.E)
-            connected = False
-            neighbor_empty = False
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                opposite = self.get_opposite_direction(Direction.E)
-                neighbor_empty = (neighbor.cell_type == CellType.EMPTY)
-                if neighbor.cell_type != CellType.EMPTY and opposite in neighbor.exits:
-                    connected = True
-
-            # Dibuja la línea negra gruesa
-            if self.lighting.lines_darkening_enabled:
-                self.effects.draw_broken_line(exit_color, (x + self.cell_size, mid_y_D), (x + 0.8*self.cell_size, mid_y_D), exit_thickness, row, col, 40)
-                self.effects.draw_broken_line(exit_color, (x + self.cell_size, mid_y_U), (x + 0.8*self.cell_size, mid_y_U), exit_thickness, row, col, 41)
-            # Si está al borde o la vecina no tiene la salida complementaria, tachar
-            if is_at_edge(Direction.E) or (not connected and not neighbor_empty):
-                if self.lighting.lines_darkening_enabled:
-                    self.effects.draw_broken_line(exit_color, (x + self.cell_size - 0.05*self.cell_size, mid_y_D), (x + self.cell_size - 0.05*self.cell_size, mid_y_U), exit_thickness, row, col, 42)
-
-        # East (complementaria)
-        if Direction.E not in exits:
-            nr, nc = neighbor_coords(Direction.E)
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                if neighbor.cell_type != CellType.EMPTY:
-                    opposite = self.get_opposite_direction(Direction.E)
-                    if opposite in neighbor.exits:
-                        neighbor_x = nc * self.cell_size
-                        neighbor_mid_y_D = nr * self.cell_size + 0.8*self.cell_size // 2
-                        neighbor_mid_y_U = nr * self.cell_size + 1.2*self.cell_size // 2
-                        if self.lighting.lines_darkening_enabled:
-                            pygame.draw.line(self.screen, exit_color, (neighbor_x + 0.05*self.cell_size, neighbor_mid_y_D), (neighbor_x + 0.05*self.cell_size, neighbor_mid_y_U), 2)
-
-        # West
-        if Direction.O in exits:
-            nr, nc = neighbor_coords(Direction.O)
-            connected = False
-            neighbor_empty = False
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                opposite = self.get_opposite_direction(Direction.O)
-                neighbor_empty = (neighbor.cell_type == CellType.EMPTY)
-                if neighbor.cell_type != CellType.EMPTY and opposite in neighbor.exits:
-                    connected = True
-
-            # Dibuja la línea negra gruesa
-            if self.lighting.lines_darkening_enabled:
-                self.effects.draw_broken_line(exit_color, (x, mid_y_D), (x + 0.1*self.cell_size, mid_y_D), exit_thickness, row, col, 50)
-                self.effects.draw_broken_line(exit_color, (x, mid_y_U), (x + 0.1*self.cell_size, mid_y_U), exit_thickness, row, col, 51)
-            # Si está al borde o la vecina no tiene la salida complementaria, tachar
-            if is_at_edge(Direction.O) or (not connected and not neighbor_empty):
-                if self.lighting.lines_darkening_enabled:
-                    self.effects.draw_broken_line(exit_color, (x + 0.05*self.cell_size, mid_y_D), (x + 0.05*self.cell_size, mid_y_U), exit_thickness, row, col, 52)
-
-        # West (complementaria)
-        if Direction.O not in exits:
-            nr, nc = neighbor_coords(Direction.O)
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbor = self.board[nr][nc]
-                if neighbor.cell_type != CellType.EMPTY:
-                    opposite = self.get_opposite_direction(Direction.O)
-                    if opposite in neighbor.exits:
-                        neighbor_x = nc * self.cell_size
-                        neighbor_mid_y_D = nr * self.cell_size + 0.8*self.cell_size // 2
-                        neighbor_mid_y_U = nr * self.cell_size + 1.2*self.cell_size // 2
-                        if self.lighting.lines_darkening_enabled:
-                            pygame.draw.line(self.screen, exit_color, (neighbor_x + self.cell_size - 0.05*self.cell_size, neighbor_mid_y_D), (neighbor_x + self.cell_size - 0.05*self.cell_size, neighbor_mid_y_U), 2)
+            if direction in exits:
+                # Dibuja la línea gruesa
+                for (ax, ay), (bx, by), line_id in geometry.exit_lines[direction]:
+                    self.effects.draw_broken_line(exit_color, (x + ax, y + ay), (x + bx, y + by),
+                                                  exit_thickness, row, col, line_id)
+                # Si está al borde o la vecina no tiene la salida complementaria, tachar la salida
+                if not inside or (not connected and not neighbor_empty):
+                    (ax, ay), (bx, by), line_id = geometry.exit_crosses[direction]
+                    self.effects.draw_broken_line(exit_color, (x + ax, y + ay), (x + bx, y + by),
+                                                  exit_thickness, row, col, line_id)
+            elif connected:
+                # La vecina tiene la salida hacia aquí pero yo no: marcar su abertura
+                # (en coordenadas del tablero, como siempre se ha hecho)
+                neighbor_x = nc * self.cell_size
+                neighbor_y = nr * self.cell_size
+                (ax, ay), (bx, by) = geometry.neighbor_marks[direction]
+                pygame.draw.line(self.screen, exit_color, (neighbor_x + ax, neighbor_y + ay),
+                                 (neighbor_x + bx, neighbor_y + by), 2)
 
     def draw_gradient_rect(self, x, y, w, h, start_brightness, end_brightness, vertical=True):
-        """Dibuja un rectángulo con gradiente de brillo."""
+        """Dibuja un rectángulo con gradiente de brillo (tira cacheada)."""
         if w <= 0 or h <= 0:
             return
-            
-        if vertical:
-            for i in range(h):
-                t = i / max(1, h - 1)
-                b = int(start_brightness + (end_brightness - start_brightness) * t)
-                b = max(0, min(255, b))
-                color = (b, b, b)
-                pygame.draw.rect(self.screen, color, (x, y + i, w, 1))
-        else:
-            for i in range(w):
-                t = i / max(1, w - 1)
-                b = int(start_brightness + (end_brightness - start_brightness) * t)
-                b = max(0, min(255, b))
-                color = (b, b, b)
-                pygame.draw.rect(self.screen, color, (x + i, y, 1, h))
+        self.screen.blit(self.gradients.get(w, h, start_brightness, end_brightness, vertical), (x, y))
 
     def draw_openings(self, offset_row: int, offset_col: int, pixel_offset_x: int = 0, pixel_offset_y: int = 0):
         """Dibuja las aberturas negras entre celdas conectadas (sobre los bordes).
@@ -2971,6 +2670,10 @@ class DungeonBoard:
         Se limita el área de la apertura entre las dos 'líneas' de la salida,
         más ancha y más corta para no solapa las líneas de salida.
         """
+        geometry = geometry_for(self.cell_size)
+        low, high = geometry.corridor
+        # Grosor de la apertura en píxeles (más ancho para conectar con pasillo)
+        open_thickness = geometry.open_thickness
         for view_r in range(-1, self.view_size + 1):
             for view_c in range(-1, self.view_size + 1):
                 board_r = offset_row + view_r
@@ -2984,35 +2687,23 @@ class DungeonBoard:
                 x = view_c * self.cell_size - pixel_offset_x
                 y = view_r * self.cell_size - pixel_offset_y
 
-                # Posiciones de las dos líneas de la salida (consistentes con draw_cell)
-                mid_x_L = x + 0.8*self.cell_size // 2
-                mid_x_R = x + 1.2*self.cell_size // 2
-                mid_y_D = y + 0.8*self.cell_size // 2
-                mid_y_U = y + 1.2*self.cell_size // 2
-
-                # Grosor de la apertura en píxeles (más ancho para conectar con pasillo)
-                open_thickness = max(12, int(self.cell_size * 0.20))
-                # Largo más corto para no solapa las líneas de salida
-                open_length = max(4, int(self.cell_size * 0.10))
+                # Posiciones de las dos líneas de la salida (consistentes con draw_cell_static)
+                mid_x_L = x + low
+                mid_x_R = x + high
+                mid_y_D = y + low
+                mid_y_U = y + high
 
                 # Para cada salida, si la vecina existe y tiene la salida complementaria,
                 # dibujar un rect negro entre las dos líneas para 'abrir' la pared.
-                delta = {
-                    Direction.N: (-1, 0),
-                    Direction.S: (1, 0),
-                    Direction.E: (0, 1),
-                    Direction.O: (0, -1),
-                }
-
-                for dir_ in [Direction.N, Direction.S, Direction.E, Direction.O]:
+                for dir_ in DIRECTIONS:
                     if dir_ not in cell.exits:
                         continue
-                    dr, dc = delta[dir_]
+                    dr, dc = DELTAS[dir_]
                     nr, nc = board_r + dr, board_c + dc
                     if not (0 <= nr < self.size and 0 <= nc < self.size):
                         continue
                     neighbor = self.board[nr][nc]
-                    opposite = self.get_opposite_direction(dir_)
+                    opposite = OPPOSITES[dir_]
                     if neighbor.cell_type == CellType.EMPTY:
                         # vecina es EMPTY: la salida aparece como abierta hacia vacío — no borrar borde
                         continue
@@ -3066,28 +2757,13 @@ class DungeonBoard:
             return 0
         elif cell.cell_type == CellType.INICIO:
             return 4 * 31  # 124
-        elif cell.cell_type == CellType.SALIDA:
-            torch_count = self.count_torches(board_row, board_col, cell)
-            base_brightness = 40
-            torch_brightness = min(130, torch_count * 31)
-            return max(0, base_brightness + torch_brightness)
-        else:
-            # PASILLO, HABITACION
-            torch_count = self.count_torches(board_row, board_col, cell)
-            
-            start_row, start_col = self.start_position
-            exit_row, exit_col = self.exit_position
-            distance_from_start = abs(start_row - board_row) + abs(start_col - board_col)
-            total_distance = abs(exit_row - start_row) + abs(exit_col - start_col)
-            
-            if total_distance > 0:
-                progress = distance_from_start / total_distance
-            else:
-                progress = 0.5
-            
-            base_brightness = int(20 * (1.0 - progress))
-            torch_brightness = min(130, torch_count * 31)
-            return max(0, base_brightness + torch_brightness)
+
+        index = board_row * self.size + board_col
+        if self.has_sword_power and (board_row, board_col) == self.current_position:
+            return self.lighting.calculate_brightness(self._base_brightness_grid[index], 3)
+        if self.lighting.torches_lit:
+            return self._lit_brightness_grid[index]
+        return max(0, self._base_brightness_grid[index])
     
     def get_opposite_direction(self, direction: Direction) -> Direction:
         """Retorna la dirección opuesta."""
@@ -3100,49 +2776,8 @@ class DungeonBoard:
         return opposites.get(direction, direction)
 
     def draw_stone_texture(self, board_row: int, board_col: int, x: int, y: int):
-        """Dibuja una textura de piedra en la celda dada usando un patrón determinista por celda.
-
-        Esto crea pequeñas 'piedras' con tonos grisáceos y bordes sutiles para dar sensación de muro.
-        """
-        seed = board_row * 100000 + board_col
-        rnd = random.Random(seed)
-
-        base_color = (90, 90, 90)
-        pygame.draw.rect(self.screen, base_color, (x, y, self.cell_size, self.cell_size))
-
-        # Dibujar piedras (óvalos) distribuidos aleatoriamente pero deterministas
-        # Más relleno: más piedras y más grietas
-        num_stones = rnd.randint(36, 70)
-        for _ in range(num_stones):
-            w = rnd.randint(max(4, int(self.cell_size * 0.06)), max(6, int(self.cell_size * 0.30)))
-            h = rnd.randint(max(3, int(self.cell_size * 0.05)), max(6, int(self.cell_size * 0.22)))
-            sx = x + rnd.randint(0, max(0, self.cell_size - w))
-            sy = y + rnd.randint(0, max(0, self.cell_size - h))
-
-            shade = rnd.randint(-30, 50)
-            base_stone = (120, 120, 120)
-            stone_color = tuple(max(0, min(255, base_stone[i] + shade)) for i in range(3))
-
-            # Dibujar la piedra
-            pygame.draw.ellipse(self.screen, stone_color, (sx, sy, w, h))
-
-            # Borde más oscuro para dar volumen
-            if rnd.random() < 0.85:
-                border = tuple(max(0, c - 50) for c in stone_color)
-                try:
-                    pygame.draw.ellipse(self.screen, border, (sx, sy, w, h), 1)
-                except Exception:
-                    pass
-
-        # Añadir grietas/mortero más visibles
-        for _ in range(rnd.randint(6, 12)):
-            x1 = x + rnd.randint(0, self.cell_size)
-            y1 = y + rnd.randint(0, self.cell_size)
-            x2 = x + rnd.randint(0, self.cell_size)
-            y2 = y + rnd.randint(0, self.cell_size)
-            mortar_color = (30, 30, 30)
-            pygame.draw.line(self.screen, mortar_color, (x1, y1), (x2, y2), 2)
-
+        """Dibuja una textura de piedra en la celda dada (ver EffectsRenderer.draw_stone_texture)."""
+        self.effects.draw_stone_texture(board_row, board_col, x, y)
     
     def generate_random_exits(self, exclude_direction: Direction, cell_type: CellType, current_pos: tuple) -> set:
         """Genera salidas aleatorias según el tipo de celda, excepto la dirección de entrada.
@@ -3279,6 +2914,9 @@ class DungeonBoard:
         # Bloquear movimiento durante pensamientos que bloquean movimiento
         if self.audio.thought_active and self.audio.thought_blocks_movement:
             return
+
+        # Los conteos de antorchas de este movimiento usan la luz actual
+        self.update_lighting_epoch()
         
         # Bloquear movimiento mientras se muestra la imagen de la losa
         if self.exit_image_shown:
@@ -3503,6 +3141,7 @@ class DungeonBoard:
                             exits.add(dir_)
             
             self.board[target_row][target_col] = Cell(cell_type, exits)
+        self.mark_cell_dirty(target_row, target_col)
         
         # Reproducir sonido de paso alternando entre paso1 y paso2
         if self.footstep_sounds:
@@ -3637,119 +3276,132 @@ class DungeonBoard:
                     # Revelar todas las celdas con salidas conectadas
                     self.visited_cells.add((adj_row, adj_col))
     
-    def count_torches(self, board_row, board_col, cell, include_sword=True):
-        """Cuenta cuántas antorchas se dibujarán realmente en esta celda.
-        Solo aparecen en celdas del camino principal.
-        La probabilidad aumenta conforme se acerca a la salida."""
-        # Iluminación mágica de la espada: si el jugador está aquí y tiene poder, ilumina como 3 antorchas
-        if include_sword and self.has_sword_power and (board_row, board_col) == self.current_position:
-            return 3
-            
-        # Si las antorchas están apagadas, no hay antorchas
-        if self.torches_extinguished:
-            return 0
-        
-        # Si las antorchas están parpadeando, aplicar efecto de parpadeo
-        if self.torches_flickering:
-            current_time = pygame.time.get_ticks()
-            elapsed = current_time - self.flicker_start_time
-            
-            # Parpadeo: alternar entre visible/invisible cada vez más rápido
-            # Primeros 3 segundos: parpadeo lento (500ms)
-            # Últimos 2 segundos: parpadeo rápido (100ms)
-            if elapsed < 3000:
-                flicker_interval = 500  # Parpadeo lento
-            else:
-                flicker_interval = 100  # Parpadeo rápido
-            
-            # Alternar entre visible/invisible
-            if (elapsed // flicker_interval) % 2 == 0:
-                return 0  # Invisible (antorchas apagadas en este frame)
-            # Si es impar, continuar con la lógica normal (antorchas visibles)
-        
-        # Durante la introducción, no hay antorchas
-        if self.intro_anim_active:
-            return 0
-        
-        # Si el pensamiento de intro no ha terminado, no hay antorchas
-        if not self.intro_thought_finished:
-            return 0
-        
+    def build_lighting_grids(self):
+        """Precalcula por celda el número de antorchas, la sangre y el brillo.
+
+        Todo lo que solo depende del mapa generado (camino principal, salidas,
+        barranco, distancias, semilla por posición) se resuelve aquí una vez.
+        Las salidas del camino principal no cambian tras generarlo, y fuera de
+        él no hay antorchas, así que las rejillas son válidas toda la partida.
+        """
+        size = self.size
+        start_row, start_col = self.start_position
+        exit_row, exit_col = self.exit_position
+        total_distance = abs(exit_row - start_row) + abs(exit_col - start_col)
+
+        # Índice plano: row * size + col
+        self._torch_grid = bytearray(size * size)
+        self._blood_grid = bytearray(size * size)
+        # Brillo base sin antorchas (puede ser negativo lejos de la entrada)
+        self._base_brightness_grid = array('h', bytes(2 * size * size))
+        # Brillo final con las antorchas encendidas
+        self._lit_brightness_grid = array('h', bytes(2 * size * size))
+
+        for row in range(size):
+            for col in range(size):
+                index = row * size + col
+                seed = row * 100000 + col
+                distance_to_exit = abs(exit_row - row) + abs(exit_col - col)
+
+                # Manchas de sangre: distancia 1-10 de la salida, más probables al acercarse
+                if 1 <= distance_to_exit <= 10:
+                    probability = 1.0 - ((distance_to_exit - 1) / 9.0) * 0.7
+                    if random.Random(seed).random() <= probability:
+                        self._blood_grid[index] = 1
+
+                if (row, col) == self.exit_position:
+                    base_brightness = 40
+                else:
+                    distance_from_start = abs(start_row - row) + abs(start_col - col)
+                    base_brightness = self.lighting.calculate_base_brightness(distance_from_start, total_distance)
+
+                torches = self._count_static_torches(row, col, distance_to_exit, total_distance, seed)
+                self._torch_grid[index] = torches
+                self._base_brightness_grid[index] = base_brightness
+                self._lit_brightness_grid[index] = self.lighting.calculate_brightness(base_brightness, torches)
+
+    def _count_static_torches(self, board_row, board_col, distance_to_exit, total_distance, seed):
+        """Antorchas de una celda con todas encendidas (parte estática de count_torches)."""
         # Si no está en el camino principal, no hay antorchas
         if (board_row, board_col) not in self.main_path:
             return 0
-        
+
         # VERIFICAR DISTANCIA MÍNIMA DESDE LA ENTRADA
         entrance_row, entrance_col = self.start_position
         distance_from_entrance = abs(entrance_row - board_row) + abs(entrance_col - board_col)
         if distance_from_entrance < 5:
             return 0  # No hay antorchas si está muy cerca de la entrada
-        
-        # Calcular distancia a la salida
-        exit_row, exit_col = self.exit_position
-        distance_to_exit = abs(exit_row - board_row) + abs(exit_col - board_col)
-        
+
         # Contar cuántas paredes sin salida hay disponibles (excluyendo el lado del barranco:
         # las antorchas nunca van en el acantilado, solo en las paredes normales)
+        cell = self.board[board_row][board_col]
         barranco_dirs = set(self.barranco_facing_directions(board_row, board_col))
         available_walls = 0
-        if Direction.N not in cell.exits and Direction.N not in barranco_dirs:
-            available_walls += 1
-        if Direction.S not in cell.exits and Direction.S not in barranco_dirs:
-            available_walls += 1
-        if Direction.E not in cell.exits and Direction.E not in barranco_dirs:
-            available_walls += 1
-        if Direction.O not in cell.exits and Direction.O not in barranco_dirs:
-            available_walls += 1
-        
+        for direction in (Direction.N, Direction.S, Direction.E, Direction.O):
+            if direction not in cell.exits and direction not in barranco_dirs:
+                available_walls += 1
+
         # En la salida, garantizar al menos una antorcha
         if (board_row, board_col) == self.exit_position:
             if available_walls == 0:
                 return 0
             return max(1, available_walls)  # Al menos 1, máximo todas las paredes
-        
-        # Calcular distancia total del camino (aproximada)
-        start_row, start_col = self.start_position
-        total_distance = abs(exit_row - start_row) + abs(exit_col - start_col)
-        
+
         # Calcular probabilidad base que DISMINUYE al acercarse a la salida
         # En el inicio: ~40%, en la salida: ~10%
         if total_distance > 0:
             progress = 1.0 - (distance_to_exit / total_distance)  # 0 en inicio, 1 en salida
         else:
             progress = 0.5
-        
+
         base_probability = 0.4 - (progress * 0.3)  # 40% a 10%
-        
-        seed = board_row * 100000 + board_col
         rnd = random.Random(seed)
-        
+
         # Generar entre 0 y 4 antorchas con probabilidad variable
         desired_torches = 0
         for _ in range(4):
             if rnd.random() < base_probability:
                 desired_torches += 1
-        
+
         # Retornar el mínimo entre antorchas deseadas y paredes disponibles
         return min(desired_torches, available_walls)
+
+    def update_lighting_epoch(self):
+        """Traslada a la época de iluminación los modificadores dinámicos:
+        antorchas apagadas o parpadeando, introducción y luz de la espada."""
+        torches_lit = (not self.torches_extinguished and not self.intro_anim_active
+                       and self.intro_thought_finished)
+
+        # Parpadeo: alternar entre visible/invisible cada vez más rápido
+        # Primeros 3 segundos: parpadeo lento (500ms); después rápido (100ms)
+        if torches_lit and self.torches_flickering:
+            elapsed = pygame.time.get_ticks() - self.flicker_start_time
+            flicker_interval = 500 if elapsed < 3000 else 100
+            torches_lit = (elapsed // flicker_interval) % 2 == 1
+
+        sword_position = self.current_position if self.has_sword_power else None
+        return self.lighting.update_epoch(torches_lit, sword_position)
+
+    def count_torches(self, board_row, board_col, cell, include_sword=True):
+        """Cuenta cuántas antorchas se dibujarán realmente en esta celda.
+        Solo aparecen en celdas del camino principal.
+        La probabilidad aumenta conforme se acerca a la salida.
+
+        Consulta la rejilla precalculada (build_lighting_grids); el parpadeo,
+        el apagado y la intro llegan a través de update_lighting_epoch."""
+        # Iluminación mágica de la espada: si el jugador está aquí y tiene poder, ilumina como 3 antorchas
+        if include_sword and self.has_sword_power and (board_row, board_col) == self.current_position:
+            return 3
+
+        if not self.lighting.torches_lit:
+            return 0
+
+        return self._torch_grid[board_row * self.size + board_col]
     
     
     def has_blood_stains(self, board_row, board_col):
         """Verifica si una celda tiene manchas de sangre."""
-        exit_row, exit_col = self.exit_position
-        distance = abs(exit_row - board_row) + abs(exit_col - board_col)
-        
-        # Solo puede haber manchas en celdas a distancia 1-10 de la salida
-        if distance < 1 or distance > 10:
-            return False
-        
-        # Usar posición como semilla para reproducibilidad
-        seed = board_row * 100000 + board_col
-        rnd = random.Random(seed)
-        
-        # Probabilidad de manchas aumenta al acercarse (30% a dist 10, 100% a dist 1)
-        probability = 1.0 - ((distance - 1) / 9.0) * 0.7
-        return rnd.random() <= probability
+        return self._blood_grid[board_row * self.size + board_col] == 1
     
     def has_torches(self, board_row, board_col):
         """Verifica si una celda tiene antorchas."""
@@ -3771,55 +3423,8 @@ class DungeonBoard:
         Args:
             brightness_factor: Factor de brillo (0.0 a 1.0) para oscurecer todos los colores
         """
-        # Aplicar 50% del oscurecimiento a la sangre
-        blood_brightness_factor = 1.0 - 0.5 * (1.0 - brightness_factor)
-        
-        exit_row, exit_col = self.exit_position
-        distance = abs(exit_row - board_row) + abs(exit_col - board_col)
-        
-        # Solo dibujar manchas en celdas a distancia 1-10 de la salida
-        if distance < 1 or distance > 10:
-            return
-        
-        # Usar posición como semilla para reproducibilidad
-        seed = board_row * 100000 + board_col
-        rnd = random.Random(seed)
-        
-        # Probabilidad de manchas aumenta al acercarse (30% a dist 10, 100% a dist 1)
-        probability = 1.0 - ((distance - 1) / 9.0) * 0.7
-        if rnd.random() > probability:
-            return
-        
-        # Color de sangre oscura, aplicando el 50% del factor de oscuridad
-        blood_colors = [
-            tuple(int(c * blood_brightness_factor) for c in (80, 0, 0)),    # Rojo muy oscuro
-            tuple(int(c * blood_brightness_factor) for c in (100, 10, 10)), # Rojo oscuro
-            tuple(int(c * blood_brightness_factor) for c in (70, 5, 5)),    # Casi negro rojizo
-        ]
-        
-        # Generar 2-5 manchas por celda
-        num_stains = rnd.randint(2, 5)
-        for i in range(num_stains):
-            # Posición aleatoria en el suelo (evitar bordes)
-            stain_x = x + int(rnd.uniform(0.2, 0.8) * self.cell_size)
-            stain_y = y + int(rnd.uniform(0.2, 0.8) * self.cell_size)
-            
-            # Tamaño aleatorio
-            size = rnd.randint(4, 12)
-            
-            # Color aleatorio de sangre
-            color = rnd.choice(blood_colors)
-            
-            # Dibujar mancha irregular (varios círculos superpuestos)
-            num_circles = rnd.randint(2, 4)
-            for j in range(num_circles):
-                offset_x = rnd.randint(-size//2, size//2)
-                offset_y = rnd.randint(-size//2, size//2)
-                circle_size = rnd.randint(size//2, size)
-                pygame.draw.circle(self.screen, color, 
-                                 (stain_x + offset_x, stain_y + offset_y), 
-                                 circle_size)
-    
+        self.decorations.draw_blood_stains(board_row, board_col, x, y, brightness_factor, self.exit_position)
+
     def draw_torches(self, board_row, board_col, x, y, cell):
         """Dibuja antorchas animadas. Las antorchas se posicionan en las paredes sin salida,
         pero su cantidad es independiente del número de salidas.
@@ -4047,28 +3652,54 @@ class DungeonBoard:
     def zoom_in(self):
         """Aumenta el zoom (reduce view_size) - acerca la vista."""
         if self.current_zoom_index > 0:
-            self.current_zoom_index -= 1
-            self.view_size = self.zoom_levels[self.current_zoom_index]
-            # Ajustar el tamaño de las celdas para mantener ventana fija
-            self.cell_size = self.fixed_window_size // self.view_size
-            # Actualizar tamaño de celda en renderizadores
-            self.effects.cell_size = self.cell_size
-            self.decorations.cell_size = self.cell_size
-            # Recentrar la cámara en la posición actual
-            self.update_camera_target()
+            self.set_zoom_level(self.current_zoom_index - 1)
     
     def zoom_out(self):
         """Reduce el zoom (aumenta view_size) - aleja la vista."""
         if self.current_zoom_index < len(self.zoom_levels) - 1:
-            self.current_zoom_index += 1
-            self.view_size = self.zoom_levels[self.current_zoom_index]
-            # Ajustar el tamaño de las celdas para mantener ventana fija
-            self.cell_size = self.fixed_window_size // self.view_size
-            # Actualizar tamaño de celda en renderizadores
-            self.effects.cell_size = self.cell_size
-            self.decorations.cell_size = self.cell_size
-            # Recentrar la cámara en la posición actual
-            self.update_camera_target()
+            self.set_zoom_level(self.current_zoom_index + 1)
+
+    def set_zoom_level(self, index):
+        """Cambia al nivel de zoom index, animando el paso si ZOOM_TRANSITION_MS > 0."""
+        if index == self.current_zoom_index:
+            return
+        zooming_in = index < self.current_zoom_index
+        old_cell_size = self.cell_size
+        animate = self.zoom_transition.duration_ms > 0 and not self.showing_title
+        if animate:
+            # Al acercarse la vista amplia es la actual: se captura antes de cambiar
+            if zooming_in:
+                self.compositor.compose(self.screen, compositor.SCENE_LAYERS)
+                wide_anchor = self.player_anchor()
+            else:
+                self._zoom_anchor = self.player_anchor()
+
+        self.current_zoom_index = index
+        self.view_size = self.zoom_levels[self.current_zoom_index]
+        # Ajustar el tamaño de las celdas para mantener ventana fija
+        self.cell_size = self.fixed_window_size // self.view_size
+        # Actualizar tamaño de celda en renderizadores
+        self.effects.cell_size = self.cell_size
+        self.decorations.cell_size = self.cell_size
+        # Medidas de las celdas del nuevo zoom (una vez, no por celda y frame)
+        geometry_for(self.cell_size)
+        # Recentrar la cámara en la posición actual
+        self.update_camera_target()
+
+        if animate:
+            self.zoom_transition.start(zooming_in, old_cell_size, self.cell_size, pygame.time.get_ticks())
+            if zooming_in:
+                # Dónde quedará el jugador en la vista nueva (cámara ya recentrada)
+                close_anchor = self.player_anchor((self.camera_offset_col * self.cell_size,
+                                                   self.camera_offset_row * self.cell_size))
+                self.zoom_transition.capture(self.screen, wide_anchor, close_anchor)
+
+    def player_anchor(self, origin=None):
+        """Centro del jugador en pantalla con la cámara en origin (por defecto la del último frame)."""
+        origin_x, origin_y = origin if origin is not None else self._frame_origin
+        row, col = self.current_position
+        return (col * self.cell_size - origin_x + self.cell_size / 2,
+                row * self.cell_size - origin_y + self.cell_size / 2)
     
     def update_camera_target(self):
         """Actualiza el objetivo de la cámara después de cambiar el zoom, centrando en el personaje."""
@@ -4206,12 +3837,7 @@ class DungeonBoard:
                     self.original_zoom_index = self.current_zoom_index
                     
                     # 1. Zoom OUT (al máximo) al empezar
-                    self.current_zoom_index = len(self.zoom_levels) - 1  # Zoom máximo out
-                    self.view_size = self.zoom_levels[self.current_zoom_index]
-                    self.cell_size = self.fixed_window_size // self.view_size
-                    self.effects.cell_size = self.cell_size
-                    self.decorations.cell_size = self.cell_size
-                    self.update_camera_target()
+                    self.set_zoom_level(len(self.zoom_levels) - 1)  # Zoom máximo out
                     print("[DEBUG] Zoom out máximo aplicado")
                     
                     # Secuencia: Esperar 5s (flicker) -> Apagar -> Spawn -> Esperar 1s -> Zoom IN
@@ -4237,12 +3863,7 @@ class DungeonBoard:
                         await asyncio.sleep(1.0)
                         
                         # Zoom IN (al máximo)
-                        self.current_zoom_index = 0  # Zoom máximo (5x5)
-                        self.view_size = self.zoom_levels[self.current_zoom_index]
-                        self.cell_size = self.fixed_window_size // self.view_size
-                        self.effects.cell_size = self.cell_size
-                        self.decorations.cell_size = self.cell_size
-                        self.update_camera_target()
+                        self.set_zoom_level(0)  # Zoom máximo (5x5)
                         print("[DEBUG] Zoom in máximo aplicado tras apagón + 1s")
                         
                         # Iniciar música de viento al final de la secuencia
@@ -4304,6 +3925,10 @@ class DungeonBoard:
                     self.next_ambient_sound_delay = random.randint(5000, 15000)
             
             for event in pygame.event.get():
+                # La ventana se ha vuelto a mostrar: enviar el frame entero
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._full_display_update = True
+
                 # Usar el nuevo InputHandler si está disponible
                 if hasattr(self, 'input_handler'):
                     if not self.input_handler.handle_input(event):
@@ -2,5 +2,22 @@
 from .decorations import DecorationRenderer
 from .effects import EffectsRenderer
 from .cell_renderer import CellRenderer
+from .texture_cache import TextureCache
+from .cell_tiles import CellTileCache
+from .gradients import GradientStripCache
+from .stones import StoneAtlas
+from .decals import DecalCache
+from .particles import ParticleSystem
+from .flipbooks import Flipbooks
+from .warrior import WarriorSprites
+from .deep_one import DeepOneSprites
+from .text_cache import TextCache
+from .screen_effects import ScreenEffects
+from .geometry import CellGeometry
+from .zoom_transition import ZoomTransition
+from .viewport import ViewportLayer
+from .compositor import Compositor
+from .lod import FlatCellRenderer
+from .overview import OverviewSurface
 
-__all__ = ['DecorationRenderer', 'EffectsRenderer', 'CellRenderer']
+__all__ = ['DecorationRenderer', 'EffectsRenderer', 'CellRenderer', 'TextureCache', 'CellTileCache', 'GradientStripCache', 'StoneAtlas', 'DecalCache', 'ParticleSystem', 'Flipbooks', 'WarriorSprites', 'DeepOneSprites', 'TextCache', 'ScreenEffects', 'CellGeometry', 'ZoomTransition', 'ViewportLayer', 'Compositor', 'FlatCellRenderer', 'OverviewSurface']
@@ -0,0 +1,302 @@
+"""Texturas de suelo+paredes por celda: albedo horneado una vez y pasada de luz."""
+from typing import Dict, List, Optional, Tuple
+
+import pygame  # type: ignore
+
+from config import ALBEDO_FLOOR_BRIGHTNESS, ALBEDO_WALL_BRIGHTNESS
+from models.cell import Cell, Direction
+from rendering.effects import EffectsRenderer, ROUGH_FLOOR_MIN_BRIGHTNESS
+from rendering.texture_cache import TextureCache
+from services.lighting_system import LightingSystem
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # Sin numpy no hay formato paletizado
+    numpy = None
+
+# (salidas congeladas, tipo de celda, suelo, piedras, mortero)
+AlbedoLayers = Tuple[frozenset, object, pygame.Surface, pygame.Surface, pygame.Surface]
+
+# Índices de la textura paletizada (8 bits): ruido del suelo, fondo plano,
+# mortero y, a partir de STONE_INDEX, el valor de albedo de las piedras
+FLOOR_INDEX = 0
+FLOOR_NOISE_RANGE = 15  # variación del ruido: albedo ± 15
+BACKGROUND_INDEX = FLOOR_INDEX + 2 * FLOOR_NOISE_RANGE + 1
+MORTAR_INDEX = BACKGROUND_INDEX + 1
+STONE_INDEX = MORTAR_INDEX + 1
+MORTAR_COLOR = (25, 25, 25)
+
+
+class CellTileCache:
+    """Hornea las texturas de las celdas sin iluminar y las ilumina al vuelo.
+
+    El patrón de piedras/ruido de una celda no depende del brillo, así que se
+    hornea una sola vez en tres capas (albedo):
+      - suelo: ruido alrededor de ALBEDO_FLOOR_BRIGHTNESS
+      - piedras: superficie con alfa, piedras con base ALBEDO_WALL_BRIGHTNESS
+      - mortero: grietas de color fijo, no les afecta la luz
+    Encender o apagar antorchas solo cambia la pasada de luz (un fill con
+    BLEND_RGB_ADD/SUB por capa, ver LightingSystem.*_light_offset), que
+    reproduce exactamente el dibujado con el brillo real.
+
+    Con palettized=True (requiere numpy) cada celda se guarda como una sola
+    superficie de 8 bits cuyos índices codifican capa y albedo; iluminarla es
+    un set_palette con una tabla de brillo precalculada, sin redibujar ni
+    guardar variantes por brillo (una cuarta parte de memoria por píxel).
+
+    Las celdas junto al barranco (barranco_dirs) llevan además el acantilado
+    y las esquinas de puerta que dan a él en la capa de mortero (tampoco les
+    afecta la luz); esas pocas celdas van siempre por la pasada de luz RGB.
+
+    Con base_size (mipmaps) las texturas RGB se hornean solo a ese tamaño y
+    los zooms más pequeños usan una copia reducida con smoothscale: cambiar
+    de zoom escala texturas ya horneadas en vez de volver a hornearlas. Las
+    paletizadas siguen horneándose por zoom (smoothscale no admite 8 bits).
+    """
+
+    def __init__(self, effects: EffectsRenderer, lighting: LightingSystem, cache: TextureCache,
+                 palettized: bool = False, base_size: Optional[int] = None) -> None:
+        self.effects: EffectsRenderer = effects
+        self.lighting: LightingSystem = lighting
+        self.cache: TextureCache = cache
+        self.palettized: bool = palettized and numpy is not None
+        self.base_size: Optional[int] = base_size
+        # (suelo, piedras, fondo) -> paleta de 256 colores
+        self._palettes: Dict[Tuple[int, int, int], List[Tuple[int, int, int]]] = {}
+
+    def get_tile(self, board_row: int, board_col: int, cell: Cell, floor_brightness: int,
+                 wall_brightness: int, draw_full_floor: bool = True,
+                 background_brightness: Optional[int] = None, barranco_dirs=()) -> pygame.Surface:
+        """Devuelve la textura iluminada de una celda (cacheada por brillo).
+
+        Args:
+            floor_brightness: brillo del suelo (0-255)
+            wall_brightness: brillo base de las piedras de las paredes
+            draw_full_floor: si es False, fuera del suelo interior el fondo es
+                plano (background_brightness) en vez de ruido (celda SALIDA).
+            background_brightness: brillo del fondo plano cuando draw_full_floor=False.
+            barranco_dirs: lados de la celda que dan al barranco (acantilado).
+        """
+        barranco_dirs = frozenset(barranco_dirs)
+        if self.palettized and not barranco_dirs:
+            return self.get_indexed_tile(board_row, board_col, cell, floor_brightness, wall_brightness,
+                                         draw_full_floor, background_brightness)
+
+        size = self.effects.cell_size
+        if self.base_size is not None and size < self.base_size:
+            return self.get_mip_tile(size, board_row, board_col, cell, floor_brightness, wall_brightness,
+                                     draw_full_floor, background_brightness, barranco_dirs)
+        return self.get_lit_tile(size, board_row, board_col, cell, floor_brightness, wall_brightness,
+                                 draw_full_floor, background_brightness, barranco_dirs)
+
+    def get_lit_tile(self, size: int, board_row: int, board_col: int, cell: Cell, floor_brightness: int,
+                     wall_brightness: int, draw_full_floor: bool, background_brightness: Optional[int],
+                     barranco_dirs: frozenset) -> pygame.Surface:
+        """Textura iluminada horneada a size píxeles (cacheada por brillo)."""
+        key = ('lit', board_row, board_col, size, floor_brightness, wall_brightness,
+               draw_full_floor, background_brightness, barranco_dirs)
+        exits_snapshot = frozenset(cell.exits)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == exits_snapshot and cached[1] == cell.cell_type:
+            return cached[2]
+
+        layers = self.get_albedo(board_row, board_col, cell, draw_full_floor, barranco_dirs, size=size)
+        tile = self.relight(layers, floor_brightness, wall_brightness, draw_full_floor, background_brightness)
+        self.cache.put(key, (exits_snapshot, cell.cell_type, tile), TextureCache.surface_bytes(tile),
+                       group=(board_row, board_col, size))
+        return tile
+
+    def get_mip_tile(self, size: int, board_row: int, board_col: int, cell: Cell, floor_brightness: int,
+                     wall_brightness: int, draw_full_floor: bool, background_brightness: Optional[int],
+                     barranco_dirs: frozenset) -> pygame.Surface:
+        """Textura iluminada de size píxeles reducida desde la horneada a base_size."""
+        key = ('mip', board_row, board_col, size, floor_brightness, wall_brightness,
+               draw_full_floor, background_brightness, barranco_dirs)
+        exits_snapshot = frozenset(cell.exits)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == exits_snapshot and cached[1] == cell.cell_type:
+            return cached[2]
+
+        base = self.get_lit_tile(self.base_size, board_row, board_col, cell, floor_brightness,
+                                 wall_brightness, draw_full_floor, background_brightness, barranco_dirs)
+        tile = pygame.transform.smoothscale(base, (size, size))
+        self.cache.put(key, (exits_snapshot, cell.cell_type, tile), TextureCache.surface_bytes(tile),
+                       group=('mip', board_row, board_col, size))
+        return tile
+
+    def get_albedo(self, board_row: int, board_col: int, cell: Cell, draw_full_floor: bool = True,
+                   barranco_dirs=(), size: Optional[int] = None) -> AlbedoLayers:
+        """Devuelve (horneando si hace falta) las capas sin iluminar de una celda."""
+        size = size or self.effects.cell_size
+        barranco_dirs = frozenset(barranco_dirs)
+        key = ('albedo', board_row, board_col, size, draw_full_floor, barranco_dirs)
+        exits_snapshot = frozenset(cell.exits)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == exits_snapshot and cached[1] == cell.cell_type:
+            return cached
+
+        layers = self.bake_albedo(board_row, board_col, cell, draw_full_floor, barranco_dirs, size=size)
+        nbytes = sum(TextureCache.surface_bytes(surf) for surf in layers[2:])
+        self.cache.put(key, layers, nbytes, group=('albedo', board_row, board_col, size))
+        return layers
+
+    def bake_albedo(self, board_row: int, board_col: int, cell: Cell, draw_full_floor: bool = True,
+                    barranco_dirs=(), size: Optional[int] = None) -> AlbedoLayers:
+        """Hornea las capas sin iluminar de una celda a size píxeles (sin cachear)."""
+        current_size = self.effects.cell_size
+        size = size or current_size
+        # Las piedras y el acantilado se dibujan al tamaño de celda de effects
+        self.effects.cell_size = size
+        try:
+            return self._bake_albedo(size, board_row, board_col, cell, draw_full_floor, barranco_dirs)
+        finally:
+            self.effects.cell_size = current_size
+
+    def _bake_albedo(self, size: int, board_row: int, board_col: int, cell: Cell, draw_full_floor: bool,
+                     barranco_dirs) -> AlbedoLayers:
+        inset = int(size * 0.15)
+        inset_size = size - 2 * inset
+        floor_color = (ALBEDO_FLOOR_BRIGHTNESS,) * 3
+
+        floor = pygame.Surface((size, size))
+        if draw_full_floor:
+            self.effects.draw_rough_floor(0, 0, size, size, floor_color, board_row, board_col, target_surface=floor)
+        if inset_size > 0:
+            self.effects.draw_rough_floor(inset, inset, inset_size, inset_size, floor_color,
+                                          board_row, board_col, target_surface=floor)
+
+        stones = pygame.Surface((size, size), pygame.SRCALPHA)
+        mortar = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.effects.draw_stone_in_walls(
+            board_row, board_col, 0, 0, cell, 1.0, lambda *_: 0,
+            barranco_dirs=barranco_dirs, target_surface=stones,
+            wall_brightness_override=ALBEDO_WALL_BRIGHTNESS, mortar_surface=mortar,
+        )
+        # El suelo interior se dibuja encima del grosor del muro
+        if inset_size > 0:
+            stones.fill((0, 0, 0, 0), (inset, inset, inset_size, inset_size))
+            mortar.fill((0, 0, 0, 0), (inset, inset, inset_size, inset_size))
+        # El acantilado va encima de todo, también del suelo interior
+        if barranco_dirs:
+            for cliff_dir in (Direction.N, Direction.S, Direction.E, Direction.O):
+                if cliff_dir in barranco_dirs:
+                    self.effects.draw_cliff_side(0, 0, cliff_dir, board_row, board_col,
+                                                 target_surface=mortar)
+            self.effects.draw_barranco_door_corners(board_row, board_col, 0, 0, cell, barranco_dirs,
+                                                    target_surface=mortar)
+
+        return (frozenset(cell.exits), cell.cell_type, floor, stones, mortar)
+
+    def relight(self, layers: AlbedoLayers, floor_brightness: int, wall_brightness: int,
+                draw_full_floor: bool = True, background_brightness: Optional[int] = None) -> pygame.Surface:
+        """Compone las capas de albedo con el brillo indicado."""
+        _, _, floor, stones, mortar = layers
+        size = floor.get_width()
+        tile = pygame.Surface((size, size))
+
+        if draw_full_floor:
+            floor_rect = pygame.Rect(0, 0, size, size)
+        else:
+            bg = background_brightness if background_brightness is not None else floor_brightness
+            tile.fill((bg, bg, bg))
+            inset = int(size * 0.15)
+            floor_rect = pygame.Rect(inset, inset, size - 2 * inset, size - 2 * inset)
+
+        if floor_rect.width > 0:
+            if floor_brightness < ROUGH_FLOOR_MIN_BRIGHTNESS:
+                # Suelo demasiado oscuro: plano, sin ruido (como draw_rough_floor)
+                tile.fill((floor_brightness,) * 3, floor_rect)
+            else:
+                tile.blit(floor, floor_rect.topleft, floor_rect)
+                offset = self.lighting.floor_light_offset(floor_brightness)
+                if offset > 0:
+                    tile.fill((offset,) * 3, floor_rect, special_flags=pygame.BLEND_RGB_ADD)
+
+        offset = self.lighting.wall_light_offset(wall_brightness)
+        if offset != 0:
+            lit_stones = stones.copy()
+            if offset > 0:
+                lit_stones.fill((offset,) * 3, special_flags=pygame.BLEND_RGB_SUB)
+            else:
+                lit_stones.fill((-offset,) * 3, special_flags=pygame.BLEND_RGB_ADD)
+            tile.blit(lit_stones, (0, 0))
+        else:
+            tile.blit(stones, (0, 0))
+        tile.blit(mortar, (0, 0))
+        return tile
+
+    def get_indexed_tile(self, board_row: int, board_col: int, cell: Cell, floor_brightness: int,
+                         wall_brightness: int, draw_full_floor: bool = True,
+                         background_brightness: Optional[int] = None) -> pygame.Surface:
+        """Devuelve la textura paletizada de una celda con la paleta del brillo pedido.
+
+        La superficie es compartida por todos los brillos de la celda: hay que
+        usarla (blit) antes de volver a pedirla con otro brillo.
+        """
+        size = self.effects.cell_size
+        key = ('indexed', board_row, board_col, size, draw_full_floor)
+        exits_snapshot = frozenset(cell.exits)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == exits_snapshot and cached[1] == cell.cell_type:
+            tile = cached[2]
+        else:
+            layers = self.bake_albedo(board_row, board_col, cell, draw_full_floor)
+            tile = self.palettize(layers, draw_full_floor)
+            self.cache.put(key, (exits_snapshot, cell.cell_type, tile), TextureCache.surface_bytes(tile),
+                           group=('indexed', board_row, board_col, size))
+
+        bg = background_brightness if background_brightness is not None else floor_brightness
+        tile.set_palette(self.get_palette(floor_brightness, wall_brightness, bg))
+        return tile
+
+    def palettize(self, layers: AlbedoLayers, draw_full_floor: bool = True) -> pygame.Surface:
+        """Convierte las capas de albedo en una superficie de 8 bits indexada."""
+        _, _, floor, stones, mortar = layers
+        size = floor.get_width()
+
+        floor_values = pygame.surfarray.array_red(floor).astype(numpy.int16)
+        indices = numpy.clip(floor_values - (ALBEDO_FLOOR_BRIGHTNESS - FLOOR_NOISE_RANGE),
+                             0, 2 * FLOOR_NOISE_RANGE) + FLOOR_INDEX
+        if not draw_full_floor:
+            inset = int(size * 0.15)
+            inner = indices[inset:size - inset, inset:size - inset].copy()
+            indices[:, :] = BACKGROUND_INDEX
+            indices[inset:size - inset, inset:size - inset] = inner
+
+        stone_mask = pygame.surfarray.array_alpha(stones) > 0
+        stone_values = numpy.clip(pygame.surfarray.array_red(stones).astype(numpy.int16), 0, 255 - STONE_INDEX)
+        indices = numpy.where(stone_mask, stone_values + STONE_INDEX, indices)
+        indices[pygame.surfarray.array_alpha(mortar) > 0] = MORTAR_INDEX
+
+        tile = pygame.Surface((size, size), 0, 8)
+        pygame.surfarray.blit_array(tile, indices.astype(numpy.uint8))
+        return tile
+
+    def get_palette(self, floor_brightness: int, wall_brightness: int,
+                    background_brightness: int) -> List[Tuple[int, int, int]]:
+        """Tabla de brillo (paleta de 256 colores) para una combinación de luz."""
+        key = (floor_brightness, wall_brightness, background_brightness)
+        palette = self._palettes.get(key)
+        if palette is not None:
+            return palette
+
+        palette = [(0, 0, 0)] * 256
+        floor_offset = self.lighting.floor_light_offset(floor_brightness)
+        for i in range(2 * FLOOR_NOISE_RANGE + 1):
+            if floor_brightness < ROUGH_FLOOR_MIN_BRIGHTNESS:
+                value = floor_brightness
+            else:
+                value = ALBEDO_FLOOR_BRIGHTNESS - FLOOR_NOISE_RANGE + i + floor_offset
+            value = max(0, min(255, value))
+            palette[FLOOR_INDEX + i] = (value, value, value)
+        palette[BACKGROUND_INDEX] = (background_brightness,) * 3
+        palette[MORTAR_INDEX] = MORTAR_COLOR
+        wall_offset = self.lighting.wall_light_offset(wall_brightness)
+        for albedo in range(256 - STONE_INDEX):
+            value = max(0, min(255, albedo - wall_offset))
+            palette[STONE_INDEX + albedo] = (value, value, value)
+
+        if len(self._palettes) > 1024:
+            self._palettes.clear()
+        self._palettes[key] = palette
+        return palette
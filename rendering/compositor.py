@@ -0,0 +1,129 @@
+"""Pila de capas del frame: terreno, calcos, decoración, entidades, efectos e interfaz."""
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pygame  # type: ignore
+
+# Capas en orden de dibujo (de abajo a arriba)
+TERRAIN = "terrain"          # suelo, paredes, líneas, sangre fija (ViewportLayer)
+DECALS = "decals"            # huellas húmedas que se desvanecen
+DECORATIONS = "decorations"  # antorchas, fuente y polvo animados
+ENTITIES = "entities"        # barreras, monstruos, jugador, murciélago, losa
+UI = "ui"                    # debug, subtítulos, imagen del pensamiento, diálogos
+EFFECTS = "effects"          # game over, tinte de peligro, flash (también sobre la interfaz)
+LAYER_ORDER = (TERRAIN, DECALS, DECORATIONS, ENTITIES, UI, EFFECTS)
+# Capas del mundo (se mueven y escalan con la cámara) y capas de pantalla
+SCENE_LAYERS = (TERRAIN, DECALS, DECORATIONS, ENTITIES)
+OVERLAY_LAYERS = (UI, EFFECTS)
+
+# Píxeles que lo animado (llamas, polvo, huellas) puede salirse de su celda
+ANIMATED_OVERFLOW = 32
+
+# (superficie, posición) tal y como lo acepta Surface.blits
+Blit = Tuple[pygame.Surface, Tuple[int, int]]
+# Rectángulos de pantalla que han cambiado; None = toda la pantalla
+DirtyRects = Optional[List[pygame.Rect]]
+
+
+def merge_dirty(first: DirtyRects, second: DirtyRects) -> DirtyRects:
+    """Une dos listas de rectángulos sucios (None absorbe al resto)."""
+    if first is None or second is None:
+        return None
+    return first + second
+
+
+class Layer:
+    """Una capa de la pila.
+
+    Una capa directa llama a draw(target) en cada frame. Una capa cacheada
+    guarda la lista de blits que devuelve build() y solo la reconstruye si
+    está sucia o si cambia key(); el resto de frames se compone con un único
+    Surface.blits (mismo resultado que dibujarla, incluidas las transparencias).
+
+    render() devuelve los rectángulos de pantalla que pueden haber cambiado
+    respecto al frame anterior (None = toda la pantalla). draw() devuelve los
+    suyos (si no devuelve nada, se asume toda la pantalla); con animated=True
+    son las zonas que ha pintado este frame y se les suman las del anterior,
+    para borrar lo que se ha movido o desaparecido.
+    """
+
+    def __init__(self, name: str, draw: Optional[Callable[[pygame.Surface], DirtyRects]] = None,
+                 build: Optional[Callable[[], List[Blit]]] = None,
+                 key: Optional[Callable[[], Hashable]] = None, animated: bool = False) -> None:
+        self.name: str = name
+        self.draw = draw
+        self.build = build
+        self.key = key
+        self.animated: bool = animated
+        self.blits: List[Blit] = []
+        self.dirty: bool = True
+        self.rebuilds: int = 0
+        self._last_key: Hashable = None
+        self._last_rects: DirtyRects = None
+
+    @property
+    def cached(self) -> bool:
+        return self.build is not None
+
+    def mark_dirty(self) -> None:
+        """Fuerza a reconstruir la capa en el próximo frame."""
+        self.dirty = True
+
+    def render(self, target: pygame.Surface) -> DirtyRects:
+        """Dibuja la capa sobre target y devuelve lo que ha cambiado."""
+        if self.build is None:
+            rects = self.draw(target) if self.draw is not None else []
+            if not self.animated:
+                return rects
+            changed = merge_dirty(self._last_rects, rects)
+            self._last_rects = rects
+            return changed
+
+        changed: DirtyRects = []
+        key = self.key() if self.key is not None else None
+        if self.dirty or key != self._last_key:
+            changed = self._blit_rects()
+            self.blits = self.build()
+            self._last_key = key
+            self.dirty = False
+            self.rebuilds += 1
+            changed = changed + self._blit_rects()
+        if self.blits:
+            target.blits(self.blits, doreturn=False)
+        return changed
+
+    def _blit_rects(self) -> List[pygame.Rect]:
+        return [pygame.Rect(pos, surface.get_size()) for surface, pos in self.blits]
+
+
+class Compositor:
+    """Compone el frame recorriendo las capas en el orden de LAYER_ORDER."""
+
+    def __init__(self) -> None:
+        self.layers: Dict[str, Layer] = {}
+
+    def set_layer(self, name: str, draw: Optional[Callable[[pygame.Surface], DirtyRects]] = None,
+                  build: Optional[Callable[[], List[Blit]]] = None,
+                  key: Optional[Callable[[], Hashable]] = None, animated: bool = False) -> Layer:
+        """Registra (o sustituye) la capa name."""
+        if name not in LAYER_ORDER:
+            raise ValueError(f"Capa desconocida: {name}")
+        layer = Layer(name, draw=draw, build=build, key=key, animated=animated)
+        self.layers[name] = layer
+        return layer
+
+    def mark_dirty(self, name: str) -> None:
+        """Marca una capa para reconstruirla."""
+        if name in self.layers:
+            self.layers[name].mark_dirty()
+
+    def compose(self, target: pygame.Surface, layers: Sequence[str] = LAYER_ORDER) -> DirtyRects:
+        """Dibuja las capas (todas por defecto) sobre target, de abajo a arriba.
+
+        Devuelve los rectángulos que han cambiado respecto al frame anterior
+        (None si hay que actualizar toda la pantalla)."""
+        dirty: DirtyRects = []
+        for name in layers:
+            layer = self.layers.get(name)
+            if layer is not None:
+                dirty = merge_dirty(dirty, layer.render(target))
+        return dirty
@@ -0,0 +1,161 @@
+"""Calcos del suelo: manchas de sangre, charcos de sangre y huellas húmedas."""
+import math
+import random
+from typing import List, Optional, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+# Píxeles que una mancha de sangre puede salirse de su posición (desvío + radio)
+STAIN_REACH = 18
+# Charco: crece durante POOL_GROWTH_MS en POOL_GROWTH_FRAMES pasos y ondula
+# con POOL_PULSE_FRAMES fases (un ciclo cada 2*pi/0.005 ms)
+POOL_GROWTH_MS = 8000
+POOL_GROWTH_FRAMES = 16
+POOL_PULSE_FRAMES = 8
+POOL_BLOBS = 15
+# Huellas: elipse de 14x10 que se desvanece en FOOTPRINT_LIFETIME_MS
+FOOTPRINT_SIZE = (14, 10)
+FOOTPRINT_COLOR = (20, 40, 40)
+FOOTPRINT_ALPHA = 120
+FOOTPRINT_LIFETIME_MS = 15000
+
+# (superficie, desplazamiento de su esquina respecto al punto de referencia)
+Stamp = Tuple[pygame.Surface, Tuple[int, int]]
+
+
+class DecalCache:
+    """Imágenes de las marcas del suelo, dibujadas una vez y reutilizadas.
+
+    - Manchas de sangre: fijas por celda; el sello de una celda (con alfa)
+      se guarda por tamaño de celda y brillo.
+    - Charcos de sangre: unos pocos fotogramas por charco (paso de
+      crecimiento x fase del ondulado) en vez de 15 círculos por frame.
+    - Huellas húmedas: un único sprite con alfa; el desvanecimiento es un
+      set_alpha, sin crear superficies por frame.
+    LRU con presupuesto en bytes (TextureCache).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+        self.footprint: pygame.Surface = pygame.Surface(FOOTPRINT_SIZE, pygame.SRCALPHA)
+        pygame.draw.ellipse(self.footprint, FOOTPRINT_COLOR + (255,), self.footprint.get_rect())
+
+    def blood_stains(self, board_row: int, board_col: int, cell_size: int, brightness_factor: float,
+                     exit_position: Tuple[int, int]) -> Optional[Stamp]:
+        """Manchas de sangre de una celda cercana a la salida (o None).
+
+        El desplazamiento es relativo a la esquina de la celda."""
+        exit_row, exit_col = exit_position
+        distance = abs(exit_row - board_row) + abs(exit_col - board_col)
+
+        # Solo hay manchas en celdas a distancia 1-10 de la salida
+        if distance < 1 or distance > 10:
+            return None
+
+        # Usar posición como semilla para reproducibilidad
+        rnd = random.Random(board_row * 100000 + board_col)
+
+        # Probabilidad de manchas aumenta al acercarse (30% a dist 10, 100% a dist 1)
+        probability = 1.0 - ((distance - 1) / 9.0) * 0.7
+        if rnd.random() > probability:
+            return None
+
+        # Color de sangre oscura, aplicando el 50% del factor de oscuridad
+        blood_brightness_factor = 1.0 - 0.5 * (1.0 - brightness_factor)
+        blood_colors = [
+            tuple(int(c * blood_brightness_factor) for c in (80, 0, 0)),
+            tuple(int(c * blood_brightness_factor) for c in (100, 10, 10)),
+            tuple(int(c * blood_brightness_factor) for c in (70, 5, 5)),
+        ]
+
+        key = ('stains', board_row, board_col, cell_size, tuple(blood_colors))
+        stamp = self.cache.get(key)
+        if stamp is None:
+            side = cell_size + 2 * STAIN_REACH
+            canvas = pygame.Surface((side, side), pygame.SRCALPHA)
+            # Generar 2-5 manchas por celda (coordenadas del sello)
+            num_stains = rnd.randint(2, 5)
+            for _ in range(num_stains):
+                stain_x = STAIN_REACH + int(rnd.uniform(0.2, 0.8) * cell_size)
+                stain_y = STAIN_REACH + int(rnd.uniform(0.2, 0.8) * cell_size)
+                size = rnd.randint(4, 12)
+                color = rnd.choice(blood_colors)
+
+                # Mancha irregular (varios círculos superpuestos)
+                for _ in range(rnd.randint(2, 4)):
+                    offset_x = rnd.randint(-size // 2, size // 2)
+                    offset_y = rnd.randint(-size // 2, size // 2)
+                    circle_size = rnd.randint(size // 2, size)
+                    pygame.draw.circle(canvas, color, (stain_x + offset_x, stain_y + offset_y), circle_size)
+            # Recortar al área pintada (se blitea cada vez que se redibuja la celda)
+            bounds = canvas.get_bounding_rect()
+            stamp = (canvas.subsurface(bounds).copy(),
+                     (bounds.x - STAIN_REACH, bounds.y - STAIN_REACH))
+            self.cache.put(key, stamp, TextureCache.surface_bytes(stamp[0]),
+                           group=('stains', board_row, board_col, cell_size))
+        return stamp
+
+    def blood_pool(self, seed: int, cell_size: int, elapsed: int, ticks: int) -> Optional[Stamp]:
+        """Fotograma del charco de sangre elapsed ms después de empezar (o None).
+
+        El desplazamiento es relativo al centro del charco."""
+        progress = min(1.0, elapsed / POOL_GROWTH_MS)
+        if progress <= 0:
+            return None
+
+        # Radio máximo (casi el tamaño de la celda), redondeado al paso de crecimiento
+        max_radius = int(cell_size * 0.65)
+        growth = math.ceil(progress * POOL_GROWTH_FRAMES)
+        radius = int(max_radius * growth / POOL_GROWTH_FRAMES)
+        if radius < 1:
+            return None
+        cycle = 2 * math.pi / 0.005
+        phase = int((ticks % cycle) / cycle * POOL_PULSE_FRAMES) % POOL_PULSE_FRAMES
+
+        key = ('pool', seed, cell_size, growth, phase)
+        frame = self.cache.get(key)
+        if frame is None:
+            frame = self.draw_blood_pool(seed, radius, phase * cycle / POOL_PULSE_FRAMES)
+            # Sin grupo: todas las fases del ondulado se usan a la vez
+            self.cache.put(key, frame, TextureCache.surface_bytes(frame))
+        half = frame.get_width() // 2
+        return frame, (-half, -half)
+
+    @staticmethod
+    def draw_blood_pool(seed: int, radius: int, ticks: float) -> pygame.Surface:
+        """Dibuja un fotograma de charco de radio radius en el instante ticks."""
+        # Un blob llega como mucho a radius + 0.5 * radius * 1.15
+        half = int(radius * 1.6) + 2
+        frame = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+        rnd = random.Random(seed)
+        for i in range(POOL_BLOBS):
+            angle = rnd.uniform(0, 2 * math.pi)
+            # Distribución más densa en el centro
+            dist = radius * (rnd.random() ** 0.5)
+            blob_x = half + int(dist * math.cos(angle))
+            blob_y = half + int(dist * math.sin(angle))
+
+            # Ondulado propio de cada blob (efecto de "hervor" del líquido)
+            blob_pulse = math.sin(ticks * 0.005 + i * 13.0) * 0.15 + 1.0
+            blob_size = int(radius * rnd.uniform(0.2, 0.5) * blob_pulse)
+            if blob_size < 1:
+                continue
+
+            # Variación de color rojo oscuro
+            r = rnd.randint(60, 100)
+            pygame.draw.circle(frame, (r, 0, 0), (blob_x, blob_y), blob_size)
+        return frame
+
+    def draw_footprints(self, surface: pygame.Surface, x: int, y: int, footprints: List[dict],
+                        ticks: int) -> None:
+        """Dibuja las huellas de una celda desvaneciéndose con la edad."""
+        for fp in footprints:
+            age = ticks - fp['time']
+            # Duración de 15 segundos
+            if age > FOOTPRINT_LIFETIME_MS:
+                continue
+            self.footprint.set_alpha(int(FOOTPRINT_ALPHA * (1.0 - age / FOOTPRINT_LIFETIME_MS)))
+            surface.blit(self.footprint, (x + fp['rel_x'] - FOOTPRINT_SIZE[0] // 2,
+                                          y + fp['rel_y'] - FOOTPRINT_SIZE[1] // 2))
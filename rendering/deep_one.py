@@ -0,0 +1,226 @@
+"""Sprite procedimental de los Profundos (monstruos) y su hoja de fotogramas."""
+import math
+from typing import Optional, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+# Colores
+SKIN_COL = (40, 140, 100)      # Verde azulado pantanoso
+SKIN_DARK = (30, 110, 80)      # Sombra/bordes
+BELLY_COL = (60, 160, 120)     # Un poco más claro
+EYE_COL = (255, 230, 50)       # Amarillo brillante
+PUPIL_COL = (0, 0, 0)
+MOUTH_COL = (20, 60, 40)       # Boca oscura
+ALERT_COL = (255, 0, 0)        # Rojo brillante
+
+# Rugido: (desplazamiento entero de los brazos, desplazamiento de las pupilas)
+Roar = Tuple[int, int]
+# (superficie, desplazamiento de su esquina respecto al centro del monstruo)
+Stamp = Tuple[pygame.Surface, Tuple[int, int]]
+
+
+def sprite_scale(size: int) -> int:
+    return max(8, int(size))
+
+
+def breath_offset(size: int, ticks: int) -> int:
+    """Desplazamiento vertical de la respiración/flotación (mueve el sprite entero)."""
+    return int(math.sin(ticks * 0.003) * (sprite_scale(size) * 0.03))
+
+
+def walk_offset(size: int, anim_t: int) -> int:
+    """Balanceo de las piernas anim_t ms después de empezar a moverse."""
+    return int(math.sin(anim_t * 0.02) * (sprite_scale(size) * 0.1))
+
+
+def roar_pose(size: int, roar_t: int) -> Roar:
+    """Brazos agitándose y pupilas moviéndose roar_t ms después de empezar a rugir."""
+    s = sprite_scale(size)
+    eye_r = int(s * 0.13)
+    return (int(math.sin(roar_t * 0.02) * (s * 0.15)),
+            int(math.sin(roar_t * 0.015) * (eye_r * 0.5)))
+
+
+def head_geometry(size: int, cy: int) -> Tuple[int, int]:
+    """(centro y alto de la cabeza) de un monstruo centrado en cy sin respirar."""
+    s = sprite_scale(size)
+    body_h = int(s * 0.65)
+    body_y = cy - body_h // 4
+    head_h = int(s * 0.55)
+    return body_y - body_h//2 - head_h//3, head_h
+
+
+def draw_deep_one(surface: pygame.Surface, cx: int, cy: int, size: int, walk: int = 0,
+                  roar: Optional[Roar] = None) -> None:
+    """Dibuja un Profundo (zombie marino) centrado en (cx, cy), sin el indicador de alerta."""
+    s = sprite_scale(size)
+
+    # Cuerpo (jorobado/ovalado)
+    body_w = int(s * 0.55)
+    body_h = int(s * 0.65)
+    body_y = cy - body_h // 4
+
+    # Espinas dorsales (detrás del cuerpo)
+    spine_w = int(s * 0.08)
+    spine_h = int(s * 0.15)
+    for i in range(3):
+        sy = body_y - body_h//2 + i * (spine_h + 2)
+        # Izquierda
+        pygame.draw.polygon(surface, SKIN_DARK, [
+            (cx - body_w//2 + 5, sy + spine_h),
+            (cx - body_w//2 - spine_w, sy + spine_h//2),
+            (cx - body_w//2 + 5, sy)
+        ])
+        # Derecha
+        pygame.draw.polygon(surface, SKIN_DARK, [
+            (cx + body_w//2 - 5, sy + spine_h),
+            (cx + body_w//2 + spine_w, sy + spine_h//2),
+            (cx + body_w//2 - 5, sy)
+        ])
+
+    # Piernas (humanoides), balanceándose al caminar
+    leg_w = int(s * 0.16)
+    leg_h = int(s * 0.45)
+    leg_y = body_y + body_h // 3
+    pygame.draw.ellipse(surface, SKIN_COL, (cx - body_w//4 - leg_w//2, leg_y + walk, leg_w, leg_h))
+    pygame.draw.ellipse(surface, SKIN_COL, (cx + body_w//4 - leg_w//2, leg_y - walk, leg_w, leg_h))
+
+    # Brazos largos y colgantes
+    arm_w = int(s * 0.14)
+    arm_h = int(s * 0.55)
+
+    if roar is not None:
+        # Brazos levantados/agitándose
+        arm_offset_y = -roar[0] - (s * 0.25)
+        pygame.draw.ellipse(surface, SKIN_COL, (cx - body_w//2 - arm_w, body_y + arm_offset_y, arm_w, arm_h))
+        pygame.draw.ellipse(surface, SKIN_COL, (cx + body_w//2, body_y + arm_offset_y, arm_w, arm_h))
+    else:
+        pygame.draw.ellipse(surface, SKIN_COL, (cx - body_w//2 - arm_w//2, body_y, arm_w, arm_h))
+        pygame.draw.ellipse(surface, SKIN_COL, (cx + body_w//2 - arm_w//2, body_y, arm_w, arm_h))
+
+    # Cuerpo principal
+    pygame.draw.ellipse(surface, SKIN_COL, (cx - body_w//2, body_y - body_h//2, body_w, body_h))
+
+    # Vientre
+    belly_rect = (cx - body_w//3, body_y - body_h//3, body_w//1.5, body_h//1.5)
+    pygame.draw.ellipse(surface, BELLY_COL, belly_rect)
+
+    # Escamas (pequeños arcos)
+    for i in range(3):
+        sy = body_y - body_h//4 + i * (s * 0.1)
+        pygame.draw.arc(surface, SKIN_DARK, (cx - s*0.1, sy, s*0.2, s*0.1), 0, 3.14, 1)
+
+    # Cabeza (grande y de pez)
+    head_w = int(s * 0.5)
+    head_h = int(s * 0.55)
+    head_y = body_y - body_h//2 - head_h//3
+
+    # Cresta de la cabeza
+    pygame.draw.polygon(surface, SKIN_DARK, [
+        (cx, head_y - head_h//2 - int(s*0.1)),
+        (cx - int(s*0.1), head_y - head_h//2 + int(s*0.1)),
+        (cx + int(s*0.1), head_y - head_h//2 + int(s*0.1))
+    ])
+
+    pygame.draw.ellipse(surface, SKIN_COL, (cx - head_w//2, head_y - head_h//2, head_w, head_h))
+
+    # Boca ancha de pez
+    mouth_y = head_y + int(head_h * 0.25)
+    mouth_w = int(head_w * 0.6)
+    if roar is not None:
+        # Boca abierta
+        pygame.draw.ellipse(surface, MOUTH_COL, (cx - mouth_w//2, mouth_y, mouth_w, int(head_h * 0.25)))
+    else:
+        # Boca cerrada (línea curva)
+        pygame.draw.arc(surface, MOUTH_COL, (cx - mouth_w//2, mouth_y - 5, mouth_w, 10), 3.14, 2*3.14, 2)
+
+    # Ojos (grandes, laterales y saltones); las pupilas se mueven si ruge
+    eye_r = int(s * 0.13)
+    eye_y_pos = head_y - int(head_h * 0.1)
+    pupil_offset = roar[1] if roar is not None else 0
+
+    # Ojo izquierdo
+    pygame.draw.circle(surface, EYE_COL, (cx - int(head_w*0.35), eye_y_pos), eye_r)
+    pygame.draw.circle(surface, PUPIL_COL, (cx - int(head_w*0.35) + pupil_offset, eye_y_pos), max(1, int(eye_r*0.3)))
+
+    # Ojo derecho
+    pygame.draw.circle(surface, EYE_COL, (cx + int(head_w*0.35), eye_y_pos), eye_r)
+    pygame.draw.circle(surface, PUPIL_COL, (cx + int(head_w*0.35) + pupil_offset, eye_y_pos), max(1, int(eye_r*0.3)))
+
+    # Branquias/Aletas laterales
+    fin_w = int(s * 0.18)
+    fin_h = int(s * 0.25)
+    pygame.draw.polygon(surface, SKIN_COL, [
+        (cx - head_w//2 + 5, head_y),
+        (cx - head_w//2 - fin_w, head_y - fin_h//2),
+        (cx - head_w//2 - fin_w, head_y + fin_h//2)
+    ])
+    pygame.draw.polygon(surface, SKIN_COL, [
+        (cx + head_w//2 - 5, head_y),
+        (cx + head_w//2 + fin_w, head_y - fin_h//2),
+        (cx + head_w//2 + fin_w, head_y + fin_h//2)
+    ])
+
+
+def draw_alert(surface: pygame.Surface, cx: int, cy: int, size: int) -> None:
+    """Dibuja el indicador de alerta (!) sobre la cabeza de un monstruo centrado en (cx, cy)."""
+    s = sprite_scale(size)
+    head_y, head_h = head_geometry(size, cy)
+    alert_y = head_y - head_h // 2 - int(s * 0.3)
+
+    # Punto
+    dot_size = max(2, int(s * 0.08))
+    pygame.draw.circle(surface, ALERT_COL, (cx, alert_y), dot_size)
+    # Línea
+    line_w = max(2, int(s * 0.06))
+    line_h = int(s * 0.25)
+    pygame.draw.rect(surface, ALERT_COL, (cx - line_w//2, alert_y - dot_size - 2 - line_h, line_w, line_h))
+
+
+class DeepOneSprites:
+    """Hoja de fotogramas de los Profundos por tamaño (zoom).
+
+    - Cuerpo: uno por balanceo de piernas y pose de rugido (desplazamientos
+      enteros, así que es idéntico al dibujo en vivo). La respiración solo
+      mueve el sprite entero en vertical: es el desplazamiento del blit.
+    - Alerta (!): un sprite aparte que se dibuja encima y flota.
+    - Muerto: tendido y ya girado 90 grados sobre un lienzo de una celda.
+    LRU con presupuesto en bytes (TextureCache).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+
+    def _cropped(self, key: tuple, size: int, draw) -> Stamp:
+        stamp = self.cache.get(key)
+        if stamp is None:
+            # Margen: el indicador de alerta queda a más de 1.5 veces el tamaño por encima
+            pad = 2 * sprite_scale(size) + 8
+            canvas = pygame.Surface((2 * pad, 2 * pad), pygame.SRCALPHA)
+            draw(canvas, pad, pad, size)
+            bounds = canvas.get_bounding_rect()
+            stamp = (canvas.subsurface(bounds).copy(), (bounds.x - pad, bounds.y - pad))
+            self.cache.put(key, stamp, TextureCache.surface_bytes(stamp[0]))
+        return stamp
+
+    def body(self, size: int, walk: int = 0, roar: Optional[Roar] = None) -> Stamp:
+        """Cuerpo en una pose (sin respirar), recortado a lo dibujado."""
+        return self._cropped(('body', size, walk, roar), size,
+                             lambda canvas, cx, cy, size: draw_deep_one(canvas, cx, cy, size, walk, roar))
+
+    def alert(self, size: int) -> Stamp:
+        """Indicador de alerta (sin respirar ni flotar)."""
+        return self._cropped(('alert', size), size, draw_alert)
+
+    def dead(self, size: int, canvas_size: int, breath: int) -> pygame.Surface:
+        """Monstruo tendido: centrado en un lienzo de canvas_size y girado 90 grados."""
+        key = ('dead', size, canvas_size, breath)
+        rotated = self.cache.get(key)
+        if rotated is None:
+            canvas = pygame.Surface((canvas_size, canvas_size), pygame.SRCALPHA)
+            draw_deep_one(canvas, canvas_size // 2, canvas_size // 2 + breath, size)
+            rotated = pygame.transform.rotate(canvas, 90)
+            self.cache.put(key, rotated, TextureCache.surface_bytes(rotated))
+        return rotated
@@ -1,16 +1,36 @@
 """Efectos visuales del dungeon (líneas quebradas, texturas de piedra)."""
 import pygame  # type: ignore
 import random
-from typing import Tuple, Callable
+from typing import Callable, Dict, Hashable, List, Tuple
+from config import STONE_ATLAS_BUDGET_BYTES
 from models.cell import Cell, Direction
+from rendering.stones import StoneAtlas
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # Sin numpy (p. ej. build web): ruido punto a punto
+    numpy = None
+
+# Por debajo de este brillo el suelo se dibuja plano, sin ruido
+ROUGH_FLOOR_MIN_BRIGHTNESS = 20
 
 
 class EffectsRenderer:
     """Renderiza efectos visuales como líneas quebradas y texturas de piedra."""
     
+    # Líneas quebradas cuya geometría se recuerda (unas 10 por celda y zoom)
+    BROKEN_LINE_CACHE_SIZE = 20000
+    
     def __init__(self, screen: pygame.Surface, cell_size: int) -> None:
         self.screen: pygame.Surface = screen
         self.cell_size: int = cell_size
+        # Ruido del suelo escrito de golpe en el buffer de píxeles (surfarray)
+        # al hornear texturas; requiere numpy
+        self.vectorized_floor: bool = numpy is not None
+        # (fila, columna, línea, vector) -> desplazamientos de sus puntos intermedios
+        self._broken_line_offsets: Dict[Hashable, List[Tuple[float, float, float, float]]] = {}
+        # Piedras ya dibujadas; las paredes se componen con Surface.blits
+        self.stones: StoneAtlas = StoneAtlas(STONE_ATLAS_BUDGET_BYTES)
     
     def draw_broken_line(self, color: Tuple[int, int, int], start_pos: Tuple[int, int], 
                         end_pos: Tuple[int, int], width: int, board_row: int, 
@@ -26,65 +46,76 @@ class EffectsRenderer:
             board_col: Columna en el tablero (para semilla)
             line_id: ID único de la línea (para semilla)
         """
-        # Asegurar que el color tiene valores enteros
-        if isinstance(color, (int, float)):
-            # Si color es un solo número, convertir a tupla gris
-            val = max(0, min(255, int(color)))
-            int_color: Tuple[int, int, int] = (val, val, val)
-        else:
-            # Si color es una tupla, convertir cada componente a int
-            int_color = tuple(max(0, min(255, int(c))) for c in color)  # type: ignore
-        
-        # Usar posición + line_id como semilla para reproducibilidad
-        seed = board_row * 100000 + board_col * 100 + line_id
-        rnd = random.Random(seed)
+        int_color = self.line_color(color)
         
         x1, y1 = start_pos
         x2, y2 = end_pos
+        dx = x2 - x1
+        dy = y2 - y1
         
-        # Calcular longitud de la línea
-        length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-        
-        if length < 5:
-            # Línea muy corta, dibujar directamente
+        # Línea muy corta: dibujar directamente
+        if dx * dx + dy * dy < 25:
             pygame.draw.line(self.screen, int_color, start_pos, end_pos, width)
             return
         
+        # Los desplazamientos solo dependen de la celda, la línea y su vector:
+        # se calculan una vez y se reutilizan al redibujar en otra posición
+        key = (board_row, board_col, line_id, round(dx, 3), round(dy, 3))
+        offsets = self._broken_line_offsets.get(key)
+        if offsets is None:
+            if len(self._broken_line_offsets) >= self.BROKEN_LINE_CACHE_SIZE:
+                self._broken_line_offsets.clear()
+            offsets = self.broken_line_offsets(dx, dy, board_row, board_col, line_id)
+            self._broken_line_offsets[key] = offsets
+        
+        points = [start_pos]
+        for ax, ay, bx, by in offsets:
+            points.append((int(x1 + ax + bx), int(y1 + ay + by)))
+        points.append(end_pos)
+        pygame.draw.lines(self.screen, int_color, False, points, width)
+
+    @staticmethod
+    def broken_line_offsets(dx: float, dy: float, board_row: int, board_col: int,
+                            line_id: int) -> List[Tuple[float, float, float, float]]:
+        """Puntos intermedios de una línea quebrada relativos a su inicio.
+
+        Cada punto es (avance x, avance y, desvío x, desvío y): el avance sobre
+        la recta y el desplazamiento perpendicular aleatorio (hasta 3 píxeles).
+        """
+        # Usar posición + line_id como semilla para reproducibilidad
+        rnd = random.Random(board_row * 100000 + board_col * 100 + line_id)
+        
         # Número de segmentos (más segmentos = más quebrada)
+        length = (dx ** 2 + dy ** 2) ** 0.5
         num_segments = max(3, int(length / 10))
         
-        # Generar puntos intermedios con desplazamiento aleatorio
-        points = [start_pos]
+        # Vector perpendicular normalizado
+        perp_x = -dy / length
+        perp_y = dx / length
+        
+        offsets = []
         for i in range(1, num_segments):
             t = i / num_segments
-            # Punto en la línea recta
-            px = x1 + t * (x2 - x1)
-            py = y1 + t * (y2 - y1)
-            
-            # Desplazamiento perpendicular aleatorio
-            # Vector perpendicular
-            dx = x2 - x1
-            dy = y2 - y1
-            perp_x = -dy
-            perp_y = dx
-            # Normalizar
-            perp_len = (perp_x ** 2 + perp_y ** 2) ** 0.5
-            if perp_len > 0:
-                perp_x /= perp_len
-                perp_y /= perp_len
-            
-            # Desplazamiento aleatorio (hasta 3 píxeles)
             offset = rnd.uniform(-3, 3)
-            px += perp_x * offset
-            py += perp_y * offset
-            
-            points.append((int(px), int(py)))
-        
-        points.append(end_pos)
-        
-        # Dibujar segmentos
-        for i in range(len(points) - 1):
-            pygame.draw.line(self.screen, int_color, points[i], points[i + 1], width)
+            offsets.append((t * dx, t * dy, perp_x * offset, perp_y * offset))
+        return offsets
+
+    def draw_straight_line(self, color: Tuple[int, int, int], start_pos: Tuple[int, int],
+                           end_pos: Tuple[int, int], width: int, board_row: int,
+                           board_col: int, line_id: int) -> None:
+        """Versión simplificada de draw_broken_line (zooms medios): una sola
+        línea recta. Acepta los mismos argumentos para poder intercambiarlas."""
+        pygame.draw.line(self.screen, self.line_color(color), start_pos, end_pos, width)
+
+    @staticmethod
+    def line_color(color) -> Tuple[int, int, int]:
+        """Color de línea con componentes enteros de 0 a 255 (un número es un gris)."""
+        if isinstance(color, (int, float)):
+            # Si color es un solo número, convertir a tupla gris
+            val = max(0, min(255, int(color)))
+            return (val, val, val)
+        # Si color es una tupla, convertir cada componente a int
+        return tuple(max(0, min(255, int(c))) for c in color)  # type: ignore
     
     def draw_rough_floor(self, x: int, y: int, width: int, height: int, color: Tuple[int, int, int],
                         board_row: int, board_col: int, target_surface: 'pygame.Surface | None' = None) -> None:
@@ -98,10 +129,15 @@ class EffectsRenderer:
         surface = target_surface if target_surface is not None else self.screen
 
         # Dibujar base
-        pygame.draw.rect(surface, color, (x, y, width, height))
+        surface.fill(color, (x, y, width, height))
 
         # Si el color es muy oscuro, no dibujar detalles para ahorrar rendimiento
-        if color[0] < 20:
+        if color[0] < ROUGH_FLOOR_MIN_BRIGHTNESS:
+            return
+
+        # Al hornear en una superficie propia, el ruido se genera vectorizado
+        if target_surface is not None and self.bake_floor_noise(surface, x, y, width, height, color,
+                                                                board_row, board_col):
             return
 
         seed = board_row * 100000 + board_col
@@ -121,6 +157,45 @@ class EffectsRenderer:
             r, g, b = [max(0, min(255, c + variation)) for c in color]
             surface.fill((r, g, b), (sx, sy, 2, 2))
 
+    def bake_floor_noise(self, surface: pygame.Surface, x: int, y: int, width: int, height: int,
+                         color: Tuple[int, int, int], board_row: int, board_col: int) -> bool:
+        """Escribe el ruido del suelo directamente en el buffer de píxeles.
+
+        Mismo patrón que draw_rough_floor (8% de cobertura con manchas de 2x2 y
+        variación de ±15), pero generado con numpy en una sola pasada en vez de
+        un fill por mancha. Determinista por (board_row, board_col).
+
+        Returns:
+            False si no se puede vectorizar (sin numpy o superficie que no es
+            de 32 bits); el llamador usa entonces el camino normal.
+        """
+        if not self.vectorized_floor or surface.get_bytesize() != 4:
+            return False
+        if width < 2 or height < 2:
+            return True
+
+        rng = numpy.random.Generator(numpy.random.PCG64(board_row * 100000 + board_col))
+        num_spots = int(width * height * 0.08)
+        raw = rng.random((3, num_spots))
+        sx = (raw[0] * (width - 1)).astype(numpy.intp)
+        sy = (raw[1] * (height - 1)).astype(numpy.intp)
+        variation = (raw[2] * 31).astype(numpy.intp)  # 0..30 -> -15..+15
+
+        # Los 31 colores posibles, ya empaquetados en el formato de la superficie
+        channels = numpy.clip(numpy.array(color[:3], dtype=numpy.int32)[:, None]
+                              + numpy.arange(-15, 16, dtype=numpy.int32), 0, 255).astype(numpy.uint32)
+        r_shift, g_shift, b_shift, _ = surface.get_shifts()
+        palette = ((channels[0] << r_shift) | (channels[1] << g_shift) | (channels[2] << b_shift)
+                   | numpy.uint32(surface.get_masks()[3]))
+        spot_colors = palette[variation]
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        region = pixels[x:x + width, y:y + height]
+        for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            region[sx + dx, sy + dy] = spot_colors
+        del region, pixels  # liberar el bloqueo de la superficie
+        return True
+
     def draw_stone_texture(self, board_row: int, board_col: int, x: int, y: int) -> None:
         """Dibuja una textura de piedra en la celda dada usando un patrón determinista por celda.
 
@@ -134,27 +209,12 @@ class EffectsRenderer:
 
         # Dibujar piedras (óvalos) distribuidos aleatoriamente pero deterministas
         # Más relleno: más piedras y más grietas
-        num_stones = rnd.randint(36, 70)
-        for _ in range(num_stones):
-            w = rnd.randint(max(4, int(self.cell_size * 0.06)), max(6, int(self.cell_size * 0.30)))
-            h = rnd.randint(max(3, int(self.cell_size * 0.05)), max(6, int(self.cell_size * 0.22)))
-            sx = x + rnd.randint(0, max(0, self.cell_size - w))
-            sy = y + rnd.randint(0, max(0, self.cell_size - h))
-
-            shade = rnd.randint(-30, 50)
-            base_stone = (120, 120, 120)
-            stone_color = tuple(max(0, min(255, base_stone[i] + shade)) for i in range(3))
-
-            # Dibujar la piedra
-            pygame.draw.ellipse(self.screen, stone_color, (sx, sy, w, h))
-
-            # Borde más oscuro para dar volumen
-            if rnd.random() < 0.85:
-                border = tuple(max(0, c - 50) for c in stone_color)
-                try:
-                    pygame.draw.ellipse(self.screen, border, (sx, sy, w, h), 1)
-                except Exception:
-                    pass
+        size = self.cell_size
+        stamps = self.stones.stamps((max(4, int(size * 0.06)), max(6, int(size * 0.30))),
+                                    (max(3, int(size * 0.05)), max(6, int(size * 0.22))),
+                                    120, shade_range=(-30, 50), border_chance=0.85, border_darken=50)
+        blits = StoneAtlas.scatter(stamps, rnd, rnd.randint(36, 70), (x, y, size, size))
+        self.screen.blits(blits, doreturn=False)
 
         # Añadir grietas/mortero más visibles
         for _ in range(rnd.randint(6, 12)):
@@ -169,7 +229,8 @@ class EffectsRenderer:
                            cell: Cell, brightness_factor: float,
                            count_torches_callback: Callable[[int, int, Cell], int],
                            barranco_dirs=None, target_surface: 'pygame.Surface | None' = None,
-                           wall_brightness_override: float = None) -> None:
+                           wall_brightness_override: float = None,
+                           mortar_surface: 'pygame.Surface | None' = None) -> None:
         """Dibuja textura de piedra únicamente en las zonas de pared dentro
         de una celda de tipo PASILLO (entre el suelo/centro y los bordes).
 
@@ -195,6 +256,8 @@ class EffectsRenderer:
             wall_brightness_override: si se indica, usa este brillo directamente en vez de
                 calcularlo desde count_torches_callback/brightness_factor (usado al hornear
                 el cache con el brillo real ya conocido de antemano).
+            mortar_surface: si se indica, las grietas de mortero se dibujan ahí en vez
+                de en la superficie de destino (su color no depende de la luz).
         """
         surface = target_surface if target_surface is not None else self.screen
         seed = board_row * 100000 + board_col
@@ -265,26 +328,17 @@ class EffectsRenderer:
 
         all_rects = top_rects + bottom_rects + left_rects + right_rects
 
-        base_stone = (wall_brightness, wall_brightness, wall_brightness)
+        blits = []
         for (rx, ry, rw, rh) in all_rects:
             # rellenar esa rect con piedras pequeñas — más denso
             area = max(1, rw * rh)
             num = rnd.randint(max(12, area // 80), max(24, area // 40))
-            for _ in range(num):
-                # usar piedras más pequeñas y más numerosas
-                w = rnd.randint(max(2, int(rw * 0.08)), max(4, int(rw * 0.5)))
-                h = rnd.randint(max(2, int(rh * 0.06)), max(4, int(rh * 0.45)))
-                sx = rx + rnd.randint(0, max(0, rw - w))
-                sy = ry + rnd.randint(0, max(0, rh - h))
-                shade = rnd.randint(-40, 60)
-                stone_color = tuple(max(0, min(255, base_stone[i] + shade)) for i in range(3))
-                pygame.draw.ellipse(surface, stone_color, (sx, sy, w, h))
-                if rnd.random() < 0.9:
-                    border = tuple(max(0, c - 55) for c in stone_color)
-                    try:
-                        pygame.draw.ellipse(surface, border, (sx, sy, w, h), 1)
-                    except Exception:
-                        pass
+            # usar piedras más pequeñas y más numerosas
+            stamps = self.stones.stamps((max(2, int(rw * 0.08)), max(4, int(rw * 0.5))),
+                                        (max(2, int(rh * 0.06)), max(4, int(rh * 0.45))),
+                                        wall_brightness)
+            blits.extend(StoneAtlas.scatter(stamps, rnd, num, (rx, ry, rw, rh)))
+        surface.blits(blits, doreturn=False)
 
         # Añadir algunas grietas en las paredes — más visibles y más numerosas
         for _ in range(rnd.randint(6, 14)):
@@ -294,9 +348,11 @@ class EffectsRenderer:
             x2 = rx + rnd.randint(0, max(0, rw - 1))
             y2 = ry + rnd.randint(0, max(0, rh - 1))
             mortar_color = (25, 25, 25)
-            pygame.draw.line(surface, mortar_color, (x1, y1), (x2, y2), 2)
+            pygame.draw.line(mortar_surface if mortar_surface is not None else surface,
+                             mortar_color, (x1, y1), (x2, y2), 2)
 
-    def draw_barranco_door_corners(self, board_row: int, board_col: int, x: int, y: int, cell: Cell, barranco_dirs) -> None:
+    def draw_barranco_door_corners(self, board_row: int, board_col: int, x: int, y: int, cell: Cell, barranco_dirs,
+                                   target_surface: 'pygame.Surface | None' = None) -> None:
         """Rellena, con la textura del acantilado, las esquinas de puerta que dan
         al barranco (las que draw_stone_in_walls dejó sin dibujar).
 
@@ -345,11 +401,12 @@ class EffectsRenderer:
 
         seed = board_row * 100000 + board_col
         for i, (fx, fy, fw, fh) in enumerate(corners):
-            self._draw_cliff_texture(fx, fy, fw, fh, seed + 500 + i)
+            self._draw_cliff_texture(fx, fy, fw, fh, seed + 500 + i, target_surface)
 
     CLIFF_BASE_COLOR = (34, 24, 38)
 
-    def _draw_cliff_texture(self, rx: int, ry: int, rw: int, rh: int, seed: int) -> None:
+    def _draw_cliff_texture(self, rx: int, ry: int, rw: int, rh: int, seed: int,
+                            target_surface: 'pygame.Surface | None' = None) -> None:
         """Rellena un rectángulo con la textura de roca del acantilado (color base + rocas).
 
         Se usa tanto para la franja principal del acantilado como para las
@@ -358,9 +415,10 @@ class EffectsRenderer:
         """
         if rw <= 0 or rh <= 0:
             return
+        surface = target_surface if target_surface is not None else self.screen
         rnd = random.Random(seed)
         base_color = self.CLIFF_BASE_COLOR
-        pygame.draw.rect(self.screen, base_color, (rx, ry, rw, rh))
+        pygame.draw.rect(surface, base_color, (rx, ry, rw, rh))
 
         for _ in range(rnd.randint(6, 12)):
             w = rnd.randint(max(2, int(rw * 0.1)), max(4, int(rw * 0.4)))
@@ -369,9 +427,10 @@ class EffectsRenderer:
             sy = ry + rnd.randint(0, max(0, rh - h))
             shade = rnd.randint(-20, 25)
             color = tuple(max(0, min(255, c + shade)) for c in base_color)
-            pygame.draw.ellipse(self.screen, color, (sx, sy, w, h))
+            pygame.draw.ellipse(surface, color, (sx, sy, w, h))
 
-    def draw_cliff_side(self, x: int, y: int, direction: Direction, board_row: int, board_col: int) -> None:
+    def draw_cliff_side(self, x: int, y: int, direction: Direction, board_row: int, board_col: int,
+                        target_surface: 'pygame.Surface | None' = None) -> None:
         """Dibuja un borde de acantilado infranqueable en el lado de la celda que da al barranco.
 
         Sustituye la pared normal por una roca quebrada, para distinguir
@@ -392,4 +451,4 @@ class EffectsRenderer:
         dir_offset = {Direction.N: 1, Direction.S: 2, Direction.E: 3, Direction.O: 4}[direction]
         seed = board_row * 100000 + board_col + dir_offset
         rx, ry, rw, rh = rect
-        self._draw_cliff_texture(x + rx, y + ry, rw, rh, seed)
+        self._draw_cliff_texture(x + rx, y + ry, rw, rh, seed, target_surface)
@@ -0,0 +1,169 @@
+"""Fotogramas ya dibujados de las decoraciones animadas (antorchas, fuente, escaleras)."""
+import math
+from typing import List, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+# Antorchas: el parpadeo abs(sin(t * 0.003 + semilla)) se reparte en TORCH_FRAMES fotogramas
+TORCH_FRAMES = 12
+TORCH_SPEED = 0.003
+WOOD_COLOR = (101, 67, 33)
+FLAME_COLOR = (255, 140, 0)
+INNER_FLAME_COLOR = (255, 220, 100)
+# Fuente: las 3 ondas (una cada 800 ms de un ciclo de 2400 ms) se repiten
+# cada 800 ms; el brillo pulsa con sin(t * 0.005)
+RIPPLE_PERIOD_MS = 800
+RIPPLE_FRAMES = 16
+SHINE_SPEED = 0.005
+SHINE_FRAMES = 12
+
+# (superficie, desplazamiento de su esquina respecto al punto de referencia)
+Stamp = Tuple[pygame.Surface, Tuple[int, int]]
+
+
+def torch_frame_index(ticks: int, seed: int) -> int:
+    """Fotograma del parpadeo de una antorcha (la semilla desfasa cada una)."""
+    phase = (ticks * TORCH_SPEED + seed) % math.pi
+    return int(phase / math.pi * TORCH_FRAMES) % TORCH_FRAMES
+
+
+def torch_flicker(frame: int) -> float:
+    """Factor de tamaño de la llama (0.7 a 1.0) en un fotograma."""
+    return abs(math.sin((frame + 0.5) / TORCH_FRAMES * math.pi)) * 0.3 + 0.7
+
+
+class Flipbooks:
+    """Decoraciones animadas dibujadas una vez por zoom y fotograma.
+
+    - Antorchas: TORCH_FRAMES fotogramas por tamaño (mango y dos llamas);
+      dibujar una antorcha es un blit.
+    - Fuente: base, agua y ondas en RIPPLE_FRAMES fotogramas y el brillo
+      especular en SHINE_FRAMES; dos blits por frame.
+    - Escaleras de caracol: no se animan, un único sprite por zoom.
+    LRU con presupuesto en bytes (TextureCache).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+
+    def _get(self, key: tuple, draw) -> Stamp:
+        stamp = self.cache.get(key)
+        if stamp is None:
+            stamp = draw()
+            self.cache.put(key, stamp, TextureCache.surface_bytes(stamp[0]))
+        return stamp
+
+    def torch(self, size: int, ticks: int, seed: int) -> Stamp:
+        """Antorcha de tamaño size; el desplazamiento es relativo al centro de la llama."""
+        frame = torch_frame_index(ticks, seed)
+        return self._get(('torch', size, frame), lambda: self.draw_torch(size, torch_flicker(frame)))
+
+    @staticmethod
+    def draw_torch(size: int, flicker: float) -> Stamp:
+        """Dibuja una antorcha (mango de madera y llama exterior e interior)."""
+        flame_radius = int(size * flicker * 0.6)
+        pad = int(size * 0.6) + 2
+        surface = pygame.Surface((2 * pad, pad + size), pygame.SRCALPHA)
+
+        handle_width = max(3, size // 4)
+        pygame.draw.rect(surface, WOOD_COLOR, (pad - handle_width // 2, pad, handle_width, size))
+        pygame.draw.circle(surface, FLAME_COLOR, (pad, pad), flame_radius)
+        pygame.draw.circle(surface, INNER_FLAME_COLOR, (pad, pad), int(flame_radius * 0.5))
+        return surface, (-pad, -pad)
+
+    def fountain(self, cell_size: int, brightness_factor: float, ticks: int) -> List[Stamp]:
+        """Fuente de una celda; los desplazamientos son relativos a la esquina de la celda."""
+        ripple = int((ticks % RIPPLE_PERIOD_MS) / RIPPLE_PERIOD_MS * RIPPLE_FRAMES)
+        shine_cycle = 2 * math.pi / SHINE_SPEED
+        shine = int((ticks % shine_cycle) / shine_cycle * SHINE_FRAMES) % SHINE_FRAMES
+        brightness_key = round(brightness_factor, 4)
+        return [
+            self._get(('fountain', cell_size, brightness_key, ripple),
+                      lambda: self.draw_fountain_water(cell_size, brightness_factor,
+                                                       ripple * RIPPLE_PERIOD_MS / RIPPLE_FRAMES)),
+            self._get(('shine', cell_size, brightness_key, shine),
+                      lambda: self.draw_fountain_shine(cell_size, brightness_factor,
+                                                       shine * shine_cycle / SHINE_FRAMES)),
+        ]
+
+    @staticmethod
+    def fountain_geometry(cell_size: int) -> Tuple[int, int, int]:
+        """(lado de la fuente, centro relativo a la celda, radio del agua)."""
+        fountain_size = max(20, int(cell_size * 0.3))
+        return fountain_size, fountain_size // 2 + 5, fountain_size // 3
+
+    @classmethod
+    def draw_fountain_water(cls, cell_size: int, brightness_factor: float, ticks: float) -> Stamp:
+        """Dibuja la base de piedra, el agua y las ondas de la fuente en el instante ticks."""
+        fountain_size, center, water_radius = cls.fountain_geometry(cell_size)
+        surface = pygame.Surface((fountain_size, fountain_size), pygame.SRCALPHA)
+        c = fountain_size // 2
+
+        # Base de piedra con borde
+        base_val = int(100 * brightness_factor)
+        border_val = int(150 * brightness_factor)
+        pygame.draw.rect(surface, (base_val, base_val, base_val), (0, 0, fountain_size, fountain_size))
+        pygame.draw.rect(surface, (border_val, border_val, border_val), (0, 0, fountain_size, fountain_size), 2)
+
+        # Agua (círculo azul)
+        water_color = (int(100 * brightness_factor), int(180 * brightness_factor), int(255 * brightness_factor))
+        pygame.draw.circle(surface, water_color, (c, c), water_radius)
+
+        # Ondas concéntricas
+        ripple_color = (int(150 * brightness_factor), int(220 * brightness_factor), int(255 * brightness_factor))
+        for i in range(3):
+            progress = ((ticks + i * 800) % 2400) / 2400.0
+            current_radius = int(water_radius * progress)
+            if current_radius > 0:
+                pygame.draw.circle(surface, ripple_color, (c, c), current_radius, 1)
+
+        # Borde del agua (el brillo especular no llega hasta él)
+        water_border_color = (int(150 * brightness_factor), int(200 * brightness_factor), int(255 * brightness_factor))
+        pygame.draw.circle(surface, water_border_color, (c, c), water_radius, 2)
+        return surface, (center - c, center - c)
+
+    @classmethod
+    def draw_fountain_shine(cls, cell_size: int, brightness_factor: float, ticks: float) -> Stamp:
+        """Dibuja el brillo especular pulsante del agua en el instante ticks."""
+        _, center, water_radius = cls.fountain_geometry(cell_size)
+        shine_radius = max(2, int(water_radius * 0.2))
+        pulse = (math.sin(ticks * SHINE_SPEED) + 1) * 0.5
+        shine_alpha = int((100 + 100 * pulse) * brightness_factor)
+        surface = pygame.Surface((shine_radius * 2, shine_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 255, shine_alpha), (shine_radius, shine_radius), shine_radius)
+        shine = center - water_radius // 3 - shine_radius
+        return surface, (shine, shine)
+
+    def stairs(self, cell_size: int) -> Stamp:
+        """Escalera de caracol; el desplazamiento es relativo a la esquina de la celda."""
+        return self._get(('stairs', cell_size), lambda: self.draw_stairs(cell_size))
+
+    @staticmethod
+    def draw_stairs(cell_size: int) -> Stamp:
+        """Dibuja la escalera de caracol (poste central y 8 escalones en espiral)."""
+        stairs_size = max(20, int(cell_size * 0.35))
+        radius = stairs_size // 2
+        pad = radius + 2
+        surface = pygame.Surface((2 * pad, 2 * pad), pygame.SRCALPHA)
+
+        # Poste central
+        post_radius = max(3, stairs_size // 8)
+        pygame.draw.circle(surface, (100, 80, 60), (pad, pad), post_radius)
+
+        # Escalones en espiral (gradiente de oscuro a claro)
+        num_steps = 8
+        for i in range(num_steps):
+            angle = (i / num_steps) * 2 * math.pi
+            brightness = 120 + int(30 * (i / num_steps))
+            step_color = (brightness, brightness - 20, brightness - 40)
+            outer = (pad + int(radius * math.cos(angle)), pad + int(radius * math.sin(angle)))
+            inner = (pad + int((radius * 0.3) * math.cos(angle)), pad + int((radius * 0.3) * math.sin(angle)))
+            pygame.draw.line(surface, step_color, inner, outer, 3)
+
+        # Borde del poste
+        pygame.draw.circle(surface, (80, 60, 40), (pad, pad), post_radius, 1)
+
+        center = cell_size - stairs_size // 2 - 5
+        return surface, (center - pad, center - pad)
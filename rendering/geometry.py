@@ -0,0 +1,145 @@
+"""Medidas de una celda por zoom y recetas de dibujo por máscara de salidas."""
+from typing import Dict, List, Tuple
+
+from models.cell import Direction
+from rendering.lod import EXIT_BITS
+
+DIRECTIONS = (Direction.N, Direction.S, Direction.E, Direction.O)
+DELTAS = {
+    Direction.N: (-1, 0),
+    Direction.S: (1, 0),
+    Direction.E: (0, 1),
+    Direction.O: (0, -1),
+}
+OPPOSITES = {
+    Direction.N: Direction.S,
+    Direction.S: Direction.N,
+    Direction.E: Direction.O,
+    Direction.O: Direction.E,
+}
+
+Point = Tuple[float, float]
+# (inicio, fin, id de la línea) relativos a la esquina de la celda
+LineRecipe = Tuple[Point, Point, int]
+# (x, y, ancho, alto, vertical, empieza en el borde) relativos a la esquina
+GradientRecipe = Tuple[int, int, int, int, bool, bool]
+
+
+class CellGeometry:
+    """Posiciones de las líneas, conexiones y aberturas de una celda de cell_size.
+
+    Todo se calcula una vez por tamaño de celda (al cambiar de zoom) con las
+    mismas cuentas que hacía el dibujo de cada celda, así que sumar la
+    esquina de la celda da las mismas coordenadas. Las líneas interiores se
+    guardan ya resueltas para cada máscara de salidas (EXIT_BITS) y forma
+    (habitación ancha o pasillo): dibujar una celda recorre una lista.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        cs = cell_size
+        self.cell_size: int = cs
+        # Líneas del pasillo (también marcan las salidas): lado bajo y alto
+        self.corridor: Tuple[float, float] = (0.8*cs // 2, 1.2*cs // 2)
+        # Zona central de habitaciones e inicio, mucho más ancha
+        self.room: Tuple[float, float] = (0.15*cs, 0.85*cs)
+        self.near: float = 0.1*cs
+        self.far: float = 0.9*cs
+        self.exit_inset: float = 0.8*cs
+        self.cross_inset: float = 0.05*cs
+
+        # Conexión de suelo con una vecina conectada
+        self.rect_thickness: int = int(cs * 0.22)
+        # Aberturas entre celdas (más anchas, para conectar con el pasillo)
+        self.open_thickness: int = max(12, int(cs * 0.20))
+
+        self.floor_connections: Dict[Direction, GradientRecipe] = self._floor_connections()
+        self.exit_lines: Dict[Direction, Tuple[LineRecipe, LineRecipe]] = self._exit_lines()
+        self.exit_crosses: Dict[Direction, LineRecipe] = self._exit_crosses()
+        self.neighbor_marks: Dict[Direction, Tuple[Point, Point]] = self._neighbor_marks()
+        self._inner_lines: Dict[Tuple[bool, int], List[LineRecipe]] = {
+            (wide, mask): self._build_inner_lines(wide, mask)
+            for wide in (False, True) for mask in range(16)
+        }
+
+    def inner_lines(self, wide: bool, mask: int) -> List[LineRecipe]:
+        """Líneas del camino desde el centro: dos por salida, una que cierra cada lado sin salida."""
+        return self._inner_lines[(wide, mask)]
+
+    def _build_inner_lines(self, wide: bool, mask: int) -> List[LineRecipe]:
+        low, high = self.room if wide else self.corridor
+        near, far = self.near, self.far
+        lines = []
+        # Norte
+        if mask & EXIT_BITS[Direction.N]:
+            lines += [((low, low), (low, near), 1), ((high, low), (high, near), 2)]
+        else:
+            lines.append(((low, low), (high, low), 3))
+        # Sur
+        if mask & EXIT_BITS[Direction.S]:
+            lines += [((low, high), (low, far), 4), ((high, high), (high, far), 5)]
+        else:
+            lines.append(((low, high), (high, high), 6))
+        # Este
+        if mask & EXIT_BITS[Direction.E]:
+            lines += [((high, low), (far, low), 7), ((high, high), (far, high), 8)]
+        else:
+            lines.append(((high, low), (high, high), 9))
+        # Oeste
+        if mask & EXIT_BITS[Direction.O]:
+            lines += [((low, low), (near, low), 10), ((low, high), (near, high), 11)]
+        else:
+            lines.append(((low, low), (low, high), 12))
+        return lines
+
+    def _floor_connections(self) -> Dict[Direction, GradientRecipe]:
+        cs, thickness = self.cell_size, self.rect_thickness
+        start, width = int(cs * 0.28), int(cs * 0.44)
+        # Degradado entre el brillo medio con la vecina (borde) y el de la celda (centro)
+        return {
+            Direction.N: (start, 0, width, thickness, True, True),
+            Direction.S: (start, cs - thickness, width, thickness, True, False),
+            Direction.E: (cs - thickness, start, thickness, width, False, False),
+            Direction.O: (0, start, thickness, width, False, True),
+        }
+
+    def _exit_lines(self) -> Dict[Direction, Tuple[LineRecipe, LineRecipe]]:
+        cs, (low, high) = self.cell_size, self.corridor
+        near, inset = self.near, self.exit_inset
+        return {
+            Direction.N: (((low, 0), (low, near), 20), ((high, 0), (high, near), 21)),
+            Direction.S: (((low, cs), (low, inset), 30), ((high, cs), (high, inset), 31)),
+            Direction.E: (((cs, low), (inset, low), 40), ((cs, high), (inset, high), 41)),
+            Direction.O: (((0, low), (near, low), 50), ((0, high), (near, high), 51)),
+        }
+
+    def _exit_crosses(self) -> Dict[Direction, LineRecipe]:
+        cs, (low, high) = self.cell_size, self.corridor
+        near, far = self.cross_inset, cs - self.cross_inset
+        return {
+            Direction.N: ((low, near), (high, near), 22),
+            Direction.S: ((low, far), (high, far), 32),
+            Direction.E: ((far, low), (far, high), 42),
+            Direction.O: ((near, low), (near, high), 52),
+        }
+
+    def _neighbor_marks(self) -> Dict[Direction, Tuple[Point, Point]]:
+        # Relativos a la esquina de la vecina: la marca va en su abertura hacia esta celda
+        cs, (low, high) = self.cell_size, self.corridor
+        near, far = self.cross_inset, cs - self.cross_inset
+        return {
+            Direction.N: ((low, far), (high, far)),
+            Direction.S: ((low, near), (high, near)),
+            Direction.E: ((near, low), (near, high)),
+            Direction.O: ((far, low), (far, high)),
+        }
+
+
+_geometries: Dict[int, CellGeometry] = {}
+
+
+def geometry_for(cell_size: int) -> CellGeometry:
+    """Geometría de las celdas de cell_size (se calcula la primera vez)."""
+    geometry = _geometries.get(cell_size)
+    if geometry is None:
+        geometry = _geometries[cell_size] = CellGeometry(cell_size)
+    return geometry
@@ -0,0 +1,75 @@
+"""Degradados de gris prerenderizados (conexiones entre celdas, luz que entra)."""
+from typing import List
+
+import pygame  # type: ignore
+
+from models.cell import Direction
+from rendering.texture_cache import TextureCache
+
+
+def gradient_ramp(start_brightness: int, end_brightness: int, length: int) -> List[int]:
+    """Brillos de cada línea de un degradado de length píxeles (extremos incluidos)."""
+    span = max(1, length - 1)
+    ramp = []
+    for i in range(length):
+        b = int(start_brightness + (end_brightness - start_brightness) * (i / span))
+        ramp.append(max(0, min(255, b)))
+    return ramp
+
+
+def light_spill_ramp(brightness: int, size: int) -> List[int]:
+    """Brillos de la luz que entra en una celda, desde el borde iluminado."""
+    return [int(brightness * (1 - i / size)) for i in range(size)]
+
+
+class GradientStripCache:
+    """Degradados de gris ya dibujados, listos para un solo blit.
+
+    Cada tira (brillo inicial, brillo final, orientación, tamaño) se dibuja
+    una vez: una línea de un píxel por brillo y un escalado sin suavizado
+    hasta el ancho (o alto) pedido. El resultado es el mismo que dibujar el
+    degradado línea a línea. LRU con presupuesto en bytes (TextureCache).
+
+    También guarda la luz que entra en una celda sin visitar por la salida
+    de una vecina visitada (light_spill).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+
+    def get(self, width: int, height: int, start_brightness: int, end_brightness: int,
+            vertical: bool = True) -> pygame.Surface:
+        """Tira de width x height con el degradado en vertical (o en horizontal)."""
+        key = (start_brightness, end_brightness, vertical, width, height)
+        strip = self.cache.get(key)
+        if strip is None:
+            strip = self.build(width, height, start_brightness, end_brightness, vertical)
+            self.cache.put(key, strip, TextureCache.surface_bytes(strip))
+        return strip
+
+    def light_spill(self, direction: Direction, brightness: int, size: int) -> pygame.Surface:
+        """Celda de size píxeles con la luz que entra por el lado direction."""
+        key = ("spill", direction, brightness, size)
+        tile = self.cache.get(key)
+        if tile is None:
+            ramp = light_spill_ramp(brightness, size)
+            if direction in (Direction.S, Direction.E):
+                ramp.reverse()
+            tile = self.from_ramp(ramp, size, size, direction in (Direction.N, Direction.S))
+            self.cache.put(key, tile, TextureCache.surface_bytes(tile))
+        return tile
+
+    @classmethod
+    def build(cls, width: int, height: int, start_brightness: int, end_brightness: int,
+              vertical: bool = True) -> pygame.Surface:
+        """Dibuja una tira nueva (sin pasar por la cache)."""
+        ramp = gradient_ramp(start_brightness, end_brightness, height if vertical else width)
+        return cls.from_ramp(ramp, width, height, vertical)
+
+    @staticmethod
+    def from_ramp(ramp: List[int], width: int, height: int, vertical: bool) -> pygame.Surface:
+        """Tira con un brillo de ramp por fila (vertical) o por columna."""
+        line = pygame.Surface((1, len(ramp)) if vertical else (len(ramp), 1))
+        for i, b in enumerate(ramp):
+            line.fill((b, b, b), (0, i, 1, 1) if vertical else (i, 0, 1, 1))
+        return pygame.transform.scale(line, (width, height))
@@ -0,0 +1,145 @@
+"""Nivel de detalle del mapa según el tamaño de celda (zooms lejanos)."""
+from typing import Dict, Iterable, List, Tuple
+
+import pygame  # type: ignore
+
+from config import LOD_FLAT_MAX_CELL_SIZE, LOD_SIMPLE_MAX_CELL_SIZE
+from models.cell import Direction
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # Sin numpy (p. ej. build web): un fill por rectángulo
+    numpy = None
+
+# Niveles de detalle
+FULL = "full"      # texturas, líneas quebradas, sangre, telarañas
+SIMPLE = "simple"  # texturas cacheadas y líneas rectas, sin telarañas
+FLAT = "flat"      # bloques de color con muñones de salida
+
+# Bit de cada salida en la máscara de una celda
+EXIT_BITS = {Direction.N: 1, Direction.E: 2, Direction.S: 4, Direction.O: 8}
+
+Color = Tuple[int, int, int]
+# (fila, columna, máscara de salidas, ancha, color de bloque, color del camino)
+FlatCell = Tuple[int, int, int, bool, Color, Color]
+
+
+def detail_level(cell_size: int) -> str:
+    """Nivel de detalle con el que se dibujan celdas de cell_size píxeles."""
+    if cell_size <= LOD_FLAT_MAX_CELL_SIZE:
+        return FLAT
+    if cell_size <= LOD_SIMPLE_MAX_CELL_SIZE:
+        return SIMPLE
+    return FULL
+
+
+def exit_mask(exits: Iterable[Direction]) -> int:
+    """Máscara de bits (EXIT_BITS) de un conjunto de salidas."""
+    mask = 0
+    for direction in exits:
+        mask |= EXIT_BITS.get(direction, 0)
+    return mask
+
+
+def flat_cell_rects(size: int, mask: int, wide: bool) -> List[pygame.Rect]:
+    """Rectángulos del camino de una celda plana, relativos a su esquina.
+
+    El centro ocupa el 70% de la celda en habitaciones (wide) y el 40% en
+    pasillos; cada salida añade un muñón del ancho del pasillo hasta el borde.
+    """
+    lo = int(size * 0.3)
+    hi = size - lo
+    inset = int(size * 0.15) if wide else lo
+    rects = [pygame.Rect(inset, inset, size - 2 * inset, size - 2 * inset)]
+    if inset == 0:
+        return rects
+    if mask & EXIT_BITS[Direction.N]:
+        rects.append(pygame.Rect(lo, 0, hi - lo, inset))
+    if mask & EXIT_BITS[Direction.S]:
+        rects.append(pygame.Rect(lo, size - inset, hi - lo, inset))
+    if mask & EXIT_BITS[Direction.O]:
+        rects.append(pygame.Rect(0, lo, inset, hi - lo))
+    if mask & EXIT_BITS[Direction.E]:
+        rects.append(pygame.Rect(size - inset, lo, inset, hi - lo))
+    return rects
+
+
+class FlatCellRenderer:
+    """Dibuja celdas diminutas como bloques de color con los muñones de sus salidas.
+
+    Con numpy la región se compone de golpe: cada celda elige su plantilla
+    (máscara de salidas x ancha) y se escribe con surfarray. Sin numpy se
+    rellenan los rectángulos de flat_cell_rects uno a uno (mismo resultado).
+    """
+
+    def __init__(self) -> None:
+        self.vectorized: bool = numpy is not None
+        # Plantillas por tamaño: array (32, size, size) con 1 donde hay camino
+        self._stencils: Dict[int, object] = {}
+
+    def stencils(self, size: int):
+        """Plantillas de camino para celdas de size píxeles (requiere numpy)."""
+        stencils = self._stencils.get(size)
+        if stencils is None:
+            stencils = numpy.zeros((32, size, size), dtype=numpy.bool_)
+            for index in range(32):
+                mask, wide = index & 15, bool(index & 16)
+                for rect in flat_cell_rects(size, mask, wide):
+                    stencils[index, rect.left:rect.right, rect.top:rect.bottom] = True
+            self._stencils[size] = stencils
+        return stencils
+
+    def draw(self, surface: pygame.Surface, rect: pygame.Rect, origin: Tuple[int, int],
+             cell_size: int, cells: Iterable[FlatCell]) -> None:
+        """Redibuja rect (coordenadas de surface) con las celdas dadas; el resto queda negro.
+
+        origin es el píxel del mundo que ocupa la esquina de surface.
+        """
+        rect = pygame.Rect(rect)
+        first_row = (origin[1] + rect.top) // cell_size
+        last_row = (origin[1] + rect.bottom - 1) // cell_size
+        first_col = (origin[0] + rect.left) // cell_size
+        last_col = (origin[0] + rect.right - 1) // cell_size
+        visible = [cell for cell in cells
+                   if first_row <= cell[0] <= last_row and first_col <= cell[1] <= last_col]
+
+        if self.vectorized:
+            self._draw_vectorized(surface, rect, origin, cell_size, visible,
+                                  first_row, last_row, first_col, last_col)
+            return
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(rect)
+        try:
+            surface.fill((0, 0, 0), rect)
+            for row, col, mask, wide, block_color, path_color in visible:
+                x = col * cell_size - origin[0]
+                y = row * cell_size - origin[1]
+                surface.fill(block_color, (x, y, cell_size, cell_size))
+                for part in flat_cell_rects(cell_size, mask, wide):
+                    surface.fill(path_color, part.move(x, y))
+        finally:
+            surface.set_clip(previous_clip)
+
+    def _draw_vectorized(self, surface: pygame.Surface, rect: pygame.Rect, origin: Tuple[int, int],
+                         cell_size: int, cells: List[FlatCell], first_row: int, last_row: int,
+                         first_col: int, last_col: int) -> None:
+        rows = last_row - first_row + 1
+        cols = last_col - first_col + 1
+        # Píxeles de las celdas que cubren rect, vistos como (col, x, fila, y, rgb)
+        pixels = numpy.zeros((cols * cell_size, rows * cell_size, 3), dtype=numpy.uint8)
+        if cells:
+            data = numpy.array([(col - first_col, row - first_row, mask | (16 if wide else 0))
+                                + block_color + path_color
+                                for row, col, mask, wide, block_color, path_color in cells],
+                               dtype=numpy.intp)
+            on_path = self.stencils(cell_size)[data[:, 2]][..., None]
+            tiles = numpy.where(on_path, data[:, None, None, 6:9], data[:, None, None, 3:6])
+            grid = pixels.reshape(cols, cell_size, rows, cell_size, 3)
+            grid[data[:, 0], :, data[:, 1]] = tiles
+
+        # Recortar al rectángulo pedido
+        left = origin[0] + rect.left - first_col * cell_size
+        top = origin[1] + rect.top - first_row * cell_size
+        pixels = pixels[left:left + rect.width, top:top + rect.height]
+        surface.blit(pygame.surfarray.make_surface(pixels), rect.topleft)
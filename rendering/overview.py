@@ -0,0 +1,72 @@
+"""Vista del tablero completo para los zooms lejanos, mantenida celda a celda."""
+from collections import OrderedDict
+from typing import Callable, Hashable, Set, Tuple
+
+import pygame  # type: ignore
+
+
+class OverviewSurface:
+    """Superficies del tablero entero (celda = cell_size píxeles) para los zooms planos.
+
+    Cada variante (firma: tamaño de celda, estado de la luz, F4) se dibuja
+    entera la primera vez; después solo se redibujan las celdas marcadas como
+    sucias. Se conservan las últimas max_variants, así el parpadeo de las
+    antorchas o volver a un zoom ya visto no redibuja nada.
+
+    El callback recibe la superficie de la variante y un rectángulo en
+    coordenadas del tablero en píxeles.
+    """
+
+    # El aspecto plano de una celda depende de sus vecinas (luz que entra por
+    # una salida, barranco revelado)
+    DIRTY_RADIUS = 1
+
+    def __init__(self, board_size: int, max_variants: int = 2) -> None:
+        self.board_size: int = board_size
+        self.max_variants: int = max(1, max_variants)
+        # firma -> (superficie, celdas pendientes de redibujar)
+        self._variants: "OrderedDict[Hashable, Tuple[pygame.Surface, Set[Tuple[int, int]]]]" = OrderedDict()
+        self.full_redraws: int = 0
+        self.partial_redraws: int = 0
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    def invalidate(self) -> None:
+        """Descarta todas las variantes."""
+        self._variants.clear()
+
+    def mark_dirty(self, row: int, col: int) -> None:
+        """Marca una celda (y sus vecinas) para redibujarla en todas las variantes."""
+        for _, pending in self._variants.values():
+            pending.add((row, col))
+
+    def update(self, signature: Hashable, cell_size: int,
+               redraw: Callable[[pygame.Surface, pygame.Rect], None]) -> pygame.Surface:
+        """Devuelve la variante de signature al día (creándola si hace falta)."""
+        variant = self._variants.get(signature)
+        if variant is None:
+            side = self.board_size * cell_size
+            surface = pygame.Surface((side, side))
+            variant = (surface, set())
+            self._variants[signature] = variant
+            while len(self._variants) > self.max_variants:
+                self._variants.popitem(last=False)
+            self.full_redraws += 1
+            redraw(surface, surface.get_rect())
+            return surface
+
+        self._variants.move_to_end(signature)
+        surface, pending = variant
+        if pending:
+            radius = self.DIRTY_RADIUS
+            span = (2 * radius + 1) * cell_size
+            bounds = surface.get_rect()
+            for row, col in pending:
+                rect = pygame.Rect((col - radius) * cell_size, (row - radius) * cell_size, span, span)
+                rect = rect.clip(bounds)
+                if rect.width > 0 and rect.height > 0:
+                    self.partial_redraws += 1
+                    redraw(surface, rect)
+            pending.clear()
+        return surface
@@ -0,0 +1,231 @@
+"""Partículas guardadas en arrays (posiciones, velocidades, vidas y alfa)."""
+import math
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # Sin numpy (p. ej. build web): mismas cuentas en listas
+    numpy = None
+
+# Dibuja el glifo de un tipo de partícula: (tamaño de celda, alfa) -> superficie
+GlyphBuilder = Callable[[int, int], pygame.Surface]
+Blit = Tuple[pygame.Surface, Tuple[int, int]]
+
+# Campos de cada partícula (estructura de arrays)
+FIELDS = ('x', 'y', 'vx', 'vy', 'born', 'life', 'alpha', 'kind')
+
+# Polvo en suspensión de una celda
+DUST_PARTICLES = 40
+DUST_COLOR = (255, 255, 200)
+# Barreras mágicas: un glifo de celda entera cada BARRIER_ALPHA_STEP de alfa
+BARRIER_ALPHA_STEP = 6
+
+
+def dust_glyph(size: int, alpha: int) -> pygame.Surface:
+    """Mota de polvo de size píxeles (size 1 no pinta nada: radio 0)."""
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, DUST_COLOR + (alpha,), (size // 2, size // 2), size // 2)
+    return surf
+
+
+def barrier_glyph(cell_size: int, alpha: int) -> pygame.Surface:
+    """Campo de fuerza de una barrera mágica (borde, aspa y brillo interior)."""
+    s = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+    color = (100, 200, 255, alpha)
+    pygame.draw.rect(s, color, (0, 0, cell_size, cell_size), 4)
+    pygame.draw.line(s, color, (0, 0), (cell_size, cell_size), 3)
+    pygame.draw.line(s, color, (cell_size, 0), (0, cell_size), 3)
+    s.fill((100, 200, 255, int(alpha * 0.3)), special_flags=pygame.BLEND_RGBA_ADD)
+    return s
+
+
+class ParticleSystem:
+    """Partículas con almacenamiento preasignado (estructura de arrays).
+
+    Las posiciones y velocidades van en celdas y celdas/ms, así un cambio de
+    zoom no las mueve. Cada partícula se desvanece linealmente desde su alfa
+    inicial hasta 0 al acabar su vida. Con numpy la actualización y el
+    cálculo de posiciones y alfas se hacen de golpe; sin numpy se recorren
+    listas con las mismas cuentas. Cada tipo registra un glifo que se dibuja
+    una vez por tamaño de celda y nivel de alfa (alpha_step), y todas las
+    partículas se componen con un único Surface.blits.
+    """
+
+    def __init__(self, capacity: int, budget_bytes: int) -> None:
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.vectorized: bool = numpy is not None
+        if self.vectorized:
+            self.data = {name: numpy.zeros(capacity, dtype=numpy.float64) for name in FIELDS}
+        else:
+            self.data = {name: [0.0] * capacity for name in FIELDS}
+        self.glyphs: TextureCache = TextureCache(budget_bytes)
+        self._kinds: List[Tuple[str, GlyphBuilder, int]] = []
+        self._kind_ids: Dict[str, int] = {}
+        self._last_update: Optional[int] = None
+        # Polvo por celda: (semilla, tamaño de celda) -> arrays de partida (ver dust_blits)
+        self._dust: Dict[Tuple[int, int], tuple] = {}
+        self.register('dust', dust_glyph)
+        self.register('barrier', barrier_glyph, alpha_step=BARRIER_ALPHA_STEP)
+
+    def register(self, name: str, builder: GlyphBuilder, alpha_step: int = 1) -> int:
+        """Registra un tipo de partícula; alpha_step agrupa alfas en un mismo glifo."""
+        if name not in self._kind_ids:
+            self._kind_ids[name] = len(self._kinds)
+            self._kinds.append((name, builder, max(1, alpha_step)))
+        return self._kind_ids[name]
+
+    def glyph(self, kind: int, cell_size: int, alpha: int) -> pygame.Surface:
+        """Glifo de un tipo con alfa alpha (redondeado a su alpha_step)."""
+        name, builder, step = self._kinds[kind]
+        alpha = alpha // step * step
+        key = (name, cell_size, alpha)
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            glyph = builder(cell_size, alpha)
+            self.glyphs.put(key, glyph, TextureCache.surface_bytes(glyph))
+        return glyph
+
+    def spawn(self, name: str, x: float, y: float, now: int, life: int, alpha: int,
+              vx: float = 0.0, vy: float = 0.0, restart: bool = False) -> bool:
+        """Añade una partícula (False si no cabe).
+
+        Con restart, si ya hay una viva del mismo tipo en (x, y) se reinicia."""
+        kind = self._kind_ids[name]
+        data = self.data
+        if restart:
+            for i in range(self.count):
+                if data['kind'][i] == kind and data['x'][i] == x and data['y'][i] == y:
+                    data['born'][i] = now
+                    return True
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        for field, value in zip(FIELDS, (x, y, vx, vy, now, life, alpha, kind)):
+            data[field][i] = value
+        self.count += 1
+        return True
+
+    def positions(self, name: Optional[str] = None) -> List[Tuple[float, float]]:
+        """Posiciones (x, y) de las partículas vivas (de un tipo o de todos)."""
+        kind = None if name is None else self._kind_ids[name]
+        data = self.data
+        return [(data['x'][i], data['y'][i]) for i in range(self.count)
+                if kind is None or data['kind'][i] == kind]
+
+    def update(self, now: int) -> None:
+        """Avanza las partículas hasta now y descarta las que han acabado su vida."""
+        dt = 0 if self._last_update is None else now - self._last_update
+        self._last_update = now
+        n = self.count
+        if n == 0:
+            return
+        data = self.data
+        if self.vectorized:
+            data['x'][:n] += data['vx'][:n] * dt
+            data['y'][:n] += data['vy'][:n] * dt
+            alive = (now - data['born'][:n]) < data['life'][:n]
+            keep = int(alive.sum())
+            if keep < n:
+                for field in FIELDS:
+                    column = data[field]
+                    column[:keep] = column[:n][alive]
+            self.count = keep
+            return
+
+        keep = 0
+        for i in range(n):
+            if now - data['born'][i] >= data['life'][i]:
+                continue
+            for field in FIELDS:
+                data[field][keep] = data[field][i]
+            data['x'][keep] += data['vx'][keep] * dt
+            data['y'][keep] += data['vy'][keep] * dt
+            keep += 1
+        self.count = keep
+
+    def blits(self, now: int, cell_size: int, origin: Tuple[float, float],
+              view_size: int) -> List[Blit]:
+        """(glifo, posición en pantalla) de las partículas visibles.
+
+        origin es la celda (columna, fila) que ocupa la esquina de la pantalla;
+        se descartan las que caen fuera de [-1, view_size] celdas."""
+        n = self.count
+        if n == 0:
+            return []
+        data = self.data
+        ox, oy = origin
+        if self.vectorized:
+            view_x = data['x'][:n] - ox
+            view_y = data['y'][:n] - oy
+            visible = numpy.flatnonzero((view_x >= -1) & (view_x <= view_size)
+                                        & (view_y >= -1) & (view_y <= view_size))
+            progress = (now - data['born'][visible]) / data['life'][visible]
+            columns = zip((view_x[visible] * cell_size).astype(int).tolist(),
+                          (view_y[visible] * cell_size).astype(int).tolist(),
+                          (data['alpha'][visible] * (1.0 - progress)).astype(int).tolist(),
+                          data['kind'][visible].astype(int).tolist())
+            return [(self.glyph(kind, cell_size, alpha), (px, py)) for px, py, alpha, kind in columns]
+
+        blits = []
+        for i in range(n):
+            view_x = data['x'][i] - ox
+            view_y = data['y'][i] - oy
+            if not (-1 <= view_x <= view_size and -1 <= view_y <= view_size):
+                continue
+            progress = (now - data['born'][i]) / data['life'][i]
+            alpha = int(data['alpha'][i] * (1.0 - progress))
+            blits.append((self.glyph(int(data['kind'][i]), cell_size, alpha),
+                          (int(view_x * cell_size), int(view_y * cell_size))))
+        return blits
+
+    def dust(self, seed: int, cell_size: int) -> tuple:
+        """Arrays de partida del polvo de una celda (posición, velocidad, tamaño, fase).
+
+        Se sortean con la semilla de la celda en el mismo orden que siempre,
+        y se descartan las motas de tamaño 1 (su círculo no pinta nada)."""
+        key = (seed, cell_size)
+        dust = self._dust.get(key)
+        if dust is None:
+            rnd = random.Random(seed)
+            rows = []
+            for i in range(DUST_PARTICLES):
+                start_x = rnd.randint(0, cell_size)
+                start_y = rnd.randint(0, cell_size)
+                speed_y = rnd.uniform(0.01, 0.03)
+                size = rnd.randint(1, 2)
+                if size > 1:
+                    rows.append((start_x, start_y, speed_y, size, i))
+            columns = tuple(zip(*rows)) if rows else ((),) * 5
+            if self.vectorized:
+                columns = tuple(numpy.array(column, dtype=numpy.float64) for column in columns)
+            dust = columns
+            self._dust[key] = dust
+        return dust
+
+    def dust_blits(self, seed: int, x: int, y: int, cell_size: int, ticks: int,
+                   brightness_factor: float) -> List[Blit]:
+        """Motas de polvo de la celda en (x, y) flotando en el instante ticks.
+
+        X oscila suavemente; Y sube a velocidad constante y reaparece abajo;
+        el brillo pulsa despacio."""
+        start_x, start_y, speed_y, size, phase = self.dust(seed, cell_size)
+        if self.vectorized:
+            px = x + ((start_x + numpy.sin(ticks * 0.0005 + phase) * 15) % cell_size).astype(int)
+            py = y + ((start_y - (ticks * speed_y) % cell_size) % cell_size).astype(int)
+            pulse = (numpy.sin(ticks * 0.003 + phase) + 1) * 0.5
+            alpha = ((50 + 100 * pulse) * brightness_factor).astype(int)
+            columns = zip(px.tolist(), py.tolist(), size.astype(int).tolist(), alpha.tolist())
+        else:
+            columns = ((x + int((sx + math.sin(ticks * 0.0005 + i) * 15) % cell_size),
+                        y + int((sy - (ticks * v) % cell_size) % cell_size),
+                        s, int((50 + 100 * (math.sin(ticks * 0.003 + i) + 1) * 0.5) * brightness_factor))
+                       for sx, sy, v, s, i in zip(start_x, start_y, speed_y, size, phase))
+        kind = self._kind_ids['dust']
+        # El "tamaño de celda" del glifo de polvo es el tamaño de la mota
+        return [(self.glyph(kind, s, a), (px, py)) for px, py, s, a in columns if a > 0]
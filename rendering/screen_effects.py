@@ -0,0 +1,93 @@
+"""Superficies preasignadas de los efectos de pantalla (peligro, flash, oscurecido)."""
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame  # type: ignore
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # Sin numpy no hay viñeta: tinte plano
+    numpy = None
+
+Color = Tuple[int, int, int]
+
+DANGER_COLOR = (255, 0, 0)
+# Viñeta: opacidad relativa en el centro de la pantalla (1.0 en las esquinas)
+VIGNETTE_CENTER = 0.35
+
+
+class ScreenEffects:
+    """Capas de pantalla completa y de celda creadas una sola vez.
+
+    Cada efecto tiene su propia superficie (cambiar el alfa de una no afecta
+    a otra que siga en una lista de blits cacheada); solo se rellena cuando
+    cambia su color y el alfa se actualiza en el sitio con set_alpha, así que
+    un efecto no reserva memoria ni rellena nada por frame. Con vignette=True
+    (requiere numpy) el tinte de peligro es una viñeta: alfa por píxel,
+    calculada una vez, que crece hacia los bordes.
+    """
+
+    def __init__(self, width: int, height: int, vignette: bool = False) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.vignette: bool = vignette and numpy is not None
+        # nombre -> [superficie, color (o aspecto del panel) con el que está dibujada]
+        self._surfaces: Dict[Hashable, List] = {}
+        self._vignette_surface: Optional[pygame.Surface] = None
+
+    def tint(self, name: Hashable, color: Color, alpha: int,
+             size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """Superficie del efecto name rellena de color con alfa alpha (pantalla completa por defecto)."""
+        size = size or (self.width, self.height)
+        entry = self._surfaces.get(name)
+        if entry is None or entry[0].get_size() != size:
+            entry = self._surfaces[name] = [pygame.Surface(size), None]
+        surface = entry[0]
+        if entry[1] != color:
+            surface.fill(color)
+            entry[1] = color
+        surface.set_alpha(alpha)
+        return surface
+
+    def panel(self, name: Hashable, size: Tuple[int, int], color: Color, border: Color,
+              border_width: int, label: Optional[pygame.Surface] = None,
+              alpha: Optional[int] = None) -> pygame.Surface:
+        """Caja de color con borde (y label centrado) del efecto name, con alfa alpha (None = opaca).
+
+        Solo se vuelve a dibujar si cambia el tamaño, los colores o el label."""
+        look = (color, border, border_width, label)
+        entry = self._surfaces.get(name)
+        if entry is None or entry[0].get_size() != size:
+            entry = self._surfaces[name] = [pygame.Surface(size), None]
+        surface = entry[0]
+        if entry[1] != look:
+            rect = surface.get_rect()
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, border, rect, border_width)
+            if label is not None:
+                surface.blit(label, label.get_rect(center=rect.center))
+            entry[1] = look
+        surface.set_alpha(alpha)
+        return surface
+
+    def danger(self, alpha: int) -> pygame.Surface:
+        """Tinte rojo de peligro (plano o en viñeta) con alfa alpha."""
+        if not self.vignette:
+            return self.tint('danger', DANGER_COLOR, alpha)
+        if self._vignette_surface is None:
+            self._vignette_surface = self.build_vignette(self.width, self.height, DANGER_COLOR)
+        self._vignette_surface.set_alpha(alpha)
+        return self._vignette_surface
+
+    @staticmethod
+    def build_vignette(width: int, height: int, color: Color) -> pygame.Surface:
+        """Superficie de color con alfa por píxel: VIGNETTE_CENTER en el centro, 1.0 en las esquinas."""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill(color + (255,))
+        xs = numpy.linspace(-1.0, 1.0, width)[:, None]
+        ys = numpy.linspace(-1.0, 1.0, height)[None, :]
+        distance = numpy.sqrt((xs * xs + ys * ys) / 2.0)
+        alpha = VIGNETTE_CENTER + (1.0 - VIGNETTE_CENTER) * distance * distance
+        pixels = pygame.surfarray.pixels_alpha(surface)
+        pixels[:] = (alpha * 255).astype(numpy.uint8)
+        del pixels  # Libera el bloqueo de la superficie
+        return surface
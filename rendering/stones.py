@@ -0,0 +1,76 @@
+"""Atlas de piedras ya sombreadas para texturizar paredes con un solo blits."""
+import random
+from typing import List, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+# Piedras distintas por tramo de pared (cada celda elige entre ellas)
+STAMPS_PER_ATLAS = 48
+
+Range = Tuple[int, int]
+
+
+class StoneAtlas:
+    """Piedras (elipse con borde oscuro) dibujadas una vez por tamaño de tramo.
+
+    Un atlas agrupa STAMPS_PER_ATLAS piedras con las medidas, sombras y
+    bordes que antes se sorteaban piedra a piedra. Se generan con una semilla
+    fija que solo depende de las medidas, así que el mismo atlas con otro
+    brillo tiene las mismas piedras (el albedo horneado y el dibujado con el
+    brillo real coinciden tras la pasada de luz). Cada celda decide con su
+    semilla qué piedras pone y dónde, y las compone con Surface.blits.
+    LRU con presupuesto en bytes (TextureCache).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+
+    def stamps(self, width_range: Range, height_range: Range, brightness: int,
+               shade_range: Range = (-40, 60), border_chance: float = 0.9,
+               border_darken: int = 55) -> List[pygame.Surface]:
+        """Piedras de un tramo (anchos y altos en píxeles, extremos incluidos)."""
+        key = (width_range, height_range, brightness, shade_range, border_chance, border_darken)
+        stamps = self.cache.get(key)
+        if stamps is None:
+            stamps = self.build(width_range, height_range, brightness, shade_range,
+                                border_chance, border_darken)
+            self.cache.put(key, stamps, sum(TextureCache.surface_bytes(stamp) for stamp in stamps))
+        return stamps
+
+    @staticmethod
+    def build(width_range: Range, height_range: Range, brightness: int, shade_range: Range,
+              border_chance: float, border_darken: int) -> List[pygame.Surface]:
+        """Dibuja las piedras de un atlas (sin pasar por la cache)."""
+        rnd = random.Random(f"{width_range}{height_range}{shade_range}")
+        stamps = []
+        for _ in range(STAMPS_PER_ATLAS):
+            w = rnd.randint(*width_range)
+            h = rnd.randint(*height_range)
+            shade = rnd.randint(*shade_range)
+            value = max(0, min(255, brightness + shade))
+            stamp = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.ellipse(stamp, (value, value, value), stamp.get_rect())
+            # Borde más oscuro para dar volumen
+            if rnd.random() < border_chance:
+                border = max(0, value - border_darken)
+                pygame.draw.ellipse(stamp, (border, border, border), stamp.get_rect(), 1)
+            stamps.append(stamp)
+        return stamps
+
+    @staticmethod
+    def scatter(stamps: List[pygame.Surface], rnd: random.Random, count: int,
+                rect: Tuple[int, int, int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Elige count piedras al azar y su posición dentro de rect (para blits)."""
+        rx, ry, rw, rh = rect
+        roll = rnd.random
+        total = len(stamps)
+        blits = []
+        for _ in range(count):
+            stamp = stamps[int(roll() * total)]
+            w, h = stamp.get_size()
+            sx = rx + int(roll() * (max(0, rw - w) + 1))
+            sy = ry + int(roll() * (max(0, rh - h) + 1))
+            blits.append((stamp, (sx, sy)))
+        return blits
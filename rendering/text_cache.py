@@ -0,0 +1,88 @@
+"""Textos ya renderizados (subtítulos, diálogos, título y panel de debug)."""
+from typing import Dict, Optional, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+Color = Tuple[int, int, int]
+# Contorno: (color, grosor en píxeles)
+Outline = Tuple[Color, int]
+# Maquetaciones de subtítulos guardadas antes de vaciar la tabla
+LAYOUT_LIMIT = 64
+
+
+class TextCache:
+    """Superficies de texto por (fuente, tamaño, texto, color, contorno).
+
+    Los textos de la interfaz cambian como mucho cada pocos segundos, así que
+    cada uno se renderiza una vez y dibujarlo es un blit. Las fuentes se
+    crean una sola vez por (nombre, tamaño) y los subtítulos se parten en
+    líneas al encolarlos (wrap), no en cada frame. LRU con presupuesto en
+    bytes (TextureCache).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._layouts: Dict[tuple, Tuple[str, ...]] = {}
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Fuente de tamaño size (None es la fuente por defecto de pygame)."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text: str, size: int, color: Color, outline: Optional[Outline] = None,
+               name: Optional[str] = None) -> pygame.Surface:
+        """Texto renderizado (con antialias y, si se pide, contorno)."""
+        key = (name, size, text, color, outline)
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = self.font(size, name).render(text, True, color)
+            if outline is not None:
+                surface = self.outlined(self.font(size, name), text, surface, outline)
+            self.cache.put(key, surface, TextureCache.surface_bytes(surface))
+        return surface
+
+    @staticmethod
+    def outlined(font: pygame.font.Font, text: str, surface: pygame.Surface,
+                 outline: Outline) -> pygame.Surface:
+        """Texto rodeado de un contorno de outline[1] píxeles."""
+        color, width = outline
+        shape = font.render(text, True, color)
+        result = pygame.Surface((surface.get_width() + 2 * width, surface.get_height() + 2 * width),
+                                pygame.SRCALPHA)
+        for dx in range(-width, width + 1):
+            for dy in range(-width, width + 1):
+                if dx or dy:
+                    result.blit(shape, (width + dx, width + dy))
+        result.blit(surface, (width, width))
+        return result
+
+    def wrap(self, text: str, size: int, max_width: int, name: Optional[str] = None) -> Tuple[str, ...]:
+        """Parte text en líneas de como mucho max_width píxeles (por palabras)."""
+        key = (name, size, max_width, text)
+        lines = self._layouts.get(key)
+        if lines is None:
+            font = self.font(size, name)
+            result = []
+            current_line = []
+            for word in text.split(' '):
+                test_line = ' '.join(current_line + [word])
+                if font.size(test_line)[0] <= max_width:
+                    current_line.append(word)
+                else:
+                    if current_line:
+                        result.append(' '.join(current_line))
+                    current_line = [word]
+            if current_line:
+                result.append(' '.join(current_line))
+            lines = tuple(result)
+            if len(self._layouts) >= LAYOUT_LIMIT:
+                self._layouts.clear()
+            self._layouts[key] = lines
+        return lines
@@ -0,0 +1,96 @@
+"""Cache LRU de texturas horneadas con presupuesto de memoria."""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import pygame  # type: ignore
+
+
+class TextureCache:
+    """Cache LRU de superficies con contabilidad de bytes.
+
+    Cada entrada puede pertenecer a un grupo (p. ej. una celda a un zoom
+    concreto). Al guardar una variante nueva de un grupo se descartan las
+    variantes más antiguas por encima de max_variants_per_group: los brillos
+    que ya no se van a volver a ver no ocupan memoria hasta que los expulse
+    el LRU.
+    """
+
+    def __init__(self, budget_bytes: int, max_variants_per_group: int = 2) -> None:
+        self.budget_bytes: int = budget_bytes
+        self.max_variants_per_group: int = max_variants_per_group
+        # clave -> (valor, bytes, grupo); el orden es el de uso (último = más reciente)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, Optional[Hashable]]]" = OrderedDict()
+        # grupo -> claves de sus variantes, de la más antigua a la más reciente
+        self._groups: Dict[Hashable, List[Hashable]] = {}
+        self.used_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """Bytes que ocupan los píxeles de una superficie."""
+        return surface.get_pitch() * surface.get_height()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any:
+        """Devuelve el valor guardado (o None) y lo marca como usado."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int, group: Optional[Hashable] = None) -> None:
+        """Guarda un valor que ocupa nbytes, expulsando lo necesario."""
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (value, nbytes, group)
+        self.used_bytes += nbytes
+        if group is not None:
+            variants = self._groups.setdefault(group, [])
+            variants.append(key)
+            # Variantes antiguas de la misma celda (otro brillo): fuera
+            while len(variants) > self.max_variants_per_group:
+                self._remove(variants[0])
+                self.evictions += 1
+
+        # LRU: expulsar las menos usadas hasta entrar en el presupuesto
+        # (la recién guardada se conserva aunque ella sola lo supere)
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Vacía la cache (los contadores se conservan)."""
+        self._entries.clear()
+        self._groups.clear()
+        self.used_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de uso para depuración."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.used_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, nbytes, group = self._entries.pop(key)
+        self.used_bytes -= nbytes
+        if group is not None:
+            variants = self._groups[group]
+            variants.remove(key)
+            if not variants:
+                del self._groups[group]
@@ -0,0 +1,99 @@
+"""Capa estática del viewport: se desplaza con la cámara y solo redibuja lo nuevo."""
+from typing import Callable, Hashable, List, Optional, Set, Tuple
+
+import pygame  # type: ignore
+
+# Píxeles que, como mucho, dibuja una celda fuera de su rectángulo (líneas
+# gruesas, sangre, telarañas; se nota en los zooms lejanos)
+STATIC_OVERFLOW = 24
+
+
+class ViewportLayer:
+    """Superficie persistente con la parte estática del mapa visible.
+
+    La capa guarda qué píxel del mundo está en su esquina (origin). Cuando la
+    cámara se mueve se hace un scroll en el sitio y solo se piden al callback
+    las tiras que quedan al descubierto; las celdas marcadas como sucias
+    (recién visitadas, salidas nuevas) se redibujan con su entorno. Cualquier
+    cambio de la firma (zoom, época de iluminación, F4/F5) la redibuja entera.
+
+    El callback recibe un rectángulo en coordenadas de la capa y debe dejarlo
+    exactamente como quedaría dibujando la vista completa (ver ring()).
+    """
+
+    # Radio (en celdas) afectado por una celda sucia: su iluminación lateral y
+    # las salidas/cruces de las vecinas dependen de ella
+    DIRTY_RADIUS = 2
+
+    def __init__(self, size: Tuple[int, int]) -> None:
+        self.surface: pygame.Surface = pygame.Surface(size)
+        # Píxel del mundo (x, y) que ocupa la esquina superior izquierda
+        self.origin: Optional[Tuple[int, int]] = None
+        self.signature: Optional[Hashable] = None
+        self._dirty_cells: Set[Tuple[int, int]] = set()
+        self.full_redraws: int = 0
+        self.partial_redraws: int = 0
+
+    @staticmethod
+    def ring(cell_size: int) -> int:
+        """Celdas alrededor de un rectángulo cuyo dibujo puede llegar a él."""
+        return max(1, -(-STATIC_OVERFLOW // cell_size))
+
+    def invalidate(self) -> None:
+        """Fuerza a redibujar la capa completa en el próximo update."""
+        self.origin = None
+
+    def mark_dirty(self, row: int, col: int) -> None:
+        """Marca una celda (y su entorno) para redibujarla."""
+        self._dirty_cells.add((row, col))
+
+    def update(self, origin: Tuple[int, int], signature: Hashable, cell_size: int,
+               redraw: Callable[[pygame.Rect], None]) -> Optional[List[pygame.Rect]]:
+        """Pone la capa al día para la posición de cámara origin.
+
+        Devuelve los rectángulos redibujados sin mover la cámara, o None si
+        ha cambiado la capa entera (redibujado completo o scroll)."""
+        width, height = self.surface.get_size()
+        full = self.origin is None or signature != self.signature
+        if not full:
+            dx = self.origin[0] - origin[0]
+            dy = self.origin[1] - origin[1]
+            full = abs(dx) >= width or abs(dy) >= height
+
+        self.origin = origin
+        self.signature = signature
+        if full:
+            self._dirty_cells.clear()
+            self.full_redraws += 1
+            redraw(self.surface.get_rect())
+            return None
+
+        rects: List[pygame.Rect] = []
+        if dx or dy:
+            self.surface.scroll(dx, dy)
+            if dx > 0:
+                rects.append(pygame.Rect(0, 0, dx, height))
+            elif dx < 0:
+                rects.append(pygame.Rect(width + dx, 0, -dx, height))
+            if dy > 0:
+                rects.append(pygame.Rect(0, 0, width, dy))
+            elif dy < 0:
+                rects.append(pygame.Rect(0, height + dy, width, -dy))
+
+        if self._dirty_cells:
+            # Lo que la celda dibuja por fuera también cambia
+            margin = self.DIRTY_RADIUS * cell_size + STATIC_OVERFLOW
+            span = cell_size + 2 * margin
+            bounds = self.surface.get_rect()
+            for row, col in self._dirty_cells:
+                rect = pygame.Rect(col * cell_size - origin[0] - margin,
+                                   row * cell_size - origin[1] - margin, span, span)
+                rect = rect.clip(bounds)
+                if rect.width > 0 and rect.height > 0:
+                    rects.append(rect)
+            self._dirty_cells.clear()
+
+        for rect in rects:
+            self.partial_redraws += 1
+            redraw(rect)
+        return None if dx or dy else rects
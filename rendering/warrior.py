@@ -0,0 +1,192 @@
+"""Sprite procedimental del guerrero (jugador) y cache de sus fotogramas."""
+import math
+from typing import Dict, Tuple
+
+import pygame  # type: ignore
+
+from rendering.texture_cache import TextureCache
+
+# Desplazamientos enteros de piernas, brazos, escudo y espada para una fase
+# del paso (ver walk_offsets): la fase continua solo da unas pocas poses
+WalkOffsets = Tuple[int, int, int, int, int, int, int]
+# Pose completa: (desplazamientos, giro de cabeza -1/0/1, armas, poder de la espada)
+Pose = Tuple[WalkOffsets, int, bool, bool]
+# (superficie, desplazamiento de su esquina respecto al centro del guerrero)
+Stamp = Tuple[pygame.Surface, Tuple[int, int]]
+
+DEFAULT_PALETTE = {
+    "armor": (90, 90, 90),
+    "trim": (140, 140, 140),
+    "skin": (200, 170, 140),
+    "shield": (70, 70, 70),
+    "shield_trim": (140, 120, 80),
+    "sword_handle": (180, 140, 80),
+    "sword_blade": (200, 200, 200),
+}
+
+# Fotogramas de la caída al barranco (giro, encogimiento) en toda su duración
+FALL_FRAMES = 30
+
+
+def sprite_metrics(size: int) -> Tuple[int, int, int, int]:
+    """(s, radio de la cabeza, alto del cuerpo, ancho del cuerpo) para un tamaño."""
+    s = max(8, int(size))
+    return s, max(4, s // 6), max(8, s // 2), max(6, s // 3)
+
+
+def walk_offsets(phase: float, size: int) -> WalkOffsets:
+    """Desplazamientos en píxeles de cada parte para una fase del paso (-amp a amp)."""
+    s, _, body_h, _ = sprite_metrics(size)
+    leg_h = max(6, s // 6)
+    return (int(phase * leg_h * 0.5),     # pierna izquierda
+            int(-phase * leg_h * 0.5),    # pierna derecha
+            int(-phase * (body_h // 8)),  # brazos
+            int(-phase * 3),              # escudo (x)
+            int(phase * 2),               # escudo (y) y espada (x)
+            int(-phase * 2),              # empuñadura de la espada (y)
+            int(phase * 4))               # punta de la espada (y)
+
+
+def draw_warrior(surface: pygame.Surface, cx: int, cy: int, size: int, palette: Dict[str, tuple],
+                 pose: Pose) -> None:
+    """Dibuja el guerrero (formas vectoriales) centrado en (cx, cy)."""
+    offsets, head_turn, show_weapons, sword_power = pose
+    left_leg_offset, right_leg_offset, arm_offset, shield_dx, swing_x, swing_y, tip_y = offsets
+    s, head_r, body_h, body_w = sprite_metrics(size)
+
+    # Colores desde la paleta configurable
+    armor_col = palette.get("armor", DEFAULT_PALETTE["armor"])
+    trim_col = palette.get("trim", DEFAULT_PALETTE["trim"])
+    skin_col = palette.get("skin", DEFAULT_PALETTE["skin"])
+    shield_col = palette.get("shield", DEFAULT_PALETTE["shield"])
+    shield_trim = palette.get("shield_trim", DEFAULT_PALETTE["shield_trim"])
+    sword_handle_col = palette.get("sword_handle", DEFAULT_PALETTE["sword_handle"])
+    sword_blade_col = palette.get("sword_blade", DEFAULT_PALETTE["sword_blade"])
+
+    # Sombras / base
+    shadow_w = int(body_w * 1.2)
+    pygame.draw.ellipse(surface, (10, 10, 10), (cx - shadow_w//2, cy + body_h//2, shadow_w, max(4, s//6)))
+
+    # Piernas (oscilan)
+    leg_h = max(6, s // 6)
+    lx = cx - body_w//4
+    rx = cx + body_w//4
+    leg_y0 = cy + body_h//2
+    pygame.draw.line(surface, (60, 60, 60), (lx, leg_y0), (lx, leg_y0 + leg_h + left_leg_offset), 3)
+    pygame.draw.line(surface, (60, 60, 60), (rx, leg_y0), (rx, leg_y0 + leg_h + right_leg_offset), 3)
+
+    # Cuerpo (armadura)
+    body_rect = pygame.Rect(cx - body_w//2, cy - body_h//4, body_w, body_h)
+    pygame.draw.rect(surface, armor_col, body_rect)
+    pygame.draw.rect(surface, trim_col, body_rect, 2)
+
+    # Brazos/guanteletes (se mueven ligeramente)
+    arm_w = max(4, s // 10)
+    arm_y = cy - body_h//8 + arm_offset
+    pygame.draw.rect(surface, armor_col, (cx - body_w//2 - arm_w, arm_y, arm_w, body_h//3))
+    pygame.draw.rect(surface, armor_col, (cx + body_w//2, arm_y, arm_w, body_h//3))
+    pygame.draw.rect(surface, trim_col, (cx - body_w//2 - arm_w, arm_y, arm_w, body_h//3), 1)
+    pygame.draw.rect(surface, trim_col, (cx + body_w//2, arm_y, arm_w, body_h//3), 1)
+
+    # Escudo y espada solo se muestran después de la intro
+    if show_weapons:
+        # Brillo de la espada si tiene poder
+        if sword_power:
+            sword_glow_radius = max(15, s // 2)
+            sword_glow_x = cx + body_w//2 + arm_w + 2 + swing_x
+            sword_glow_y = cy - body_h//2 + swing_y
+
+            glow_surf = pygame.Surface((sword_glow_radius*2, sword_glow_radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (200, 240, 255, 100), (sword_glow_radius, sword_glow_radius), sword_glow_radius)
+            surface.blit(glow_surf, (sword_glow_x - sword_glow_radius, sword_glow_y - sword_glow_radius))
+
+        # Escudo (izquierda) - se desplaza ligeramente con la fase
+        shield_r = max(8, s // 6)
+        shield_x = cx - body_w//2 - arm_w - shield_r//2 + shield_dx
+        shield_y = cy + swing_x
+        pygame.draw.circle(surface, shield_col, (shield_x, shield_y), shield_r)
+        pygame.draw.circle(surface, shield_trim, (shield_x, shield_y), shield_r, 2)
+
+        # Espada (derecha) - mango y hoja simple, se balancea con la fase
+        sword_h = max(12, s // 3)
+        sword_w = max(3, s // 30)
+        sword_x = cx + body_w//2 + arm_w + 2 + swing_x
+        sword_y1 = cy - body_h//8 + swing_y
+        sword_y2 = sword_y1 - sword_h + tip_y
+
+        # Espada brillante si tiene poder
+        blade_col = (220, 250, 255) if sword_power else sword_blade_col
+
+        pygame.draw.line(surface, sword_handle_col, (sword_x, sword_y1), (sword_x, sword_y1 + 6), sword_w + 2)
+        pygame.draw.line(surface, blade_col, (sword_x, sword_y1), (sword_x, sword_y2), sword_w)
+
+    # Cabeza y casco (la intro gira la cabeza media cabeza a cada lado)
+    head_x = cx
+    if head_turn < 0:
+        head_x += -head_r // 2
+    elif head_turn > 0:
+        head_x += head_r // 2
+    head_y = cy - body_h//2 + head_r
+    # Cara
+    pygame.draw.circle(surface, skin_col, (head_x, head_y), head_r)
+    # Casco
+    helmet_h = max(6, head_r + 2)
+    helmet_rect = pygame.Rect(head_x - head_r - 2, head_y - helmet_h, head_r*2 + 4, helmet_h)
+    pygame.draw.rect(surface, trim_col, helmet_rect)
+    pygame.draw.rect(surface, (160, 160, 160), helmet_rect, 1)
+    # Visor (línea)
+    pygame.draw.line(surface, (30, 30, 30), (head_x - head_r//1, head_y - 1), (head_x + head_r//1, head_y - 1), 2)
+    # Ojos
+    eye_y = head_y - 1
+    pygame.draw.circle(surface, (10, 10, 10), (head_x - head_r//2, eye_y), max(1, head_r//4))
+    pygame.draw.circle(surface, (10, 10, 10), (head_x + head_r//2, eye_y), max(1, head_r//4))
+
+
+class WarriorSprites:
+    """Fotogramas del guerrero dibujados una vez por tamaño y pose.
+
+    La fase del paso se traduce a los desplazamientos enteros que usa el
+    dibujo (walk_offsets), así que cada fotograma cacheado es idéntico al
+    dibujo en vivo: reposo, fases del paso, giros de cabeza de la intro y
+    armas sacadas o no. El guerrero tendido (game over) y los fotogramas de
+    la caída al barranco se guardan ya girados. LRU con presupuesto en bytes
+    (TextureCache).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.cache: TextureCache = TextureCache(budget_bytes)
+
+    @staticmethod
+    def palette_key(palette: Dict[str, tuple]) -> tuple:
+        return tuple(sorted(palette.items()))
+
+    def frame(self, size: int, palette: Dict[str, tuple], pose: Pose) -> Stamp:
+        """Guerrero en una pose, recortado a lo dibujado."""
+        key = ('warrior', size, self.palette_key(palette), pose)
+        stamp = self.cache.get(key)
+        if stamp is None:
+            # Margen: la sombra, el escudo y el brillo de la espada salen del cuerpo
+            pad = max(8, int(size)) + 40
+            canvas = pygame.Surface((2 * pad, 2 * pad), pygame.SRCALPHA)
+            draw_warrior(canvas, pad, pad, size, palette, pose)
+            bounds = canvas.get_bounding_rect()
+            stamp = (canvas.subsurface(bounds).copy(), (bounds.x - pad, bounds.y - pad))
+            self.cache.put(key, stamp, TextureCache.surface_bytes(stamp[0]))
+        return stamp
+
+    def rotated(self, size: int, canvas_size: int, angle: float, palette: Dict[str, tuple],
+                pose: Pose) -> pygame.Surface:
+        """Guerrero centrado en un lienzo de canvas_size (que lo recorta) y girado angle grados."""
+        key = ('rotated', size, canvas_size, angle, self.palette_key(palette), pose)
+        rotated = self.cache.get(key)
+        if rotated is None:
+            canvas = pygame.Surface((canvas_size, canvas_size), pygame.SRCALPHA)
+            draw_warrior(canvas, canvas_size // 2, canvas_size // 2, size, palette, pose)
+            rotated = pygame.transform.rotate(canvas, angle)
+            self.cache.put(key, rotated, TextureCache.surface_bytes(rotated))
+        return rotated
+
+    @staticmethod
+    def fall_frame(t: float) -> float:
+        """Progreso de la caída (0 a 1) redondeado a uno de FALL_FRAMES fotogramas."""
+        return math.floor(t * FALL_FRAMES) / FALL_FRAMES
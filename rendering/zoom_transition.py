@@ -0,0 +1,93 @@
+"""Animación continua entre niveles de zoom a partir de una captura de la vista."""
+from typing import Optional, Tuple
+
+import pygame  # type: ignore
+
+Point = Tuple[float, float]
+
+
+class ZoomTransition:
+    """Escala una captura de la vista más amplia durante duration_ms.
+
+    Al cambiar de zoom se guarda un único frame del nivel que abarca más
+    tablero (el anterior al acercarse, el nuevo al alejarse) y cada frame
+    intermedio es un recorte de esa captura escalado a pantalla: no se
+    vuelve a dibujar el mundo por cada escala. La escala se interpola en
+    progresión geométrica (velocidad de zoom constante) y el punto de
+    anclaje (el jugador) se desliza de su posición en una vista a la otra,
+    así que el último frame coincide con la vista detallada.
+    """
+
+    def __init__(self, duration_ms: int) -> None:
+        self.duration_ms: int = duration_ms
+        self.snapshot: Optional[pygame.Surface] = None
+        self.zoom_in: bool = True
+        self.ratio: float = 1.0
+        self.wide_anchor: Point = (0.0, 0.0)
+        self.close_anchor: Point = (0.0, 0.0)
+        self.start_ticks: int = 0
+        self.pending: bool = False
+
+    @property
+    def active(self) -> bool:
+        return self.pending or self.snapshot is not None
+
+    def start(self, zoom_in: bool, from_cell_size: int, to_cell_size: int, ticks: int) -> None:
+        """Empieza una transición; la captura se da con capture() (ahora o en el próximo frame)."""
+        self.zoom_in = zoom_in
+        wide, close = (from_cell_size, to_cell_size) if zoom_in else (to_cell_size, from_cell_size)
+        self.ratio = close / wide
+        self.start_ticks = ticks
+        self.snapshot = None
+        self.pending = True
+
+    def capture(self, frame: pygame.Surface, wide_anchor: Point, close_anchor: Point,
+                ticks: Optional[int] = None) -> None:
+        """Guarda la vista amplia y dónde está el anclaje en ella y en la vista detallada."""
+        if self.snapshot is None or self.snapshot.get_size() != frame.get_size():
+            self.snapshot = frame.copy()
+        else:
+            self.snapshot.blit(frame, (0, 0))
+        self.wide_anchor = wide_anchor
+        self.close_anchor = close_anchor
+        self.pending = False
+        if ticks is not None:
+            self.start_ticks = ticks
+
+    def cancel(self) -> None:
+        self.snapshot = None
+        self.pending = False
+
+    def progress(self, ticks: int) -> float:
+        """Avance de la transición (0 a 1)."""
+        if self.duration_ms <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (ticks - self.start_ticks) / self.duration_ms))
+
+    def view(self, t: float) -> Tuple[float, Point]:
+        """(escala de la captura, posición en pantalla del anclaje); t=0 vista amplia, t=1 detallada."""
+        scale = self.ratio ** t
+        (wx, wy), (cx, cy) = self.wide_anchor, self.close_anchor
+        return scale, (wx + (cx - wx) * t, wy + (cy - wy) * t)
+
+    def draw(self, target: pygame.Surface, ticks: int) -> bool:
+        """Dibuja el frame intermedio; devuelve False (y se cierra) cuando ha terminado."""
+        if self.snapshot is None:
+            return False
+        p = self.progress(ticks)
+        if p >= 1.0:
+            self.cancel()
+            return False
+        scale, (ax, ay) = self.view(p if self.zoom_in else 1.0 - p)
+        wx, wy = self.wide_anchor
+        width, height = target.get_size()
+        # Parte de la captura que cabe en pantalla a esta escala
+        source = pygame.Rect(int(wx - ax / scale), int(wy - ay / scale),
+                             int(width / scale) + 2, int(height / scale) + 2)
+        source = source.clip(self.snapshot.get_rect())
+        target.fill((0, 0, 0))
+        if source.width > 0 and source.height > 0:
+            size = (max(1, round(source.width * scale)), max(1, round(source.height * scale)))
+            scaled = pygame.transform.scale(self.snapshot.subsurface(source), size)
+            target.blit(scaled, (round(ax + (source.x - wx) * scale), round(ay + (source.y - wy) * scale)))
+        return True
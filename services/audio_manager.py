@@ -48,6 +48,9 @@ class AudioManager:
         self.subtitle_text = ""
         self.subtitle_start_time = 0
         self.subtitle_duration = 0
+        # Callback opcional (texto) al encolar un subtítulo, p. ej. para maquetarlo
+        # antes de mostrarlo; en pensamientos se llama desde el hilo principal
+        self.subtitle_listener = None
         
         # Sistema de pensamientos con threading (soporta sonido, subtítulos e imágenes)
         self.thought_active = False
@@ -211,6 +214,8 @@ class AudioManager:
             text: Texto a mostrar
             duration: Duración en ms
         """
+        if self.subtitle_listener:
+            self.subtitle_listener(text)
         self.showing_subtitles = True
         self.subtitle_text = text
         self.subtitle_start_time = pygame.time.get_ticks()
@@ -461,6 +466,9 @@ class AudioManager:
                 if duration <= 0:
                     print("[ERROR] Los subtítulos requieren duración > 0")
                     return
+            if self.subtitle_listener:
+                for text, duration in subtitles:
+                    self.subtitle_listener(text)
         
         with self._thought_lock:
             self.thought_active = True
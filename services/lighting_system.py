@@ -1,4 +1,5 @@
 """Sistema de iluminación para el dungeon."""
+from typing import Optional, Tuple
 from models.cell import CellType
 from config import (
     BASE_BRIGHTNESS_ENTRANCE,
@@ -7,7 +8,9 @@ from config import (
     BASE_BRIGHTNESS_LINES_EXIT,
     MAX_TORCH_BRIGHTNESS,
     TORCH_BRIGHTNESS_PER_UNIT,
-    BLOOD_DARKENING_FACTOR
+    BLOOD_DARKENING_FACTOR,
+    ALBEDO_FLOOR_BRIGHTNESS,
+    ALBEDO_WALL_BRIGHTNESS
 )
 
 
@@ -16,6 +19,24 @@ class LightingSystem:
     
     def __init__(self) -> None:
         self.lines_darkening_enabled: bool = False
+        # Época de iluminación: contador que se incrementa cada vez que cambia
+        # algún modificador dinámico (antorchas encendidas/apagadas, espada).
+        # Las cachés que dependen de la luz comparan la época en vez de
+        # recalcular el brillo de cada celda.
+        self.epoch: int = 0
+        self.torches_lit: bool = True
+        self.sword_light_position: Optional[Tuple[int, int]] = None
+    
+    def update_epoch(self, torches_lit: bool, sword_light_position: Optional[Tuple[int, int]]) -> int:
+        """Actualiza los modificadores dinámicos y devuelve la época vigente.
+        
+        La época solo avanza si algo cambió respecto a la llamada anterior.
+        """
+        if torches_lit != self.torches_lit or sword_light_position != self.sword_light_position:
+            self.torches_lit = torches_lit
+            self.sword_light_position = sword_light_position
+            self.epoch += 1
+        return self.epoch
     
     def calculate_brightness(self, base_brightness: int, torch_count: int) -> int:
         """Calcula el brillo total combinando base y antorchas."""
@@ -69,6 +90,18 @@ class LightingSystem:
         """Aplica el oscurecimiento del 50% a la sangre."""
         return 1.0 - BLOOD_DARKENING_FACTOR * (1.0 - brightness_factor)
     
+    def floor_light_offset(self, floor_brightness: int) -> int:
+        """Cantidad a sumar al albedo del suelo para obtener su brillo real."""
+        return floor_brightness - ALBEDO_FLOOR_BRIGHTNESS
+    
+    def wall_light_offset(self, wall_brightness: int) -> int:
+        """Cantidad a restar (saturando en 0) al albedo de las piedras.
+        
+        Equivale a haberlas dibujado con base wall_brightness, incluidos los
+        bordes oscuros que se recortan a negro en las paredes poco iluminadas.
+        """
+        return ALBEDO_WALL_BRIGHTNESS - wall_brightness
+    
     def toggle_lines_darkening(self) -> bool:
         """Toggle del oscurecimiento de líneas."""
         self.lines_darkening_enabled = not self.lines_darkening_enabled
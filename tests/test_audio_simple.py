@@ -107,3 +107,13 @@ class TestAudioManagerBasics:
         manager = AudioManager()
         assert hasattr(manager, 'update')
         assert callable(manager.update)
+    
+    @patch('pygame.mixer.Channel')
+    @patch('pygame.mixer.Sound')
+    def test_subtitle_listener_called_when_queued(self, mock_sound, mock_channel):
+        """Verificar que el callback de subtítulos recibe el texto al encolarlo."""
+        manager = AudioManager()
+        queued = []
+        manager.subtitle_listener = queued.append
+        manager.show_subtitle("Hola", 1000)
+        assert queued == ["Hola"]
@@ -0,0 +1,170 @@
+"""Tests simplificados para rendering/cell_tiles.py"""
+import pytest
+import pygame
+from unittest.mock import Mock
+from rendering.cell_tiles import CellTileCache
+from rendering.effects import EffectsRenderer
+from rendering.texture_cache import TextureCache
+from services.lighting_system import LightingSystem
+from models.cell import Cell, CellType, Direction
+
+
+def make_tiles(cell_size=40):
+    effects = EffectsRenderer(Mock(), cell_size)
+    return CellTileCache(effects, LightingSystem(), TextureCache(10 * 1024 * 1024))
+
+
+def draw_directly(effects, row, col, cell, floor_brightness, wall_brightness):
+    """Dibujado con el brillo real, sin pasada de luz."""
+    size = effects.cell_size
+    inset = int(size * 0.15)
+    color = (floor_brightness,) * 3
+    surface = pygame.Surface((size, size), 0, 32)
+    effects.draw_rough_floor(0, 0, size, size, color, row, col, target_surface=surface)
+    effects.draw_stone_in_walls(row, col, 0, 0, cell, 1.0, None, target_surface=surface,
+                                wall_brightness_override=wall_brightness)
+    effects.draw_rough_floor(inset, inset, size - 2 * inset, size - 2 * inset, color, row, col,
+                             target_surface=surface)
+    return surface
+
+
+class TestCellTileCacheBasics:
+    """Tests básicos de las texturas con pasada de luz."""
+    
+    def test_tile_size(self):
+        """Verificar que la textura tiene el tamaño de la celda."""
+        tiles = make_tiles(40)
+        tile = tiles.get_tile(3, 4, Cell(CellType.PASILLO, {Direction.N}), 60, 20)
+        assert tile.get_size() == (40, 40)
+    
+    @pytest.mark.parametrize("floor_brightness,wall_brightness", [(10, 0), (60, 20), (150, 80)])
+    def test_relight_matches_direct_drawing(self, floor_brightness, wall_brightness):
+        """Verificar que la pasada de luz equivale a dibujar con el brillo real."""
+        tiles = make_tiles(40)
+        cell = Cell(CellType.PASILLO, {Direction.N, Direction.E})
+        tile = tiles.get_tile(3, 4, cell, floor_brightness, wall_brightness)
+        expected = draw_directly(tiles.effects, 3, 4, cell, floor_brightness, wall_brightness)
+        assert pygame.image.tobytes(tile, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_albedo_baked_once_per_cell(self):
+        """Verificar que cambiar el brillo no vuelve a hornear la celda."""
+        tiles = make_tiles(40)
+        cell = Cell(CellType.PASILLO, {Direction.S})
+        tiles.effects.draw_stone_in_walls = Mock(wraps=tiles.effects.draw_stone_in_walls)
+        tiles.get_tile(5, 5, cell, 40, 10)
+        tiles.get_tile(5, 5, cell, 80, 30)
+        tiles.get_tile(5, 5, cell, 120, 50)
+        assert tiles.effects.draw_stone_in_walls.call_count == 1
+    
+    def test_rebake_when_exits_change(self):
+        """Verificar que se vuelve a hornear si cambian las salidas."""
+        tiles = make_tiles(40)
+        first = tiles.get_albedo(5, 5, Cell(CellType.PASILLO, {Direction.S}))
+        second = tiles.get_albedo(5, 5, Cell(CellType.PASILLO, {Direction.S, Direction.N}))
+        assert first is not second
+        assert second[0] == frozenset({Direction.S, Direction.N})
+    
+    def test_barranco_cell_matches_direct_drawing(self):
+        """Verificar que el acantilado horneado equivale a dibujarlo en vivo."""
+        tiles = make_tiles(40)
+        cell = Cell(CellType.PASILLO, {Direction.S, Direction.E})
+        barranco_dirs = [Direction.N]
+        tile = tiles.get_tile(3, 4, cell, 60, 20, barranco_dirs=barranco_dirs)
+        expected = pygame.Surface((40, 40), 0, 32)
+        effects = tiles.effects
+        effects.draw_rough_floor(0, 0, 40, 40, (60, 60, 60), 3, 4, target_surface=expected)
+        effects.draw_stone_in_walls(3, 4, 0, 0, cell, 1.0, None, barranco_dirs=barranco_dirs,
+                                    target_surface=expected, wall_brightness_override=20)
+        effects.draw_rough_floor(6, 6, 28, 28, (60, 60, 60), 3, 4, target_surface=expected)
+        effects.draw_cliff_side(0, 0, Direction.N, 3, 4, target_surface=expected)
+        effects.draw_barranco_door_corners(3, 4, 0, 0, cell, barranco_dirs, target_surface=expected)
+        assert pygame.image.tobytes(tile, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_barranco_cell_baked_separately(self):
+        """Verificar que la misma celda sin barranco no reutiliza el acantilado."""
+        tiles = make_tiles(40)
+        cell = Cell(CellType.PASILLO, {Direction.S})
+        plain = tiles.get_albedo(5, 5, cell)
+        cliff = tiles.get_albedo(5, 5, cell, barranco_dirs=[Direction.N])
+        assert plain is not cliff
+
+
+class TestPalettizedTiles:
+    """Tests del formato paletizado de 8 bits."""
+    
+    def make_palettized(self, cell_size=40):
+        pytest.importorskip("numpy")
+        effects = EffectsRenderer(Mock(), cell_size)
+        return CellTileCache(effects, LightingSystem(), TextureCache(10 * 1024 * 1024), palettized=True)
+    
+    @pytest.mark.parametrize("floor_brightness,wall_brightness", [(10, 0), (60, 20), (150, 80)])
+    def test_palette_matches_rgb_relight(self, floor_brightness, wall_brightness):
+        """Verificar que la textura paletizada equivale a la pasada de luz RGB."""
+        tiles = self.make_palettized()
+        rgb_tiles = make_tiles(40)
+        cell = Cell(CellType.PASILLO, {Direction.N, Direction.O})
+        tile = tiles.get_tile(3, 4, cell, floor_brightness, wall_brightness)
+        expected = rgb_tiles.get_tile(3, 4, cell, floor_brightness, wall_brightness)
+        assert tile.get_bitsize() == 8
+        assert pygame.image.tobytes(tile, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_palette_matches_rgb_relight_salida(self):
+        """Verificar el fondo plano de la celda de salida."""
+        tiles = self.make_palettized()
+        rgb_tiles = make_tiles(40)
+        cell = Cell(CellType.SALIDA, {Direction.S})
+        tile = tiles.get_tile(7, 7, cell, 90, 40, draw_full_floor=False, background_brightness=30)
+        expected = rgb_tiles.get_tile(7, 7, cell, 90, 40, draw_full_floor=False, background_brightness=30)
+        assert pygame.image.tobytes(tile, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_barranco_cell_uses_rgb_tile(self):
+        """Verificar que las celdas junto al barranco no se paletizan."""
+        tiles = self.make_palettized()
+        tile = tiles.get_tile(3, 4, Cell(CellType.PASILLO, {Direction.S}), 60, 20,
+                              barranco_dirs=[Direction.N])
+        assert tile.get_bitsize() != 8
+    
+    def test_relight_reuses_indexed_surface(self):
+        """Verificar que cambiar el brillo solo cambia la paleta."""
+        tiles = self.make_palettized()
+        cell = Cell(CellType.PASILLO, {Direction.E})
+        first = tiles.get_tile(2, 2, cell, 40, 10)
+        second = tiles.get_tile(2, 2, cell, 120, 60)
+        assert first is second
+        assert len(tiles.cache) == 1
+        assert tiles.cache.used_bytes == TextureCache.surface_bytes(first)
+
+
+class TestMipmappedTiles:
+    """Tests de las texturas horneadas a base_size y reducidas para cada zoom."""
+    
+    def make_mip_tiles(self, cell_size):
+        effects = EffectsRenderer(Mock(), cell_size)
+        return CellTileCache(effects, LightingSystem(), TextureCache(10 * 1024 * 1024), base_size=80)
+    
+    def test_smaller_zoom_is_scaled_base_tile(self):
+        """Verificar que un zoom menor es la textura base reducida con smoothscale."""
+        tiles = self.make_mip_tiles(30)
+        cell = Cell(CellType.PASILLO, {Direction.N, Direction.E})
+        tile = tiles.get_tile(3, 4, cell, 60, 20)
+        assert tile.get_size() == (30, 30)
+        tiles.effects.cell_size = 80
+        base = tiles.get_tile(3, 4, cell, 60, 20)
+        expected = pygame.transform.smoothscale(base, (30, 30))
+        assert pygame.image.tobytes(tile, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_zoom_change_does_not_rebake(self):
+        """Verificar que cambiar de zoom no vuelve a hornear la celda."""
+        tiles = self.make_mip_tiles(80)
+        cell = Cell(CellType.PASILLO, {Direction.S})
+        tiles.effects.draw_stone_in_walls = Mock(wraps=tiles.effects.draw_stone_in_walls)
+        for size in (80, 57, 30, 57):
+            tiles.effects.cell_size = size
+            assert tiles.get_tile(5, 5, cell, 60, 20).get_size() == (size, size)
+        assert tiles.effects.draw_stone_in_walls.call_count == 1
+    
+    def test_bake_restores_cell_size(self):
+        """Verificar que hornear a base_size deja el tamaño de celda como estaba."""
+        tiles = self.make_mip_tiles(30)
+        tiles.get_tile(5, 5, Cell(CellType.PASILLO, {Direction.S}), 60, 20)
+        assert tiles.effects.cell_size == 30
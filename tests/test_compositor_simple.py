@@ -0,0 +1,132 @@
+"""Tests simplificados para rendering/compositor.py"""
+import pytest
+import pygame
+from rendering import compositor
+from rendering.compositor import Compositor, LAYER_ORDER
+
+
+class TestCompositorBasics:
+    """Tests básicos de la pila de capas."""
+    
+    def test_layers_drawn_in_order(self):
+        """Verificar que las capas se dibujan de abajo a arriba."""
+        comp = Compositor()
+        drawn = []
+        for name in reversed(LAYER_ORDER):
+            comp.set_layer(name, draw=lambda target, name=name: drawn.append(name))
+        comp.compose(pygame.Surface((10, 10)))
+        assert drawn == list(LAYER_ORDER)
+    
+    def test_compose_subset_of_layers(self):
+        """Verificar que se puede componer solo el mundo o solo las capas de pantalla."""
+        comp = Compositor()
+        drawn = []
+        for name in LAYER_ORDER:
+            comp.set_layer(name, draw=lambda target, name=name: drawn.append(name))
+        comp.compose(pygame.Surface((10, 10)), compositor.SCENE_LAYERS)
+        assert drawn == list(compositor.SCENE_LAYERS)
+        drawn.clear()
+        comp.compose(pygame.Surface((10, 10)), compositor.OVERLAY_LAYERS)
+        assert drawn == [compositor.UI, compositor.EFFECTS]
+    
+    def test_effects_above_ui(self):
+        """Verificar que game over, peligro y flash cubren también subtítulos y diálogos."""
+        assert LAYER_ORDER.index(compositor.EFFECTS) > LAYER_ORDER.index(compositor.UI)
+        comp = Compositor()
+        dialog = pygame.Surface((4, 4))
+        dialog.fill((255, 255, 255))
+        comp.set_layer(compositor.UI, build=lambda: [(dialog, (0, 0))])
+        comp.set_layer(compositor.EFFECTS, draw=lambda target: [target.fill((255, 0, 0))])
+        target = pygame.Surface((4, 4))
+        comp.compose(target)
+        assert target.get_at((1, 1))[:3] == (255, 0, 0)
+    
+    def test_unknown_layer_rejected(self):
+        """Verificar que no se aceptan capas fuera de la pila."""
+        comp = Compositor()
+        with pytest.raises(ValueError):
+            comp.set_layer("fondo", draw=lambda target: None)
+    
+    def test_cached_layer_rebuilt_only_on_key_change(self):
+        """Verificar que una capa cacheada solo se reconstruye si cambia su clave."""
+        comp = Compositor()
+        state = {"text": "hola"}
+        sprite = pygame.Surface((2, 2))
+        layer = comp.set_layer(compositor.UI, build=lambda: [(sprite, (0, 0))], key=lambda: state["text"])
+        target = pygame.Surface((10, 10))
+        comp.compose(target)
+        comp.compose(target)
+        assert layer.rebuilds == 1
+        state["text"] = "adiós"
+        comp.compose(target)
+        assert layer.rebuilds == 2
+    
+    def test_mark_dirty_forces_rebuild(self):
+        """Verificar que marcar una capa como sucia la reconstruye."""
+        comp = Compositor()
+        layer = comp.set_layer(compositor.UI, build=lambda: [], key=lambda: 1)
+        target = pygame.Surface((10, 10))
+        comp.compose(target)
+        comp.mark_dirty(compositor.UI)
+        comp.compose(target)
+        assert layer.rebuilds == 2
+    
+    def test_cached_blits_match_direct_drawing(self):
+        """Verificar que componer la lista de blits equivale a dibujarla."""
+        overlay = pygame.Surface((10, 10))
+        overlay.set_alpha(120)
+        overlay.fill((200, 0, 0))
+        box = pygame.Surface((4, 4))
+        box.fill((0, 0, 255))
+        blits = [(overlay, (0, 0)), (box, (3, 3))]
+        
+        expected = pygame.Surface((10, 10))
+        expected.fill((30, 60, 90))
+        for surface, pos in blits:
+            expected.blit(surface, pos)
+        
+        comp = Compositor()
+        comp.set_layer(compositor.UI, build=lambda: blits)
+        target = pygame.Surface((10, 10))
+        target.fill((30, 60, 90))
+        comp.compose(target)
+        assert pygame.image.tobytes(target, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_compose_reports_dirty_rects(self):
+        """Verificar que compose junta los rectángulos de todas las capas."""
+        comp = Compositor()
+        comp.set_layer(compositor.TERRAIN, draw=lambda target: [])
+        comp.set_layer(compositor.ENTITIES, draw=lambda target: [pygame.Rect(1, 1, 2, 2)])
+        assert comp.compose(pygame.Surface((10, 10))) == [pygame.Rect(1, 1, 2, 2)]
+    
+    def test_full_screen_layer_dominates(self):
+        """Verificar que una capa que cambia toda la pantalla devuelve None."""
+        comp = Compositor()
+        comp.set_layer(compositor.TERRAIN, draw=lambda target: None)
+        comp.set_layer(compositor.ENTITIES, draw=lambda target: [pygame.Rect(1, 1, 2, 2)])
+        assert comp.compose(pygame.Surface((10, 10))) is None
+    
+    def test_animated_layer_includes_previous_frame(self):
+        """Verificar que una capa animada también limpia lo del frame anterior."""
+        comp = Compositor()
+        rects = [[pygame.Rect(0, 0, 2, 2)]]
+        comp.set_layer(compositor.ENTITIES, draw=lambda target: rects[0], animated=True)
+        target = pygame.Surface((10, 10))
+        comp.compose(target)
+        rects[0] = [pygame.Rect(5, 5, 2, 2)]
+        assert comp.compose(target) == [pygame.Rect(0, 0, 2, 2), pygame.Rect(5, 5, 2, 2)]
+        rects[0] = []
+        assert comp.compose(target) == [pygame.Rect(5, 5, 2, 2)]
+        assert comp.compose(target) == []
+    
+    def test_cached_layer_reports_only_rebuilds(self):
+        """Verificar que una capa cacheada solo informa de cambios al reconstruirse."""
+        comp = Compositor()
+        state = {"pos": (0, 0)}
+        sprite = pygame.Surface((2, 2))
+        comp.set_layer(compositor.UI, build=lambda: [(sprite, state["pos"])], key=lambda: state["pos"])
+        target = pygame.Surface((10, 10))
+        comp.compose(target)
+        assert comp.compose(target) == []
+        state["pos"] = (4, 4)
+        assert comp.compose(target) == [pygame.Rect(0, 0, 2, 2), pygame.Rect(4, 4, 2, 2)]
@@ -0,0 +1,69 @@
+"""Tests simplificados para rendering/decals.py"""
+import pygame
+from rendering.decals import (DecalCache, FOOTPRINT_LIFETIME_MS, POOL_GROWTH_MS,
+                              POOL_PULSE_FRAMES)
+
+
+class TestBloodStains:
+    """Tests de los sellos de manchas de sangre."""
+    
+    def test_no_stains_far_from_exit(self):
+        """Verificar que no hay manchas lejos de la salida ni en ella."""
+        decals = DecalCache(1024 * 1024)
+        assert decals.blood_stains(0, 0, 90, 1.0, (20, 20)) is None
+        assert decals.blood_stains(20, 20, 90, 1.0, (20, 20)) is None
+    
+    def test_stamp_reused(self):
+        """Verificar que el sello de una celda se dibuja una sola vez."""
+        decals = DecalCache(1024 * 1024)
+        first = decals.blood_stains(20, 19, 90, 1.0, (20, 20))
+        assert first is not None
+        assert decals.blood_stains(20, 19, 90, 1.0, (20, 20)) is first
+    
+    def test_stamp_cropped_to_stains(self):
+        """Verificar que el sello es más pequeño que la celda y cae sobre ella."""
+        stamp, (dx, dy) = DecalCache(1024 * 1024).blood_stains(20, 19, 126, 1.0, (20, 20))
+        assert stamp.get_width() < 126 and stamp.get_height() < 126
+        assert -18 <= dx < 126 and -18 <= dy < 126
+
+
+class TestBloodPool:
+    """Tests de los fotogramas de charcos de sangre."""
+    
+    def test_nothing_before_start(self):
+        """Verificar que no hay charco antes de empezar."""
+        assert DecalCache(1024 * 1024).blood_pool(7, 90, 0, 1000) is None
+    
+    def test_pool_grows(self):
+        """Verificar que el charco crece hasta su tamaño final."""
+        decals = DecalCache(4 * 1024 * 1024)
+        small, _ = decals.blood_pool(7, 90, POOL_GROWTH_MS // 4, 0)
+        full, (dx, dy) = decals.blood_pool(7, 90, POOL_GROWTH_MS, 0)
+        assert small.get_width() < full.get_width()
+        assert dx == dy == -(full.get_width() // 2)
+    
+    def test_frames_reused(self):
+        """Verificar que el ondulado cicla entre unos pocos fotogramas."""
+        decals = DecalCache(4 * 1024 * 1024)
+        frames = {id(decals.blood_pool(7, 90, POOL_GROWTH_MS * 2, t)[0]) for t in range(0, 5000, 20)}
+        assert len(frames) <= POOL_PULSE_FRAMES
+
+
+class TestFootprints:
+    """Tests de las huellas húmedas."""
+    
+    def test_footprints_fade(self):
+        """Verificar que las huellas se desvanecen y desaparecen."""
+        decals = DecalCache(1024 * 1024)
+        surface = pygame.Surface((60, 30))
+        surface.fill((200, 200, 200))
+        footprints = [
+            {'time': 0, 'rel_x': 10, 'rel_y': 10},
+            {'time': -FOOTPRINT_LIFETIME_MS // 2, 'rel_x': 30, 'rel_y': 10},
+            {'time': -FOOTPRINT_LIFETIME_MS - 1, 'rel_x': 50, 'rel_y': 10},
+        ]
+        decals.draw_footprints(surface, 0, 0, footprints, 0)
+        fresh = surface.get_at((10, 10))[0]
+        old = surface.get_at((30, 10))[0]
+        assert fresh < old < 200
+        assert surface.get_at((50, 10))[0] == 200
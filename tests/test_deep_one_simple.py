@@ -0,0 +1,41 @@
+"""Tests simplificados para rendering/deep_one.py"""
+import pygame
+from rendering.deep_one import DeepOneSprites, draw_alert, draw_deep_one, roar_pose
+
+
+def render(draw):
+    surface = pygame.Surface((200, 200))
+    surface.fill((40, 50, 60))
+    draw(surface)
+    return pygame.image.tostring(surface, 'RGB')
+
+
+class TestDeepOneSprites:
+    """Tests de la hoja de fotogramas de los Profundos."""
+    
+    def test_body_matches_live_drawing(self):
+        """Verificar que el cuerpo cacheado es idéntico al dibujo en vivo."""
+        for walk, roar in ((0, None), (4, None), (-3, roar_pose(54, 300))):
+            sprite, (dx, dy) = DeepOneSprites(1024 * 1024).body(54, walk, roar)
+            live = render(lambda s: draw_deep_one(s, 100, 120, 54, walk, roar))
+            assert live == render(lambda s: s.blit(sprite, (100 + dx, 120 + dy)))
+    
+    def test_alert_matches_live_drawing(self):
+        """Verificar que el indicador de alerta cacheado es idéntico al dibujo en vivo."""
+        alert, (dx, dy) = DeepOneSprites(1024 * 1024).alert(54)
+        live = render(lambda s: draw_alert(s, 100, 150, 54))
+        assert live == render(lambda s: s.blit(alert, (100 + dx, 150 + dy)))
+    
+    def test_frames_reused(self):
+        """Verificar que cada pose se dibuja una sola vez."""
+        sprites = DeepOneSprites(1024 * 1024)
+        first = sprites.body(54, 2, None)
+        assert sprites.body(54, 2, None) is first
+        assert sprites.body(54, 2, roar_pose(54, 100)) is not first
+    
+    def test_dead_rotated_on_cell_canvas(self):
+        """Verificar que el monstruo muerto se guarda girado sobre un lienzo de una celda."""
+        sprites = DeepOneSprites(1024 * 1024)
+        lying = sprites.dead(40, 90, 1)
+        assert lying.get_size() == (90, 90)
+        assert sprites.dead(40, 90, 1) is lying
@@ -54,3 +54,74 @@ class TestEffectsRendererBasics:
         for size in sizes:
             renderer = EffectsRenderer(mock_screen, size)
             assert renderer.cell_size == size
+
+
+class TestFloorNoiseBaker:
+    """Tests del ruido de suelo vectorizado."""
+    
+    def test_bake_is_deterministic(self):
+        """Verificar que la misma celda produce el mismo ruido."""
+        pytest.importorskip("numpy")
+        import pygame
+        renderer = EffectsRenderer(Mock(), 90)
+        first = pygame.Surface((90, 90), 0, 32)
+        second = pygame.Surface((90, 90), 0, 32)
+        renderer.draw_rough_floor(0, 0, 90, 90, (100, 100, 100), 3, 7, target_surface=first)
+        renderer.draw_rough_floor(0, 0, 90, 90, (100, 100, 100), 3, 7, target_surface=second)
+        assert pygame.image.tobytes(first, "RGB") == pygame.image.tobytes(second, "RGB")
+    
+    def test_bake_depends_on_cell(self):
+        """Verificar que celdas distintas tienen ruido distinto."""
+        pytest.importorskip("numpy")
+        import pygame
+        renderer = EffectsRenderer(Mock(), 90)
+        first = pygame.Surface((90, 90), 0, 32)
+        second = pygame.Surface((90, 90), 0, 32)
+        renderer.draw_rough_floor(0, 0, 90, 90, (100, 100, 100), 3, 7, target_surface=first)
+        renderer.draw_rough_floor(0, 0, 90, 90, (100, 100, 100), 3, 8, target_surface=second)
+        assert pygame.image.tobytes(first, "RGB") != pygame.image.tobytes(second, "RGB")
+    
+    def test_bake_disabled_falls_back(self):
+        """Verificar que sin vectorizar se usa el camino normal."""
+        import pygame
+        renderer = EffectsRenderer(Mock(), 90)
+        renderer.vectorized_floor = False
+        surface = pygame.Surface((90, 90), 0, 32)
+        assert renderer.bake_floor_noise(surface, 0, 0, 90, 90, (100, 100, 100), 3, 7) is False
+
+
+class TestBrokenLineCache:
+    """Tests de la geometría cacheada de las líneas quebradas."""
+    
+    def test_geometry_is_reused(self):
+        """Verificar que la misma línea en otra posición reutiliza sus puntos."""
+        import pygame
+        renderer = EffectsRenderer(pygame.Surface((200, 200)), 90)
+        renderer.draw_broken_line((90, 90, 90), (10, 10), (10, 46), 3, 2, 5, 1)
+        renderer.draw_broken_line((90, 90, 90), (100, 40), (100, 76), 3, 2, 5, 1)
+        assert len(renderer._broken_line_offsets) == 1
+    
+    def test_cached_line_matches_fresh_line(self):
+        """Verificar que la línea cacheada se dibuja igual que la primera vez."""
+        import pygame
+        cached = EffectsRenderer(pygame.Surface((200, 200)), 90)
+        cached.draw_broken_line((90, 90, 90), (10, 10), (10, 46), 3, 2, 5, 1)
+        cached.screen.fill((0, 0, 0))
+        cached.draw_broken_line((90, 90, 90), (100.5, 40), (100.5, 76), 3, 2, 5, 1)
+        fresh = EffectsRenderer(pygame.Surface((200, 200)), 90)
+        fresh.draw_broken_line((90, 90, 90), (100.5, 40), (100.5, 76), 3, 2, 5, 1)
+        assert pygame.image.tobytes(cached.screen, "RGB") == pygame.image.tobytes(fresh.screen, "RGB")
+    
+    def test_lines_depend_on_cell(self):
+        """Verificar que cada celda tiene su propia línea quebrada."""
+        first = EffectsRenderer.broken_line_offsets(0, 80, 2, 5, 1)
+        second = EffectsRenderer.broken_line_offsets(0, 80, 2, 6, 1)
+        assert first != second
+    
+    def test_straight_line_accepts_gray_value(self):
+        """Verificar que la línea recta acepta un gris escalar como la quebrada."""
+        import pygame
+        renderer = EffectsRenderer(pygame.Surface((100, 100)), 90)
+        renderer.draw_straight_line(300.0, (10, 50), (90, 50), 3, 2, 5, 1)
+        assert renderer.screen.get_at((50, 50))[:3] == (255, 255, 255)
+        assert EffectsRenderer.line_color((12.7, -4, 80)) == (12, 0, 80)
@@ -0,0 +1,51 @@
+"""Tests simplificados para rendering/flipbooks.py"""
+from rendering.flipbooks import (Flipbooks, TORCH_FRAMES, RIPPLE_FRAMES, SHINE_FRAMES,
+                                 torch_flicker, torch_frame_index)
+
+
+class TestTorchFlipbook:
+    """Tests de los fotogramas de antorchas."""
+    
+    def test_flicker_range(self):
+        """Verificar que el parpadeo queda entre 0.7 y 1.0."""
+        for frame in range(TORCH_FRAMES):
+            assert 0.7 <= torch_flicker(frame) <= 1.0
+    
+    def test_frames_per_size(self):
+        """Verificar que una antorcha solo usa TORCH_FRAMES fotogramas por tamaño."""
+        flipbooks = Flipbooks(1024 * 1024)
+        frames = {id(flipbooks.torch(18, ticks, 300004)[0]) for ticks in range(0, 5000, 7)}
+        assert len(frames) == TORCH_FRAMES
+    
+    def test_seed_shifts_phase(self):
+        """Verificar que la semilla desfasa el parpadeo de cada antorcha."""
+        phases = {torch_frame_index(0, seed) for seed in range(20)}
+        assert len(phases) > 1
+    
+    def test_anchor_on_flame(self):
+        """Verificar que el desplazamiento centra la llama en la posición."""
+        torch, (dx, dy) = Flipbooks(1024 * 1024).torch(18, 0, 0)
+        assert torch.get_at((-dx, -dy))[3] == 255
+        assert torch.get_at((0, 0))[3] == 0
+
+
+class TestFountainAndStairs:
+    """Tests de la fuente y las escaleras."""
+    
+    def test_fountain_frames_reused(self):
+        """Verificar que la fuente cicla entre unos pocos fotogramas."""
+        flipbooks = Flipbooks(4 * 1024 * 1024)
+        water, shine = set(), set()
+        for ticks in range(0, 10000, 11):
+            (water_frame, _), (shine_frame, _) = flipbooks.fountain(126, 0.5, ticks)
+            water.add(id(water_frame))
+            shine.add(id(shine_frame))
+        assert len(water) == RIPPLE_FRAMES
+        assert len(shine) == SHINE_FRAMES
+    
+    def test_stairs_inside_cell(self):
+        """Verificar que la escalera cae dentro de la celda."""
+        for cell_size in (126, 90, 57, 30):
+            stairs, (dx, dy) = Flipbooks(1024 * 1024).stairs(cell_size)
+            bounds = stairs.get_bounding_rect().move(dx, dy)
+            assert bounds.right <= cell_size and bounds.bottom <= cell_size
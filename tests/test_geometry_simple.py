@@ -0,0 +1,38 @@
+"""Tests simplificados para rendering/geometry.py"""
+from models.cell import Direction
+from rendering.geometry import CellGeometry, geometry_for
+from rendering.lod import exit_mask
+
+
+class TestCellGeometry:
+    """Tests de las medidas de celda por zoom."""
+    
+    def test_geometry_computed_once_per_size(self):
+        """Verificar que cada tamaño de celda se calcula una sola vez."""
+        assert geometry_for(90) is geometry_for(90)
+        assert geometry_for(90) is not geometry_for(57)
+    
+    def test_corridor_lines_match_cell_layout(self):
+        """Verificar que las líneas del pasillo usan las mismas cuentas que el dibujo."""
+        geometry = CellGeometry(126)
+        assert geometry.corridor == (0.8*126 // 2, 1.2*126 // 2)
+        assert geometry.room == (0.15*126, 0.85*126)
+    
+    def test_inner_lines_per_exit(self):
+        """Verificar que hay dos líneas por salida y una por lado cerrado."""
+        geometry = CellGeometry(90)
+        assert len(geometry.inner_lines(False, 0)) == 4
+        assert len(geometry.inner_lines(False, exit_mask([Direction.N, Direction.S]))) == 6
+        assert len(geometry.inner_lines(True, 15)) == 8
+        ids = [line_id for _, _, line_id in geometry.inner_lines(False, 15)]
+        assert ids == [1, 2, 4, 5, 7, 8, 10, 11]
+    
+    def test_floor_connection_on_cell_edge(self):
+        """Verificar que la conexión de suelo toca el borde de su lado."""
+        geometry = CellGeometry(90)
+        rx, ry, rw, rh, vertical, _ = geometry.floor_connections[Direction.S]
+        assert vertical
+        assert ry + rh == 90
+        rx, ry, rw, rh, vertical, _ = geometry.floor_connections[Direction.O]
+        assert not vertical
+        assert rx == 0
@@ -0,0 +1,62 @@
+"""Tests simplificados para rendering/gradients.py"""
+import pygame
+from models.cell import Direction
+from rendering.gradients import GradientStripCache, gradient_ramp
+
+
+def draw_line_by_line(width, height, start, end, vertical):
+    """Degradado dibujado como antes: un rectángulo de un píxel por brillo."""
+    surface = pygame.Surface((width, height))
+    for i, b in enumerate(gradient_ramp(start, end, height if vertical else width)):
+        rect = (0, i, width, 1) if vertical else (i, 0, 1, height)
+        pygame.draw.rect(surface, (b, b, b), rect)
+    return surface
+
+
+class TestGradientRamp:
+    """Tests de los brillos del degradado."""
+    
+    def test_includes_both_ends(self):
+        """Verificar que empieza y acaba en los brillos dados."""
+        ramp = gradient_ramp(10, 100, 5)
+        assert ramp[0] == 10
+        assert ramp[-1] == 100
+    
+    def test_clamps_brightness(self):
+        """Verificar que los brillos quedan entre 0 y 255."""
+        assert gradient_ramp(-20, 300, 3) == [0, 140, 255]
+
+
+class TestGradientStripCache:
+    """Tests de las tiras de degradado cacheadas."""
+    
+    def test_matches_line_by_line(self):
+        """Verificar que la tira es igual que el degradado línea a línea."""
+        cache = GradientStripCache(1024 * 1024)
+        for width, height, vertical in [(40, 19, True), (19, 40, False), (1, 1, True)]:
+            strip = cache.get(width, height, 30, 120, vertical)
+            expected = draw_line_by_line(width, height, 30, 120, vertical)
+            assert pygame.image.tobytes(strip, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    def test_reuses_strip(self):
+        """Verificar que el mismo degradado se dibuja una sola vez."""
+        cache = GradientStripCache(1024 * 1024)
+        first = cache.get(40, 19, 30, 120, True)
+        assert cache.get(40, 19, 30, 120, True) is first
+        assert cache.get(19, 40, 30, 120, False) is not first
+
+    def test_light_spill_lit_side(self):
+        """Verificar que la luz es más fuerte en el lado por el que entra."""
+        cache = GradientStripCache(1024 * 1024)
+        for direction, lit, dark in [(Direction.N, (5, 0), (5, 29)), (Direction.S, (5, 29), (5, 0)),
+                                     (Direction.E, (29, 5), (0, 5)), (Direction.O, (0, 5), (29, 5))]:
+            tile = cache.light_spill(direction, 80, 30)
+            assert tile.get_at(lit)[:3] == (80, 80, 80)
+            assert tile.get_at(dark)[0] < 5
+    
+    def test_light_spill_reused(self):
+        """Verificar que la luz de cada dirección y brillo se dibuja una vez."""
+        cache = GradientStripCache(1024 * 1024)
+        tile = cache.light_spill(Direction.N, 80, 30)
+        assert cache.light_spill(Direction.N, 80, 30) is tile
+        assert cache.light_spill(Direction.S, 80, 30) is not tile
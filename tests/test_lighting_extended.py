@@ -127,3 +127,36 @@ class TestLightingSystemExtended:
         result = lighting.toggle_lines_darkening()
         assert result == False
         assert lighting.lines_darkening_enabled == False
+    
+    def test_update_epoch_unchanged(self):
+        """Test que la época no avanza si no cambia nada."""
+        lighting = LightingSystem()
+        epoch = lighting.update_epoch(True, None)
+        assert lighting.update_epoch(True, None) == epoch
+    
+    def test_update_epoch_torches_off(self):
+        """Test que apagar las antorchas avanza la época."""
+        lighting = LightingSystem()
+        epoch = lighting.update_epoch(True, None)
+        assert lighting.update_epoch(False, None) == epoch + 1
+        assert lighting.torches_lit is False
+    
+    def test_update_epoch_sword_light(self):
+        """Test que mover la luz de la espada avanza la época."""
+        lighting = LightingSystem()
+        first = lighting.update_epoch(True, (50, 50))
+        second = lighting.update_epoch(True, (50, 51))
+        assert second == first + 1
+        assert lighting.sword_light_position == (50, 51)
+    
+    def test_floor_light_offset(self):
+        """Test desplazamiento de luz del suelo respecto al albedo."""
+        lighting = LightingSystem()
+        assert lighting.floor_light_offset(20) == 0
+        assert lighting.floor_light_offset(100) == 80
+    
+    def test_wall_light_offset(self):
+        """Test desplazamiento de luz de las piedras respecto al albedo."""
+        lighting = LightingSystem()
+        assert lighting.wall_light_offset(95) == 0
+        assert lighting.wall_light_offset(0) == 95
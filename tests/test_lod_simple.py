@@ -0,0 +1,74 @@
+"""Tests simplificados para rendering/lod.py"""
+import pytest
+import pygame
+from rendering import lod
+from rendering.lod import FlatCellRenderer, detail_level, exit_mask, flat_cell_rects
+from models.cell import Direction
+
+
+class TestDetailLevel:
+    """Tests de la elección del nivel de detalle."""
+    
+    @pytest.mark.parametrize("cell_size,expected", [
+        (126, lod.FULL), (57, lod.FULL), (30, lod.SIMPLE), (12, lod.FLAT), (6, lod.FLAT),
+    ])
+    def test_levels_by_cell_size(self, cell_size, expected):
+        """Verificar el nivel de cada zoom (630 px / 5, 11, 21, 51, 101 celdas)."""
+        assert detail_level(cell_size) == expected
+    
+    def test_exit_mask(self):
+        """Verificar que cada salida tiene su bit."""
+        assert exit_mask([]) == 0
+        assert exit_mask([Direction.N, Direction.S]) == lod.EXIT_BITS[Direction.N] | lod.EXIT_BITS[Direction.S]
+        assert exit_mask(list(lod.EXIT_BITS)) == 15
+    
+    def test_flat_cell_rects_inside_cell(self):
+        """Verificar que el camino plano no se sale de la celda."""
+        cell = pygame.Rect(0, 0, 6, 6)
+        for mask in range(16):
+            for wide in (False, True):
+                assert all(cell.contains(rect) for rect in flat_cell_rects(6, mask, wide))
+    
+    def test_exit_stub_reaches_edge(self):
+        """Verificar que el muñón de una salida llega al borde."""
+        rects = flat_cell_rects(12, exit_mask([Direction.E]), False)
+        assert any(rect.right == 12 for rect in rects)
+        assert not any(rect.left == 0 for rect in rects)
+
+
+class TestFlatCellRenderer:
+    """Tests del dibujado de celdas planas."""
+    
+    CELLS = [
+        (1, 1, 15, True, (40, 40, 40), (90, 90, 90)),
+        (1, 2, exit_mask([Direction.O]), False, (10, 20, 30), (200, 100, 0)),
+        (3, 0, 0, False, (5, 5, 5), (5, 5, 5)),
+    ]
+    
+    def render(self, vectorized, rect=(0, 0, 48, 48), origin=(0, 0)):
+        renderer = FlatCellRenderer()
+        renderer.vectorized = vectorized and renderer.vectorized
+        surface = pygame.Surface((48, 48))
+        surface.fill((255, 0, 255))
+        renderer.draw(surface, pygame.Rect(rect), origin, 12, self.CELLS)
+        return surface
+    
+    def test_block_and_path_colors(self):
+        """Verificar el color del bloque y del camino de una celda."""
+        surface = self.render(False)
+        assert surface.get_at((12, 12))[:3] == (40, 40, 40)
+        assert surface.get_at((18, 18))[:3] == (90, 90, 90)
+        assert surface.get_at((0, 0))[:3] == (0, 0, 0)
+    
+    def test_only_rect_is_redrawn(self):
+        """Verificar que fuera del rectángulo no se toca nada."""
+        surface = self.render(False, rect=(12, 12, 12, 12))
+        assert surface.get_at((30, 30))[:3] == (255, 0, 255)
+    
+    @pytest.mark.parametrize("rect,origin", [((0, 0, 48, 48), (0, 0)), ((5, 7, 30, 20), (-9, 4))])
+    def test_vectorized_matches_fill(self, rect, origin):
+        """Verificar que el camino con surfarray da el mismo resultado que el de fill."""
+        pytest.importorskip("numpy")
+        expected = self.render(False, rect, origin)
+        result = self.render(True, rect, origin)
+        assert pygame.image.tobytes(result, "RGB") == pygame.image.tobytes(expected, "RGB")
@@ -0,0 +1,85 @@
+"""Tests simplificados para rendering/overview.py"""
+import pygame
+from config import OVERVIEW_MAX_VARIANTS
+from rendering.overview import OverviewSurface
+
+
+class RecordingRedraw:
+    """Callback de redibujado que apunta los rectángulos pedidos."""
+    
+    def __init__(self):
+        self.rects = []
+    
+    def __call__(self, surface, rect):
+        self.rects.append(pygame.Rect(rect))
+
+
+class TestOverviewSurfaceBasics:
+    """Tests básicos de la vista del tablero completo."""
+    
+    def test_first_update_redraws_board(self):
+        """Verificar que una variante nueva se dibuja entera."""
+        overview = OverviewSurface(10)
+        redraw = RecordingRedraw()
+        surface = overview.update("a", 6, redraw)
+        assert surface.get_size() == (60, 60)
+        assert redraw.rects == [pygame.Rect(0, 0, 60, 60)]
+    
+    def test_unchanged_board_redraws_nothing(self):
+        """Verificar que sin cambios no se redibuja nada."""
+        overview = OverviewSurface(10)
+        overview.update("a", 6, RecordingRedraw())
+        redraw = RecordingRedraw()
+        overview.update("a", 6, redraw)
+        assert redraw.rects == []
+    
+    def test_dirty_cell_redraws_neighbours(self):
+        """Verificar que una celda sucia redibuja su entorno recortado al tablero."""
+        overview = OverviewSurface(10)
+        overview.update("a", 6, RecordingRedraw())
+        overview.mark_dirty(0, 4)
+        redraw = RecordingRedraw()
+        overview.update("a", 6, redraw)
+        assert redraw.rects == [pygame.Rect(18, 0, 18, 12)]
+    
+    def test_dirty_cell_reaches_every_variant(self):
+        """Verificar que las variantes guardadas también se ponen al día."""
+        overview = OverviewSurface(10)
+        overview.update("lit", 6, RecordingRedraw())
+        overview.update("dark", 6, RecordingRedraw())
+        overview.mark_dirty(5, 5)
+        redraw = RecordingRedraw()
+        overview.update("lit", 6, redraw)
+        assert len(redraw.rects) == 1
+    
+    def test_keeps_last_variants(self):
+        """Verificar que solo se conservan las últimas max_variants."""
+        overview = OverviewSurface(10, max_variants=2)
+        for signature in ("a", "b", "c"):
+            overview.update(signature, 6, RecordingRedraw())
+        assert len(overview) == 2
+        redraw = RecordingRedraw()
+        overview.update("a", 6, redraw)
+        assert redraw.rects == [pygame.Rect(0, 0, 60, 60)]
+    
+    def test_invalidate_drops_variants(self):
+        """Verificar que invalidar obliga a redibujar todo."""
+        overview = OverviewSurface(10)
+        overview.update("a", 6, RecordingRedraw())
+        overview.invalidate()
+        redraw = RecordingRedraw()
+        overview.update("a", 6, redraw)
+        assert overview.full_redraws == 2
+    
+    def test_game_keeps_lit_and_unlit_at_flat_zooms(self):
+        """Verificar que con la configuración del juego la luz encendida y apagada
+        de los dos zooms planos se guardan a la vez (el parpadeo no redibuja)."""
+        overview = OverviewSurface(10, OVERVIEW_MAX_VARIANTS)
+        signatures = [(cell_size, lit) for cell_size in (12, 6) for lit in (True, False)]
+        for signature in signatures:
+            overview.update(signature, signature[0], RecordingRedraw())
+        redraw = RecordingRedraw()
+        for signature in signatures:
+            overview.update(signature, signature[0], redraw)
+        assert redraw.rects == []
+        assert overview.full_redraws == len(signatures)
@@ -0,0 +1,82 @@
+"""Tests simplificados para rendering/particles.py"""
+import pygame
+from rendering.particles import ParticleSystem
+
+
+def make_system(vectorized=True):
+    """Sistema pequeño; sin vectorizar usa listas como sin numpy."""
+    system = ParticleSystem(8, 1024 * 1024)
+    if not vectorized:
+        system.vectorized = False
+        system.data = {name: list(column) for name, column in system.data.items()}
+    return system
+
+
+class TestParticleSystem:
+    """Tests del almacenamiento y la actualización de partículas."""
+    
+    def test_spawn_until_full(self):
+        """Verificar que no se añaden partículas por encima de la capacidad."""
+        system = make_system()
+        for i in range(8):
+            assert system.spawn('barrier', i, 0, 0, life=800, alpha=180)
+        assert not system.spawn('barrier', 9, 0, 0, life=800, alpha=180)
+        assert system.count == 8
+    
+    def test_restart_existing(self):
+        """Verificar que una barrera repetida en la misma celda se reinicia."""
+        system = make_system()
+        system.spawn('barrier', 3, 4, 0, life=800, alpha=180, restart=True)
+        system.spawn('barrier', 3, 4, 500, life=800, alpha=180, restart=True)
+        assert system.count == 1
+        system.update(1000)
+        assert system.positions('barrier') == [(3, 4)]
+    
+    def test_update_moves_and_expires(self):
+        """Verificar que las partículas avanzan y desaparecen al acabar su vida (con y sin numpy)."""
+        for vectorized in (True, False):
+            system = make_system(vectorized)
+            system.update(0)
+            system.spawn('barrier', 0, 0, 0, life=100, alpha=180)
+            system.spawn('barrier', 1, 1, 0, life=1000, alpha=180, vx=0.01)
+            system.update(200)
+            assert system.positions() == [(3.0, 1.0)]
+    
+    def test_blits_fade_and_cull(self):
+        """Verificar el desvanecimiento y que se descartan las partículas fuera de vista."""
+        for vectorized in (True, False):
+            system = make_system(vectorized)
+            system.spawn('barrier', 2, 3, 0, life=800, alpha=180)
+            system.spawn('barrier', 40, 3, 0, life=800, alpha=180)
+            blits = system.blits(400, 30, (1.5, 0.0), 7)
+            assert len(blits) == 1
+            glyph, position = blits[0]
+            assert position == (15, 90)
+            assert glyph.get_size() == (30, 30)
+            assert glyph.get_at((0, 0))[3] < 180
+    
+    def test_glyphs_reused(self):
+        """Verificar que el glifo de cada alfa se dibuja una sola vez."""
+        system = make_system()
+        system.spawn('barrier', 0, 0, 0, life=800, alpha=180)
+        first = system.blits(100, 30, (0, 0), 7)[0][0]
+        assert system.blits(101, 30, (0, 0), 7)[0][0] is first
+
+
+class TestDust:
+    """Tests del polvo en suspensión."""
+    
+    def test_same_dust_with_and_without_numpy(self):
+        """Verificar que el polvo sale igual con arrays y con listas."""
+        for ticks in (0, 1234, 98765):
+            vectorized = make_system(True).dust_blits(1200007, 10, 20, 126, ticks, 0.5)
+            plain = make_system(False).dust_blits(1200007, 10, 20, 126, ticks, 0.5)
+            assert [position for _, position in vectorized] == [position for _, position in plain]
+            assert len(vectorized) > 0
+    
+    def test_dust_inside_cell(self):
+        """Verificar que las motas quedan dentro de la celda."""
+        for glyph, (px, py) in make_system().dust_blits(7, 100, 200, 57, 5000, 1.0):
+            assert 100 <= px < 157
+            assert 200 <= py < 257
+            assert isinstance(glyph, pygame.Surface)
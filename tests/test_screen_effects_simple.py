@@ -0,0 +1,71 @@
+"""Tests simplificados para rendering/screen_effects.py"""
+import pytest
+from rendering import screen_effects
+from rendering.screen_effects import ScreenEffects
+
+
+class TestScreenEffects:
+    """Tests de las capas preasignadas de efectos de pantalla."""
+    
+    def test_tint_reuses_surface(self):
+        """Verificar que un efecto reutiliza su superficie y solo cambia el alfa."""
+        effects = ScreenEffects(100, 80)
+        first = effects.tint('flash', (255, 255, 255), 100)
+        second = effects.tint('flash', (255, 255, 255), 40)
+        assert second is first
+        assert second.get_alpha() == 40
+        assert second.get_size() == (100, 80)
+    
+    def test_tint_refills_on_color_change(self):
+        """Verificar que cambiar el color vuelve a rellenar la superficie."""
+        effects = ScreenEffects(100, 80)
+        effects.tint('flash', (255, 255, 255), 100)
+        surface = effects.tint('flash', (255, 0, 0), 100)
+        assert surface.get_at((50, 40))[:3] == (255, 0, 0)
+    
+    def test_effects_have_own_surfaces(self):
+        """Verificar que cada efecto tiene su propia superficie."""
+        effects = ScreenEffects(100, 80)
+        dim = effects.tint('dim', (0, 0, 0), 180)
+        effects.tint('fade', (0, 0, 0), 10)
+        assert dim.get_alpha() == 180
+    
+    def test_cell_sized_tint(self):
+        """Verificar que un efecto puede tener otro tamaño que la pantalla."""
+        overlay = ScreenEffects(100, 80).tint('path', (0, 100, 255), 80, (30, 30))
+        assert overlay.get_size() == (30, 30)
+    
+    def test_danger_flat_by_default(self):
+        """Verificar que el tinte de peligro es plano sin viñeta."""
+        danger = ScreenEffects(100, 80).danger(120)
+        assert danger.get_alpha() == 120
+        assert danger.get_at((50, 40))[:3] == (255, 0, 0)
+    
+    def test_panel_reused_across_frames(self):
+        """Verificar que una caja con borde se dibuja una vez y luego solo cambia el alfa."""
+        effects = ScreenEffects(100, 80)
+        first = effects.panel('restart', (40, 20), (50, 0, 0), (150, 0, 0), 2, alpha=30)
+        second = effects.panel('restart', (40, 20), (50, 0, 0), (150, 0, 0), 2, alpha=200)
+        assert second is first
+        assert second.get_alpha() == 200
+        assert second.get_at((20, 10))[:3] == (50, 0, 0)
+        assert second.get_at((0, 0))[:3] == (150, 0, 0)
+    
+    def test_panel_label_centered_and_untouched(self):
+        """Verificar que el texto va centrado en la caja y no se le cambia el alfa."""
+        effects = ScreenEffects(100, 80)
+        label = effects.tint('label', (255, 255, 255), 255, (10, 4))
+        panel = effects.panel('restart', (40, 20), (50, 0, 0), (150, 0, 0), 2, label, alpha=90)
+        assert panel.get_at((20, 10))[:3] == (255, 255, 255)
+        assert label.get_alpha() == 255
+    
+    def test_panel_opaque_by_default(self):
+        """Verificar que sin alfa la caja es opaca (diálogos)."""
+        panel = ScreenEffects(100, 80).panel(('dialog', 40), (40, 20), (40, 40, 40), (200, 200, 200), 3)
+        assert panel.get_alpha() is None
+    
+    @pytest.mark.skipif(screen_effects.numpy is None, reason="requiere numpy")
+    def test_vignette_darker_at_edges(self):
+        """Verificar que la viñeta es más opaca en las esquinas que en el centro."""
+        danger = ScreenEffects(100, 80, vignette=True).danger(120)
+        assert danger.get_at((0, 0))[3] > danger.get_at((50, 40))[3]
@@ -0,0 +1,41 @@
+"""Tests simplificados para rendering/stones.py"""
+import random
+import pygame
+from rendering.stones import StoneAtlas, STAMPS_PER_ATLAS
+
+
+class TestStoneAtlas:
+    """Tests del atlas de piedras presombreadas."""
+    
+    def test_stamps_within_ranges(self):
+        """Verificar que las piedras respetan los anchos y altos pedidos."""
+        stamps = StoneAtlas(1024 * 1024).stamps((4, 20), (3, 9), 95)
+        assert len(stamps) == STAMPS_PER_ATLAS
+        for stamp in stamps:
+            w, h = stamp.get_size()
+            assert 4 <= w <= 20
+            assert 3 <= h <= 9
+    
+    def test_same_stones_for_every_brightness(self):
+        """Verificar que otro brillo da las mismas piedras (para la pasada de luz)."""
+        atlas = StoneAtlas(1024 * 1024)
+        dark = atlas.stamps((4, 20), (3, 9), 100)
+        lit = atlas.stamps((4, 20), (3, 9), 155)
+        for dark_stamp, lit_stamp in zip(dark, lit):
+            assert dark_stamp.get_size() == lit_stamp.get_size()
+            center = (dark_stamp.get_width() // 2, dark_stamp.get_height() // 2)
+            assert lit_stamp.get_at(center)[0] == dark_stamp.get_at(center)[0] + 55
+    
+    def test_stamps_reused(self):
+        """Verificar que el atlas se dibuja una sola vez."""
+        atlas = StoneAtlas(1024 * 1024)
+        assert atlas.stamps((4, 20), (3, 9), 95) is atlas.stamps((4, 20), (3, 9), 95)
+    
+    def test_scatter_inside_rect(self):
+        """Verificar que las piedras quedan dentro del tramo de pared."""
+        stamps = StoneAtlas(1024 * 1024).stamps((2, 10), (2, 6), 95)
+        rect = pygame.Rect(30, 40, 35, 12)
+        blits = StoneAtlas.scatter(stamps, random.Random(7), 50, tuple(rect))
+        assert len(blits) == 50
+        for stamp, position in blits:
+            assert rect.contains(pygame.Rect(position, stamp.get_size()))
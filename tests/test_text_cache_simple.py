@@ -0,0 +1,46 @@
+"""Tests simplificados para rendering/text_cache.py"""
+import pygame
+from rendering.text_cache import TextCache
+
+pygame.font.init()
+
+
+class TestTextCache:
+    """Tests de la cache de textos renderizados."""
+    
+    def test_render_matches_font(self):
+        """Verificar que el texto cacheado es idéntico al renderizado directo."""
+        cached = TextCache(1024 * 1024).render("GAME OVER", 64, (200, 0, 0))
+        direct = pygame.font.Font(None, 64).render("GAME OVER", True, (200, 0, 0))
+        assert cached.get_size() == direct.get_size()
+        assert pygame.image.tostring(cached, 'RGBA') == pygame.image.tostring(direct, 'RGBA')
+    
+    def test_render_reused(self):
+        """Verificar que cada texto se renderiza una sola vez."""
+        cache = TextCache(1024 * 1024)
+        first = cache.render("Hola", 32, (255, 255, 255))
+        assert cache.render("Hola", 32, (255, 255, 255)) is first
+        assert cache.render("Hola", 32, (200, 200, 200)) is not first
+    
+    def test_font_created_once(self):
+        """Verificar que las fuentes se crean una vez por tamaño."""
+        cache = TextCache(1024 * 1024)
+        assert cache.font(36) is cache.font(36)
+    
+    def test_outline_grows_surface(self):
+        """Verificar que el contorno añade su grosor a cada lado."""
+        cache = TextCache(1024 * 1024)
+        plain = cache.render("Hola", 32, (255, 255, 255))
+        outlined = cache.render("Hola", 32, (255, 255, 255), outline=((0, 0, 0), 2))
+        assert outlined.get_width() == plain.get_width() + 4
+        assert outlined.get_height() == plain.get_height() + 4
+    
+    def test_wrap_fits_width(self):
+        """Verificar que las líneas caben en el ancho y conservan las palabras."""
+        cache = TextCache(1024 * 1024)
+        text = "Ph'nglui mglw'nafh Cthulhu R'lyeh wgah'nagl fhtagn " * 3
+        lines = cache.wrap(text, 32, 200)
+        assert len(lines) > 1
+        assert all(cache.font(32).size(line)[0] <= 200 for line in lines if ' ' in line)
+        assert ' '.join(lines).split() == text.split()
+        assert cache.wrap(text, 32, 200) is lines
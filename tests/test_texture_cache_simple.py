@@ -0,0 +1,103 @@
+"""Tests simplificados para rendering/texture_cache.py"""
+import pytest
+import pygame
+from config import (FIXED_WINDOW_SIZE, LOD_FLAT_MAX_CELL_SIZE, TEXTURE_CACHE_BUDGET_BYTES,
+                    TEXTURE_CACHE_MAX_VARIANTS, ZOOM_LEVELS)
+from rendering.texture_cache import TextureCache
+
+
+class TestTextureCacheBasics:
+    """Tests básicos de la cache LRU de texturas."""
+    
+    def test_initialization(self):
+        """Verificar inicialización básica."""
+        cache = TextureCache(1000)
+        assert len(cache) == 0
+        assert cache.used_bytes == 0
+    
+    def test_get_missing_counts_miss(self):
+        """Verificar que una clave inexistente cuenta como fallo."""
+        cache = TextureCache(1000)
+        assert cache.get("a") is None
+        assert cache.misses == 1
+    
+    def test_put_and_get_counts_hit(self):
+        """Verificar que una clave guardada cuenta como acierto."""
+        cache = TextureCache(1000)
+        cache.put("a", "valor", 100)
+        assert cache.get("a") == "valor"
+        assert cache.hits == 1
+        assert cache.used_bytes == 100
+    
+    def test_evicts_least_recently_used(self):
+        """Verificar que se expulsa la entrada menos usada al superar el presupuesto."""
+        cache = TextureCache(250)
+        cache.put("a", 1, 100)
+        cache.put("b", 2, 100)
+        cache.get("a")
+        cache.put("c", 3, 100)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+        assert cache.used_bytes == 200
+    
+    def test_evicts_old_variants_of_group(self):
+        """Verificar que solo se conservan las últimas variantes de un grupo."""
+        cache = TextureCache(10000, max_variants_per_group=2)
+        cache.put(("celda", 10), 1, 100, group="celda")
+        cache.put(("celda", 20), 2, 100, group="celda")
+        cache.put(("celda", 30), 3, 100, group="celda")
+        assert ("celda", 10) not in cache
+        assert ("celda", 20) in cache
+        assert ("celda", 30) in cache
+        assert cache.used_bytes == 200
+    
+    def test_replace_same_key(self):
+        """Verificar que reemplazar una clave no duplica los bytes."""
+        cache = TextureCache(1000)
+        cache.put("a", 1, 100, group="g")
+        cache.put("a", 2, 150, group="g")
+        assert cache.get("a") == 2
+        assert cache.used_bytes == 150
+    
+    def test_clear(self):
+        """Verificar que clear vacía la cache."""
+        cache = TextureCache(1000)
+        cache.put("a", 1, 100, group="g")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.used_bytes == 0
+    
+    def test_surface_bytes(self):
+        """Verificar el cálculo de bytes de una superficie."""
+        surface = pygame.Surface((10, 4), 0, 32)
+        assert TextureCache.surface_bytes(surface) == surface.get_pitch() * 4
+
+
+class TestGameTextureCache:
+    """Tests de la cache de texturas con la configuración del juego."""
+    
+    def test_keeps_lit_and_unlit_variants(self):
+        """Verificar que una celda conserva sus texturas con antorchas encendidas y apagadas."""
+        cache = TextureCache(TEXTURE_CACHE_BUDGET_BYTES, TEXTURE_CACHE_MAX_VARIANTS)
+        cache.put(("celda", "encendida"), 1, 100, group="celda")
+        cache.put(("celda", "apagada"), 2, 100, group="celda")
+        assert ("celda", "encendida") in cache
+        assert ("celda", "apagada") in cache
+    
+    def test_budget_holds_every_textured_zoom(self):
+        """Verificar que las dos variantes de todas las celdas visibles caben a cualquier zoom con texturas."""
+        for view_size in ZOOM_LEVELS:
+            cell_size = FIXED_WINDOW_SIZE // view_size
+            if cell_size <= LOD_FLAT_MAX_CELL_SIZE:
+                continue
+            cache = TextureCache(TEXTURE_CACHE_BUDGET_BYTES, TEXTURE_CACHE_MAX_VARIANTS)
+            nbytes = TextureCache.surface_bytes(pygame.Surface((cell_size, cell_size), 0, 32))
+            # La vista más un anillo de celdas alrededor (scroll)
+            cells = [(r, c) for r in range(view_size + 2) for c in range(view_size + 2)]
+            for cell in cells:
+                for variant in range(TEXTURE_CACHE_MAX_VARIANTS):
+                    cache.put((cell, variant), variant, nbytes, group=cell)
+            assert cache.evictions == 0
+            assert len(cache) == len(cells) * TEXTURE_CACHE_MAX_VARIANTS
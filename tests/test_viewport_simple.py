@@ -0,0 +1,85 @@
+"""Tests simplificados para rendering/viewport.py"""
+import pytest
+import pygame
+from rendering.viewport import ViewportLayer, STATIC_OVERFLOW
+
+
+class RecordingRedraw:
+    """Callback de redibujado que apunta los rectángulos pedidos."""
+    
+    def __init__(self):
+        self.rects = []
+    
+    def __call__(self, rect):
+        self.rects.append(pygame.Rect(rect))
+
+
+class TestViewportLayerBasics:
+    """Tests básicos de la capa estática del viewport."""
+    
+    def test_first_update_redraws_everything(self):
+        """Verificar que la primera vez se redibuja la capa completa."""
+        layer = ViewportLayer((100, 80))
+        redraw = RecordingRedraw()
+        layer.update((0, 0), "a", 20, redraw)
+        assert redraw.rects == [pygame.Rect(0, 0, 100, 80)]
+        assert layer.full_redraws == 1
+    
+    def test_still_camera_redraws_nothing(self):
+        """Verificar que con la cámara quieta no se redibuja nada."""
+        layer = ViewportLayer((100, 80))
+        layer.update((0, 0), "a", 20, RecordingRedraw())
+        redraw = RecordingRedraw()
+        layer.update((0, 0), "a", 20, redraw)
+        assert redraw.rects == []
+    
+    def test_scroll_redraws_exposed_strips(self):
+        """Verificar que al mover la cámara solo se piden las tiras nuevas."""
+        layer = ViewportLayer((100, 80))
+        layer.update((50, 50), "a", 20, RecordingRedraw())
+        redraw = RecordingRedraw()
+        layer.update((53, 48), "a", 20, redraw)
+        assert pygame.Rect(97, 0, 3, 80) in redraw.rects
+        assert pygame.Rect(0, 0, 100, 2) in redraw.rects
+        assert len(redraw.rects) == 2
+    
+    def test_scroll_moves_pixels(self):
+        """Verificar que el contenido se desplaza con la cámara."""
+        layer = ViewportLayer((100, 80))
+        layer.update((0, 0), "a", 20, lambda rect: layer.surface.fill((0, 0, 0), rect))
+        layer.surface.set_at((50, 50), (255, 0, 0))
+        layer.update((5, 0), "a", 20, lambda rect: None)
+        assert layer.surface.get_at((45, 50))[:3] == (255, 0, 0)
+    
+    def test_signature_change_redraws_everything(self):
+        """Verificar que un cambio de firma (zoom, luz) redibuja todo."""
+        layer = ViewportLayer((100, 80))
+        layer.update((0, 0), "a", 20, RecordingRedraw())
+        redraw = RecordingRedraw()
+        layer.update((1, 0), "b", 20, redraw)
+        assert redraw.rects == [pygame.Rect(0, 0, 100, 80)]
+    
+    def test_dirty_cell_redraws_surroundings(self):
+        """Verificar que una celda sucia redibuja su entorno recortado a la capa."""
+        layer = ViewportLayer((1000, 600))
+        layer.update((0, 0), "a", 100, RecordingRedraw())
+        layer.mark_dirty(1, 5)
+        redraw = RecordingRedraw()
+        layer.update((0, 0), "a", 100, redraw)
+        margin = ViewportLayer.DIRTY_RADIUS * 100 + STATIC_OVERFLOW
+        assert redraw.rects == [pygame.Rect(500 - margin, 0, 100 + 2 * margin, 200 + margin)]
+    
+    def test_update_reports_changed_rects(self):
+        """Verificar que update devuelve lo redibujado solo con la cámara quieta."""
+        layer = ViewportLayer((1000, 600))
+        assert layer.update((0, 0), "a", 100, RecordingRedraw()) is None
+        assert layer.update((0, 0), "a", 100, RecordingRedraw()) == []
+        layer.mark_dirty(1, 5)
+        redraw = RecordingRedraw()
+        assert layer.update((0, 0), "a", 100, redraw) == redraw.rects
+        assert layer.update((10, 0), "a", 100, RecordingRedraw()) is None
+    
+    @pytest.mark.parametrize("cell_size,expected", [(126, 1), (30, 1), (12, 2), (6, 4)])
+    def test_ring_covers_overflow(self, cell_size, expected):
+        """Verificar el anillo de vecinas según el tamaño de celda."""
+        assert ViewportLayer.ring(cell_size) == expected
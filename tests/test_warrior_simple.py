@@ -0,0 +1,60 @@
+"""Tests simplificados para rendering/warrior.py"""
+import pygame
+from rendering.warrior import (DEFAULT_PALETTE, FALL_FRAMES, WarriorSprites, draw_warrior,
+                               walk_offsets)
+
+
+def pose(phase=0.0, size=54, head_turn=0, weapons=True, power=False):
+    return (walk_offsets(phase, size), head_turn, weapons, power)
+
+
+class TestWalkOffsets:
+    """Tests de los desplazamientos del paso."""
+    
+    def test_idle_has_no_offsets(self):
+        """Verificar que en reposo nada se desplaza."""
+        assert walk_offsets(0.0, 54) == (0, 0, 0, 0, 0, 0, 0)
+    
+    def test_few_poses_per_cycle(self):
+        """Verificar que un ciclo del paso solo da unas pocas poses distintas."""
+        poses = {walk_offsets(i / 100.0 - 1.0, 75) for i in range(201)}
+        assert 1 < len(poses) < 40
+
+
+class TestWarriorSprites:
+    """Tests de la cache de fotogramas del guerrero."""
+    
+    def test_frame_matches_live_drawing(self):
+        """Verificar que el fotograma cacheado es idéntico al dibujo en vivo."""
+        for current in (pose(), pose(0.7, power=True), pose(-0.4, head_turn=-1, weapons=False)):
+            live = pygame.Surface((200, 200))
+            live.fill((40, 50, 60))
+            draw_warrior(live, 100, 100, 54, DEFAULT_PALETTE, current)
+            cached = pygame.Surface((200, 200))
+            cached.fill((40, 50, 60))
+            sprite, (dx, dy) = WarriorSprites(1024 * 1024).frame(54, DEFAULT_PALETTE, current)
+            cached.blit(sprite, (100 + dx, 100 + dy))
+            assert pygame.image.tostring(live, 'RGB') == pygame.image.tostring(cached, 'RGB')
+    
+    def test_frame_reused(self):
+        """Verificar que cada pose se dibuja una sola vez."""
+        sprites = WarriorSprites(1024 * 1024)
+        first = sprites.frame(54, DEFAULT_PALETTE, pose(0.5))
+        assert sprites.frame(54, dict(DEFAULT_PALETTE), pose(0.5)) is first
+    
+    def test_palette_changes_frame(self):
+        """Verificar que cambiar la paleta dibuja otro fotograma."""
+        sprites = WarriorSprites(1024 * 1024)
+        red = dict(DEFAULT_PALETTE, armor=(200, 0, 0))
+        assert sprites.frame(54, red, pose()) is not sprites.frame(54, DEFAULT_PALETTE, pose())
+    
+    def test_rotated_lying(self):
+        """Verificar que el guerrero tendido se gira 90 grados sobre su lienzo."""
+        lying = WarriorSprites(1024 * 1024).rotated(54, 90, 90, DEFAULT_PALETTE, pose())
+        assert lying.get_size() == (90, 90)
+    
+    def test_fall_frames(self):
+        """Verificar que la caída se reparte en FALL_FRAMES fotogramas."""
+        frames = {WarriorSprites.fall_frame(i / 1000.0) for i in range(1000)}
+        assert len(frames) == FALL_FRAMES
+        assert WarriorSprites.fall_frame(0.0) == 0.0
@@ -0,0 +1,96 @@
+"""Tests simplificados para rendering/zoom_transition.py"""
+import pygame
+import pytest
+from rendering.zoom_transition import ZoomTransition
+
+
+def striped(width, height):
+    """Captura con una columna de color distinto cada 10 píxeles."""
+    surface = pygame.Surface((width, height))
+    for x in range(0, width, 10):
+        surface.fill((x % 256, 100, 50), (x, 0, 10, height))
+    return surface
+
+
+class TestZoomTransition:
+    """Tests de la animación entre niveles de zoom."""
+    
+    def test_pending_until_captured(self):
+        """Verificar que al empezar espera la captura de la vista amplia."""
+        transition = ZoomTransition(200)
+        assert not transition.active
+        transition.start(False, 90, 57, 0)
+        assert transition.active and transition.pending
+        assert not transition.draw(pygame.Surface((100, 100)), 0)
+        transition.capture(striped(100, 100), (50, 50), (50, 50))
+        assert not transition.pending
+    
+    def test_ratio_from_cell_sizes(self):
+        """Verificar que la escala total es la relación de tamaños de celda en ambos sentidos."""
+        transition = ZoomTransition(200)
+        transition.start(True, 90, 126, 0)
+        assert transition.ratio == pytest.approx(126 / 90)
+        transition.start(False, 126, 90, 0)
+        assert transition.ratio == pytest.approx(126 / 90)
+    
+    def test_view_endpoints(self):
+        """Verificar que empieza en la vista amplia y acaba en la detallada."""
+        transition = ZoomTransition(200)
+        transition.start(True, 50, 100, 0)
+        transition.capture(striped(100, 100), (20, 30), (50, 50))
+        assert transition.view(0.0) == (1.0, (20, 30))
+        scale, anchor = transition.view(1.0)
+        assert scale == pytest.approx(2.0)
+        assert anchor == pytest.approx((50, 50))
+    
+    def test_first_frame_is_snapshot(self):
+        """Verificar que al acercarse el primer frame es la captura tal cual."""
+        snapshot = striped(100, 100)
+        transition = ZoomTransition(200)
+        transition.start(True, 50, 100, 0)
+        transition.capture(snapshot, (50, 50), (50, 50))
+        target = pygame.Surface((100, 100))
+        assert transition.draw(target, 0)
+        for x in (5, 45, 95):
+            assert target.get_at((x, 50)) == snapshot.get_at((x, 50))
+    
+    def test_scales_around_anchor(self):
+        """Verificar que a mitad de camino la captura está ampliada alrededor del anclaje."""
+        transition = ZoomTransition(200)
+        transition.start(True, 50, 100, 0)
+        transition.capture(striped(100, 100), (50, 50), (50, 50))
+        target = pygame.Surface((100, 100))
+        transition.draw(target, 100)
+        scale, _ = transition.view(0.5)
+        # El píxel 10 píxeles a la derecha del anclaje viene de 10/scale en la captura
+        expected = (50 + int(10 / scale)) // 10 * 10
+        assert target.get_at((60, 50))[0] == expected
+    
+    def test_snapshot_copied(self):
+        """Verificar que la captura no cambia si luego se redibuja la pantalla."""
+        screen = striped(100, 100)
+        transition = ZoomTransition(200)
+        transition.start(True, 50, 100, 0)
+        transition.capture(screen, (50, 50), (50, 50))
+        screen.fill((0, 0, 0))
+        target = pygame.Surface((100, 100))
+        transition.draw(target, 0)
+        assert target.get_at((95, 50))[0] == 90
+    
+    def test_finishes_after_duration(self):
+        """Verificar que la transición se cierra al acabar su duración."""
+        transition = ZoomTransition(200)
+        transition.start(False, 126, 90, 1000)
+        transition.capture(striped(100, 100), (50, 50), (50, 50))
+        target = pygame.Surface((100, 100))
+        assert transition.draw(target, 1150)
+        assert not transition.draw(target, 1200)
+        assert not transition.active
+    
+    def test_zero_duration_is_instant(self):
+        """Verificar que con duración 0 no se anima."""
+        transition = ZoomTransition(0)
+        transition.start(True, 50, 100, 0)
+        transition.capture(striped(100, 100), (50, 50), (50, 50))
+        assert transition.progress(0) == 1.0
+        assert not transition.draw(pygame.Surface((100, 100)), 0)